@@ -1,5 +1,63 @@
 """Ensemble orchestration (Monte Carlo, grid)."""
 
-from .driver import EnsembleRun, EnsembleSummary, run_ensemble
+from .batch import PerSampleGenerator, PerSampleRunner, SampleBatch
+from .driver import (
+    ConvergenceCriteria,
+    EnsembleCheckpoint,
+    EnsembleRun,
+    EnsembleSummary,
+    resume_ensemble,
+    run_adaptive_ensemble,
+    run_batch_ensemble,
+    run_ensemble,
+    run_generator,
+    run_unscented_ensemble,
+    sigma_points,
+)
+from .sampling import (
+    DesignSampler,
+    HaltonSampling,
+    LatinHypercubeSampling,
+    ParameterDistribution,
+    RandomSampling,
+    SamplingStrategy,
+    SobolSampling,
+)
+from .streaming import (
+    STREAMED_FIELDS,
+    P2Quantile,
+    RunningMoments,
+    RunSpill,
+    StreamingSummary,
+    load_spilled_runs,
+)
 
-__all__ = ["run_ensemble", "EnsembleRun", "EnsembleSummary"]
+__all__ = [
+    "run_ensemble",
+    "run_generator",
+    "resume_ensemble",
+    "run_adaptive_ensemble",
+    "run_batch_ensemble",
+    "SampleBatch",
+    "PerSampleGenerator",
+    "PerSampleRunner",
+    "ConvergenceCriteria",
+    "EnsembleCheckpoint",
+    "run_unscented_ensemble",
+    "sigma_points",
+    "EnsembleRun",
+    "EnsembleSummary",
+    "SamplingStrategy",
+    "ParameterDistribution",
+    "RandomSampling",
+    "LatinHypercubeSampling",
+    "SobolSampling",
+    "HaltonSampling",
+    "DesignSampler",
+    "StreamingSummary",
+    "RunningMoments",
+    "P2Quantile",
+    "RunSpill",
+    "load_spilled_runs",
+    "STREAMED_FIELDS",
+]
@@ -0,0 +1,125 @@
+"""Batch protocol for ensemble sample generators and runners.
+
+`run_batch_ensemble` asks its generator for a whole batch of samples at
+once, ``batch_generator(rng, indices) -> {name: column}``, so draws can be
+one vectorised RNG call per parameter, and hands the runner a `SampleBatch`
+of column arrays, the natural input to `run_trajectory_batch`. The runner
+returns result columns (``{name: array}``) or one result per sample.
+
+`PerSampleGenerator` and `PerSampleRunner` adapt ``(rng, index)`` generators
+and ``runner(sample)`` callables written for `run_ensemble` to this
+protocol; they draw from the same generator in the same order, so samples,
+per-run seeds and results are identical to `run_ensemble` with shared
+streams.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SampleBatch:
+    """Samples ``indices`` of an ensemble as equal-length column arrays.
+
+    ``seeds``, when a generator sets it, holds each run's recorded seed;
+    otherwise every run of the batch records the generator state at the
+    start of the batch.
+    """
+
+    indices: np.ndarray
+    columns: Mapping[str, np.ndarray]
+    seeds: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        for name, values in self.columns.items():
+            if len(values) != len(self.indices):
+                raise ValueError(f"column {name!r} has {len(values)} values for {len(self.indices)} samples")
+        if self.seeds is not None and len(self.seeds) != len(self.indices):
+            raise ValueError("seeds must match the number of samples")
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """The batch as one dict of Python scalars per sample."""
+
+        return _rows(self.columns, len(self))
+
+
+def as_sample_batch(
+    generated: Mapping[str, Any] | SampleBatch,
+    indices: np.ndarray,
+) -> SampleBatch:
+    """Normalise a batch generator's output to a `SampleBatch` for ``indices``."""
+
+    if isinstance(generated, SampleBatch):
+        if not np.array_equal(generated.indices, indices):
+            raise ValueError("batch generator returned samples for other indices")
+        return generated
+    if not isinstance(generated, Mapping):
+        raise TypeError("batch generators must return a mapping of columns or a SampleBatch")
+    return SampleBatch(indices=indices, columns={name: np.asarray(values) for name, values in generated.items()})
+
+
+def result_rows(results: Any, count: int) -> List[Any]:
+    """Split a batch runner's output into one result per sample."""
+
+    if isinstance(results, Mapping):
+        columns = {name: np.asarray(values) for name, values in results.items()}
+        for name, values in columns.items():
+            if len(values) != count:
+                raise ValueError(f"result column {name!r} has {len(values)} values for {count} samples")
+        return _rows(columns, count)
+    rows = list(results)
+    if len(rows) != count:
+        raise ValueError(f"batch runner returned {len(rows)} results for {count} samples")
+    return rows
+
+
+def _rows(columns: Mapping[str, np.ndarray], count: int) -> List[Dict[str, Any]]:
+    names = list(columns)
+    if not names:
+        return [{} for _ in range(count)]
+    return [dict(zip(names, values)) for values in zip(*(np.asarray(columns[name]).tolist() for name in names))]
+
+
+class PerSampleGenerator:
+    """Batch generator built from a per-sample ``sample_generator(rng, index)``.
+
+    Samples must be dicts with the same keys. Each sample records the
+    generator state before its draws, as `run_ensemble` does.
+    """
+
+    def __init__(self, sample_generator: Callable[[np.random.Generator, int], Any]) -> None:
+        self.sample_generator = sample_generator
+
+    def __call__(self, rng: np.random.Generator, indices: np.ndarray) -> SampleBatch:
+        seeds: List[int] = []
+        samples: List[Any] = []
+        for index in indices.tolist():
+            seeds.append(int(rng.bit_generator.state["state"]["state"]))
+            samples.append(self.sample_generator(rng, index))
+        if not all(isinstance(sample, dict) for sample in samples):
+            raise TypeError("per-sample generators must return dicts to form columns")
+        names = list(samples[0]) if samples else []
+        if any(list(sample) != names for sample in samples):
+            raise ValueError("per-sample generators must return the same keys for every sample")
+        columns = {name: np.asarray([sample[name] for sample in samples]) for name in names}
+        return SampleBatch(indices=indices, columns=columns, seeds=np.array(seeds, dtype=object))
+
+
+class PerSampleRunner:
+    """Batch runner that calls a per-sample ``runner(sample)`` on each row."""
+
+    def __init__(self, runner: Callable[[Any], Any]) -> None:
+        self.runner = runner
+
+    def __call__(self, batch: SampleBatch) -> Sequence[Any]:
+        return [self.runner(sample) for sample in batch.rows()]
@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, List, Sequence
+import pickle
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field, replace
+from itertools import islice
+from math import log, sqrt
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
 import numpy as np
+import numpy.typing as npt
+
+from .batch import SampleBatch, as_sample_batch, result_rows
+from .sampling import DesignSampler
+from .streaming import RunSpill, StreamingSummary, load_spilled_runs
 
 
 @dataclass(frozen=True)
@@ -14,6 +27,7 @@ class EnsembleRun:
     seed: int
     sample: Any
     result: Any
+    spawn_key: Tuple[int, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -34,16 +48,17 @@ class EnsembleSummary:
         }
 
 
+def _landing_point(result: Any) -> Tuple[Any, Any]:
+    if isinstance(result, dict):
+        return result.get("east_m"), result.get("north_m")
+    return getattr(result, "east_m", None), getattr(result, "north_m", None)
+
+
 def _default_summary(results: Sequence[Any]) -> EnsembleSummary:
     east: List[float] = []
     north: List[float] = []
     for result in results:
-        if isinstance(result, dict):
-            east_val = result.get("east_m")
-            north_val = result.get("north_m")
-        else:
-            east_val = getattr(result, "east_m", None)
-            north_val = getattr(result, "north_m", None)
+        east_val, north_val = _landing_point(result)
         if east_val is None or north_val is None:
             continue
         east.append(float(east_val))
@@ -63,6 +78,117 @@ def _default_summary(results: Sequence[Any]) -> EnsembleSummary:
     )
 
 
+def _streamed_summary(statistics: StreamingSummary) -> EnsembleSummary:
+    landing = statistics.landing
+    if landing.count == 0:
+        return EnsembleSummary(
+            count=statistics.count, mean_east_m=None, mean_north_m=None, std_east_m=None, std_north_m=None
+        )
+    variance = landing.covariance()
+    return EnsembleSummary(
+        count=statistics.count,
+        mean_east_m=float(landing.mean[0]),
+        mean_north_m=float(landing.mean[1]),
+        std_east_m=float(np.sqrt(variance[0, 0])),
+        std_north_m=float(np.sqrt(variance[1, 1])),
+    )
+
+
+def run_generator(seed: int, spawn_key: Sequence[int]) -> np.random.Generator:
+    """Return the independent PCG64 stream of one spawned ensemble run.
+
+    Equivalent to child ``spawn_key`` of ``SeedSequence(seed)``, so a run
+    recorded in a manifest can be reproduced on its own.
+    """
+
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=tuple(spawn_key))))
+
+
+_EnsembleChunk = Tuple[Callable[[np.random.Generator, int], Any], Callable[[Any], Any], int, range]
+
+
+def _bounded_map(
+    executor: Executor, function: Callable[[Any], Any], items: Iterable[Any], window: int
+) -> Iterator[Any]:
+    """``executor.map`` that keeps at most ``window`` items in flight.
+
+    `Executor.map` submits every item up front, which holds all chunks and
+    their results in memory at once.
+    """
+
+    pending: Deque[Future[Any]] = deque()
+    for item in items:
+        pending.append(executor.submit(function, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _run_spawned_chunk(chunk: _EnsembleChunk) -> List[Tuple[Any, Any]]:
+    sample_generator, runner, seed, indices = chunk
+    completed: List[Tuple[Any, Any]] = []
+    for index in indices:
+        sample = sample_generator(run_generator(seed, (index,)), index)
+        completed.append((sample, runner(sample)))
+    return completed
+
+
+@dataclass
+class EnsembleCheckpoint:
+    """Progress of a `run_ensemble` call, enough to resume it exactly.
+
+    Runs complete in index order, so ``completed`` is the number of finished
+    runs (indices ``0..completed-1``). ``rng_state`` is the shared
+    generator's position (``streams="shared"`` only), ``runs`` the retained
+    runs, ``statistics`` the streaming aggregator and ``spill_offset`` the
+    end of the last spilled run. ``batch_size`` is set for
+    `run_batch_ensemble` runs, which checkpoint at batch boundaries.
+
+    Retained runs are appended to ``runs_path`` as they complete, up to
+    ``runs_offset``, rather than pickled with every save; `load` reads them
+    back.
+    """
+
+    samples: int
+    seed: int
+    streams: str
+    retain_runs: bool
+    spill_path: str | None = None
+    completed: int = 0
+    rng_state: Mapping[str, Any] | None = None
+    runs: List[EnsembleRun] = field(default_factory=list)
+    statistics: StreamingSummary | None = None
+    spill_offset: int = 0
+    batch_size: int | None = None
+    runs_path: str | None = None
+    runs_offset: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.completed >= self.samples
+
+    def save(self, path: str | Path) -> None:
+        """Write the checkpoint atomically (write then rename)."""
+
+        target = Path(path)
+        partial = target.with_name(target.name + ".tmp")
+        state = replace(self, runs=[]) if self.runs_path is not None else self
+        with partial.open("wb") as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        partial.replace(target)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EnsembleCheckpoint":
+        with Path(path).open("rb") as handle:
+            checkpoint = pickle.load(handle)
+        if not isinstance(checkpoint, cls):
+            raise TypeError(f"{path} does not hold an EnsembleCheckpoint")
+        if checkpoint.runs_path is not None:
+            checkpoint.runs = list(islice(load_spilled_runs(checkpoint.runs_path), checkpoint.completed))
+        return checkpoint
+
+
 def run_ensemble(
     samples: int,
     sample_generator: Callable[[np.random.Generator, int], Any],
@@ -70,31 +196,623 @@ def run_ensemble(
     *,
     seed: int = 0,
     summary_fn: Callable[[Sequence[Any]], EnsembleSummary] | None = None,
+    streams: str = "shared",
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    retain_runs: bool = True,
+    spill_path: str | Path | None = None,
+    statistics: StreamingSummary | None = None,
+    checkpoint_path: str | Path | None = None,
+    checkpoint_every: int = 100,
+) -> dict[str, Any]:
+    """Run an ensemble with deterministic RNG (PCG64) and summarise outputs.
+
+    With ``streams="shared"`` every sample draws in turn from one generator
+    seeded with ``seed``, which ties each run to those before it. With
+    ``streams="spawned"`` run ``i`` draws from its own stream, child ``(i,)``
+    of ``SeedSequence(seed)`` (see `run_generator`); runs can then execute
+    in any order, and ``workers`` greater than one distributes chunks of
+    ``chunk_size`` runs over a process pool (``sample_generator`` and
+    ``runner`` must be picklable). Spawned results do not depend on
+    ``workers`` or ``chunk_size``. The manifest records the spawn-key scheme
+    (run ``i`` uses ``(i,)``) rather than listing every key, and chunks are
+    generated and submitted as workers free up, so memory does not grow with
+    ``samples``.
+
+    ``retain_runs=False`` streams results into a `StreamingSummary`
+    (``statistics``, created if not given) and drops each run once counted,
+    so memory does not grow with ``samples``; the summary then comes from
+    the running statistics and ``summary_fn`` is not allowed. ``spill_path``
+    additionally writes every run to disk (see `load_spilled_runs`). When
+    ``statistics`` is in use it is returned under ``"statistics"``.
+
+    A `DesignSampler` as ``sample_generator`` supplies a precomputed Latin
+    Hypercube or quasi-Monte Carlo design and is recorded in the manifest.
+
+    ``checkpoint_path`` saves an `EnsembleCheckpoint` every
+    ``checkpoint_every`` completed runs and at the end; `resume_ensemble`
+    continues an interrupted run from it. Retained runs are appended to
+    ``<checkpoint_path>.runs`` as they complete, so a save does not rewrite
+    them.
+    """
+
+    if samples <= 0:
+        raise ValueError("samples must be positive")
+    if streams not in ("shared", "spawned"):
+        raise ValueError("streams must be 'shared' or 'spawned'")
+    if not retain_runs and summary_fn is not None:
+        raise ValueError("summary_fn needs every result; use statistics with retain_runs=False")
+    if not retain_runs and statistics is None:
+        statistics = StreamingSummary()
+
+    checkpoint = EnsembleCheckpoint(
+        samples=samples,
+        seed=seed,
+        streams=streams,
+        retain_runs=retain_runs,
+        spill_path=str(spill_path) if spill_path is not None else None,
+        statistics=statistics,
+    )
+    return _execute(
+        checkpoint,
+        sample_generator,
+        runner,
+        summary_fn=summary_fn,
+        workers=workers,
+        chunk_size=chunk_size,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+    )
+
+
+def resume_ensemble(
+    checkpoint_path: str | Path,
+    sample_generator: Callable[[np.random.Generator, int], Any],
+    runner: Callable[[Any], Any],
+    *,
+    summary_fn: Callable[[Sequence[Any]], EnsembleSummary] | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    checkpoint_every: int = 100,
+) -> dict[str, Any]:
+    """Finish the `run_ensemble` call checkpointed at ``checkpoint_path``.
+
+    Completed runs are skipped and the shared generator, aggregator and
+    spill file continue from where the checkpoint left them, so the
+    manifest, runs and summary equal those of an uninterrupted run with the
+    same ``sample_generator``, ``runner`` and ``summary_fn``. Runs finished
+    after the last checkpoint are repeated.
+    """
+
+    checkpoint = EnsembleCheckpoint.load(checkpoint_path)
+    if not checkpoint.retain_runs and summary_fn is not None:
+        raise ValueError("summary_fn needs every result; use statistics with retain_runs=False")
+    return _execute(
+        checkpoint,
+        sample_generator,
+        runner,
+        summary_fn=summary_fn,
+        workers=workers,
+        chunk_size=chunk_size,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+    )
+
+
+def run_batch_ensemble(
+    samples: int,
+    batch_generator: Callable[[np.random.Generator, np.ndarray], Mapping[str, Any] | SampleBatch],
+    batch_runner: Callable[[SampleBatch], Any],
+    *,
+    batch_size: int = 1024,
+    seed: int = 0,
+    summary_fn: Callable[[Sequence[Any]], EnsembleSummary] | None = None,
+    retain_runs: bool = True,
+    spill_path: str | Path | None = None,
+    statistics: StreamingSummary | None = None,
+    checkpoint_path: str | Path | None = None,
+    checkpoint_every: int = 100,
 ) -> dict[str, Any]:
-    """Run an ensemble with deterministic RNG (PCG64) and summarise outputs."""
+    """Run an ensemble ``batch_size`` samples at a time (see `SampleBatch`).
+
+    ``batch_generator(rng, indices)`` draws the samples for an array of run
+    indices from the shared PCG64 generator seeded with ``seed`` and returns
+    them as columns; ``batch_runner(batch)`` returns result columns or one
+    result per sample. Batches are drawn in index order, so results depend
+    on ``batch_size`` only through how the generator consumes the stream;
+    the manifest records it. Runs, summaries, streaming statistics, spill
+    files and checkpoints behave as in `run_ensemble`, with checkpoints
+    written at the first batch boundary after every ``checkpoint_every``
+    runs (`resume_ensemble` accepts the batch callables).
+
+    Wrapping per-sample callables in `PerSampleGenerator` and
+    `PerSampleRunner` reproduces `run_ensemble` with shared streams.
+    """
 
     if samples <= 0:
         raise ValueError("samples must be positive")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if not retain_runs and summary_fn is not None:
+        raise ValueError("summary_fn needs every result; use statistics with retain_runs=False")
+    if not retain_runs and statistics is None:
+        statistics = StreamingSummary()
+
+    checkpoint = EnsembleCheckpoint(
+        samples=samples,
+        seed=seed,
+        streams="shared",
+        retain_runs=retain_runs,
+        spill_path=str(spill_path) if spill_path is not None else None,
+        statistics=statistics,
+        batch_size=batch_size,
+    )
+    return _execute(
+        checkpoint,
+        batch_generator,
+        batch_runner,
+        summary_fn=summary_fn,
+        workers=None,
+        chunk_size=None,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+    )
+
+
+@dataclass(frozen=True)
+class ConvergenceCriteria:
+    """When `run_adaptive_ensemble` may stop adding batches.
+
+    Each tolerance (metres) left as ``None`` is not checked:
+
+    * ``mean_tolerance_m`` bounds the standard error of the mean landing
+      point along its worst direction, ``sqrt(λ_max / n)``;
+    * ``axis_tolerance_m`` bounds the change in the ``confidence`` ellipse
+      semi-axes since the previous batch;
+    * ``quantile_tolerance_m`` bounds the change in the tracked east/north
+      quantiles (``quantiles``) since the previous batch.
+
+    The ensemble stops once every set tolerance holds after at least
+    ``min_samples`` runs, or when ``max_samples`` runs or ``max_seconds`` of
+    wall time have been spent.
+    """
+
+    mean_tolerance_m: float | None = 10.0
+    axis_tolerance_m: float | None = None
+    quantile_tolerance_m: float | None = None
+    quantiles: Tuple[float, ...] = (0.05, 0.5, 0.95)
+    confidence: float = 0.9
+    batch_size: int = 100
+    min_samples: int = 200
+    max_samples: int = 100_000
+    max_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.max_samples < 1:
+            raise ValueError("max_samples must be at least 1")
+        if not 0.0 < self.confidence < 1.0:
+            raise ValueError("confidence must be between 0 and 1")
+        for name in ("mean_tolerance_m", "axis_tolerance_m", "quantile_tolerance_m", "max_seconds"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+
+
+def _convergence_metrics(statistics: StreamingSummary, confidence: float) -> dict[str, Any]:
+    landing = statistics.landing
+    count = landing.count
+    if count < 2:
+        return {"landed": count, "mean_standard_error_m": None, "major_axis_m": None, "minor_axis_m": None}
+    eigenvalues = np.maximum(np.linalg.eigvalsh(landing.covariance(ddof=1)), 0.0)
+    scale = sqrt(-2.0 * log(1.0 - confidence))
+    return {
+        "landed": count,
+        "mean_standard_error_m": sqrt(float(eigenvalues[1]) / count),
+        "major_axis_m": scale * sqrt(float(eigenvalues[1])),
+        "minor_axis_m": scale * sqrt(float(eigenvalues[0])),
+    }
+
+
+def run_adaptive_ensemble(
+    sample_generator: Callable[[np.random.Generator, int], Any],
+    runner: Callable[[Any], Any],
+    criteria: ConvergenceCriteria | None = None,
+    *,
+    seed: int = 0,
+    streams: str = "spawned",
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    retain_runs: bool = True,
+    spill_path: str | Path | None = None,
+    statistics: StreamingSummary | None = None,
+) -> dict[str, Any]:
+    """Run an ensemble in batches until the landing statistics converge.
+
+    Batches of ``criteria.batch_size`` runs extend one ensemble exactly as a
+    longer `run_ensemble` call would (same streams, indices and seeds), and
+    after each batch the `ConvergenceCriteria` are evaluated on the
+    streaming statistics. The manifest records the final sample count and,
+    under ``"convergence"``, the criteria, the per-batch history and why the
+    run stopped (``"converged"``, ``"max_samples"`` or ``"max_seconds"``).
+    Other arguments are as for `run_ensemble`.
+    """
+
+    criteria = criteria or ConvergenceCriteria()
+    if streams not in ("shared", "spawned"):
+        raise ValueError("streams must be 'shared' or 'spawned'")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    statistics = statistics or StreamingSummary(
+        quantiles=tuple(sorted(set(criteria.quantiles) | {0.05, 0.5, 0.95}))
+    )
+    checkpoint = EnsembleCheckpoint(
+        samples=0,
+        seed=seed,
+        streams=streams,
+        retain_runs=retain_runs,
+        spill_path=str(spill_path) if spill_path is not None else None,
+        statistics=statistics,
+    )
+
+    history: List[dict[str, Any]] = []
+    previous: dict[str, Any] | None = None
+    start = perf_counter()
+    stopped = "max_samples"
+    manifest: dict[str, Any] = {}
+    with ExitStack() as stack:
+        # One pool serves every batch.
+        executor = None
+        if streams == "spawned" and (workers or 1) > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        while checkpoint.samples < criteria.max_samples:
+            checkpoint.samples = min(checkpoint.samples + criteria.batch_size, criteria.max_samples)
+            manifest = _advance(
+                checkpoint,
+                sample_generator,
+                runner,
+                workers=workers,
+                chunk_size=chunk_size,
+                checkpoint_path=None,
+                checkpoint_every=criteria.batch_size,
+                executor=executor,
+            )
+            metrics = _convergence_metrics(statistics, criteria.confidence)
+            quantiles = {
+                f"{name}@{probability}": statistics.quantile(name, probability)
+                for name in ("east_m", "north_m")
+                for probability in criteria.quantiles
+            }
+            entry: dict[str, Any] = {"samples": checkpoint.samples, "elapsed_s": perf_counter() - start, **metrics}
+            checks: List[bool] = []
+            if criteria.mean_tolerance_m is not None:
+                error = metrics["mean_standard_error_m"]
+                checks.append(error is not None and error <= criteria.mean_tolerance_m)
+            if criteria.axis_tolerance_m is not None:
+                change = None
+                if previous is not None and previous["major_axis_m"] is not None and metrics["major_axis_m"] is not None:
+                    change = max(
+                        abs(metrics["major_axis_m"] - previous["major_axis_m"]),
+                        abs(metrics["minor_axis_m"] - previous["minor_axis_m"]),
+                    )
+                entry["axis_change_m"] = change
+                checks.append(change is not None and change <= criteria.axis_tolerance_m)
+            if criteria.quantile_tolerance_m is not None:
+                change = None
+                if previous is not None and metrics["landed"] >= 2:
+                    change = max(abs(value - previous["quantiles"][key]) for key, value in quantiles.items())
+                entry["quantile_change_m"] = change
+                checks.append(change is not None and change <= criteria.quantile_tolerance_m)
+            entry["converged"] = checkpoint.samples >= criteria.min_samples and all(checks)
+            history.append(entry)
+            previous = {**metrics, "quantiles": quantiles}
+
+            if entry["converged"]:
+                stopped = "converged"
+                break
+            if criteria.max_seconds is not None and entry["elapsed_s"] >= criteria.max_seconds:
+                stopped = "max_seconds"
+                break
+
+    manifest["convergence"] = {
+        "criteria": asdict(criteria),
+        "history": history,
+        "stopped": stopped,
+    }
+    return _payload(checkpoint, manifest, None)
+
+
+def _execute(
+    checkpoint: EnsembleCheckpoint,
+    sample_generator: Callable[[np.random.Generator, Any], Any],
+    runner: Callable[[Any], Any],
+    *,
+    summary_fn: Callable[[Sequence[Any]], EnsembleSummary] | None,
+    workers: int | None,
+    chunk_size: int | None,
+    checkpoint_path: str | Path | None,
+    checkpoint_every: int,
+) -> dict[str, Any]:
+    manifest = _advance(
+        checkpoint,
+        sample_generator,
+        runner,
+        workers=workers,
+        chunk_size=chunk_size,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every,
+    )
+    return _payload(checkpoint, manifest, summary_fn)
+
+
+def _advance(
+    checkpoint: EnsembleCheckpoint,
+    sample_generator: Callable[[np.random.Generator, Any], Any],
+    runner: Callable[[Any], Any],
+    *,
+    workers: int | None,
+    chunk_size: int | None,
+    checkpoint_path: str | Path | None,
+    checkpoint_every: int,
+    executor: Executor | None = None,
+) -> dict[str, Any]:
+    """Run ``checkpoint`` up to ``checkpoint.samples`` and return the manifest.
+
+    An ``executor`` is used for spawned chunks instead of a pool of
+    ``workers`` started for this call.
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    if checkpoint.streams == "shared" and (workers or 1) > 1:
+        raise ValueError("parallel execution requires streams='spawned'")
+
+    samples, seed, statistics = checkpoint.samples, checkpoint.seed, checkpoint.statistics
+    manifest: dict[str, Any] = {
+        "generator": "PCG64",
+        "seed": seed,
+        "samples": samples,
+        "streams": checkpoint.streams,
+    }
+    if checkpoint.batch_size is not None:
+        manifest["batch_size"] = checkpoint.batch_size
+    if isinstance(sample_generator, DesignSampler):
+        if sample_generator.samples < samples:
+            raise ValueError("design has fewer samples than the ensemble")
+        manifest["sampling"] = sample_generator.describe()
 
     rng = np.random.Generator(np.random.PCG64(seed))
-    runs: List[EnsembleRun] = []
-    results: List[Any] = []
+    if checkpoint.rng_state is not None:
+        rng.bit_generator.state = checkpoint.rng_state
+
+    with ExitStack() as stack:
+        spill = None
+        if checkpoint.spill_path is not None:
+            offset = checkpoint.spill_offset if checkpoint.completed else None
+            spill = stack.enter_context(RunSpill(checkpoint.spill_path, offset=offset))
+        # Saves record how far the retained runs got instead of rewriting them.
+        retained = None
+        if checkpoint.retain_runs and checkpoint_path is not None:
+            if checkpoint.runs_path is None:
+                target = Path(checkpoint_path)
+                checkpoint.runs_path = str(target.with_name(target.name + ".runs"))
+            offset = checkpoint.runs_offset if checkpoint.completed else None
+            retained = stack.enter_context(RunSpill(checkpoint.runs_path, offset=offset))
+
+        def record(run: EnsembleRun) -> None:
+            if checkpoint.retain_runs:
+                checkpoint.runs.append(run)
+            if retained is not None:
+                retained.write(run)
+            if spill is not None:
+                spill.write(run)
+            if statistics is not None:
+                statistics.add(run.result)
+            checkpoint.completed += 1
+            # Mid-batch the shared generator is already past the batch's draws.
+            if (
+                checkpoint_path is not None
+                and checkpoint.batch_size is None
+                and checkpoint.completed % checkpoint_every == 0
+            ):
+                save()
+
+        def sync() -> None:
+            if spill is not None:
+                checkpoint.spill_offset = spill.tell()
+            if retained is not None:
+                checkpoint.runs_offset = retained.tell()
+            if checkpoint.streams == "shared":
+                checkpoint.rng_state = rng.bit_generator.state
+
+        def save() -> None:
+            assert checkpoint_path is not None
+            sync()
+            checkpoint.save(checkpoint_path)
 
-    for index in range(samples):
-        run_seed = int(rng.bit_generator.state["state"]["state"])
-        sample = sample_generator(rng, index)
-        result = runner(sample)
-        runs.append(EnsembleRun(index=index, seed=run_seed, sample=sample, result=result))
-        results.append(result)
+        if checkpoint.batch_size is not None:
+            for start in range(checkpoint.completed, samples, checkpoint.batch_size):
+                indices = np.arange(start, min(start + checkpoint.batch_size, samples))
+                batch_seed = int(rng.bit_generator.state["state"]["state"])
+                batch = as_sample_batch(sample_generator(rng, indices), indices)
+                results = result_rows(runner(batch), len(batch))
+                seeds = batch.seeds.tolist() if batch.seeds is not None else [batch_seed] * len(batch)
+                for index, run_seed, sample, result in zip(indices.tolist(), seeds, batch.rows(), results):
+                    record(EnsembleRun(index=index, seed=int(run_seed), sample=sample, result=result))
+                if checkpoint_path is not None and checkpoint.completed // checkpoint_every > start // checkpoint_every:
+                    save()
+        elif checkpoint.streams == "shared":
+            for index in range(checkpoint.completed, samples):
+                run_seed = int(rng.bit_generator.state["state"]["state"])
+                sample = sample_generator(rng, index)
+                result = runner(sample)
+                record(EnsembleRun(index=index, seed=run_seed, sample=sample, result=result))
+        else:
+            pool_size = workers or 1
+            remaining = samples - checkpoint.completed
+            if chunk_size is None:
+                chunk_size = max(1, -(-remaining // (4 * pool_size)))
+            chunk_count = -(-remaining // chunk_size)
+            chunks: Iterator[_EnsembleChunk] = (
+                (sample_generator, runner, seed, range(start, min(start + chunk_size, samples)))
+                for start in range(checkpoint.completed, samples, chunk_size)
+            )
+            completed: Iterable[List[Tuple[Any, Any]]]
+            if executor is None and pool_size > 1 and chunk_count > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=min(pool_size, chunk_count)))
+            if executor is not None:
+                completed = _bounded_map(executor, _run_spawned_chunk, chunks, 2 * pool_size)
+            else:
+                completed = map(_run_spawned_chunk, chunks)
+            for chunk_outcomes in completed:
+                for sample, result in chunk_outcomes:
+                    index = checkpoint.completed
+                    record(EnsembleRun(index=index, seed=seed, sample=sample, result=result, spawn_key=(index,)))
+            manifest["spawn_keys"] = {"spawn_key": "(index,)", "count": samples}
+
+        # Leave the checkpoint ready to continue, whether from disk or in memory.
+        sync()
+        if checkpoint_path is not None:
+            checkpoint.save(checkpoint_path)
+    return manifest
+
+
+def _payload(
+    checkpoint: EnsembleCheckpoint,
+    manifest: dict[str, Any],
+    summary_fn: Callable[[Sequence[Any]], EnsembleSummary] | None,
+) -> dict[str, Any]:
+    statistics = checkpoint.statistics
+    if checkpoint.retain_runs:
+        results = [run.result for run in checkpoint.runs]
+        summary = summary_fn(results) if summary_fn else _default_summary(results)
+    else:
+        assert statistics is not None
+        summary = _streamed_summary(statistics)
+
+    payload: dict[str, Any] = {
+        "manifest": manifest,
+        "runs": list(checkpoint.runs),
+        "summary": summary,
+    }
+    if statistics is not None:
+        payload["statistics"] = statistics
+    return payload
 
-    summary = summary_fn(results) if summary_fn else _default_summary(results)
+
+def sigma_points(
+    mean: npt.ArrayLike,
+    covariance: npt.ArrayLike,
+    *,
+    alpha: float = 1.0,
+    beta: float = 2.0,
+    kappa: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the ``2n + 1`` scaled unscented-transform sigma points and weights.
+
+    Returns ``(points, mean_weights, covariance_weights)`` with ``points`` of
+    shape ``(2n + 1, n)``; row 0 is the mean, then ``mean ± column i`` of the
+    scaled Cholesky factor. The defaults spread the points ``sqrt(n)``
+    standard deviations out with a zero-weight centre; ``kappa = 3 - n``
+    matches the fourth moments of a normal input instead.
+    """
+
+    centre = np.atleast_1d(np.asarray(mean, dtype=float))
+    matrix = np.atleast_2d(np.asarray(covariance, dtype=float))
+    size = centre.size
+    if matrix.shape != (size, size):
+        raise ValueError("covariance must be n x n for a mean of length n")
+    if alpha <= 0:
+        raise ValueError("alpha must be positive")
+    spread = alpha**2 * (size + kappa)
+    if spread <= 0:
+        raise ValueError("alpha**2 * (n + kappa) must be positive")
+    factor = np.linalg.cholesky(spread * matrix)
+    points = np.vstack((centre, centre + factor.T, centre - factor.T))
+
+    scaling = spread - size
+    mean_weights = np.full(2 * size + 1, 0.5 / spread)
+    mean_weights[0] = scaling / spread
+    covariance_weights = mean_weights.copy()
+    covariance_weights[0] += 1.0 - alpha**2 + beta
+    return points, mean_weights, covariance_weights
+
+
+def run_unscented_ensemble(
+    mean: npt.ArrayLike,
+    covariance: npt.ArrayLike,
+    runner: Callable[[Any], Any],
+    *,
+    parameter_names: Sequence[str] | None = None,
+    alpha: float = 1.0,
+    beta: float = 2.0,
+    kappa: float = 0.0,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Propagate a Gaussian input through ``runner`` with the unscented transform.
+
+    ``runner`` is called once per sigma point (see `sigma_points`) with the
+    parameter vector, or a dict keyed by ``parameter_names`` when given, and
+    must return ``east_m``/``north_m`` like the `run_ensemble` runners.
+    ``workers`` greater than one maps the sigma points over a process pool
+    (``runner`` must then be picklable). The summary holds the weighted
+    mean and standard deviations; the full landing ``covariance`` is returned
+    alongside. Run seeds are 0 as no random numbers are drawn.
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    points, mean_weights, covariance_weights = sigma_points(mean, covariance, alpha=alpha, beta=beta, kappa=kappa)
+    if parameter_names is not None and len(parameter_names) != points.shape[1]:
+        raise ValueError("parameter_names must name every parameter")
+    samples: List[Any] = [
+        dict(zip(parameter_names, row.tolist())) if parameter_names is not None else row for row in points
+    ]
+
+    if workers is not None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(runner, samples))
+    else:
+        results = [runner(sample) for sample in samples]
+    runs = [
+        EnsembleRun(index=index, seed=0, sample=sample, result=result)
+        for index, (sample, result) in enumerate(zip(samples, results))
+    ]
+
+    landings = []
+    for result in results:
+        east, north = _landing_point(result)
+        if east is None or north is None:
+            raise ValueError("every sigma-point run must return east_m and north_m")
+        landings.append((float(east), float(north)))
+    landing = np.array(landings)
+    centre = mean_weights @ landing
+    deviation = landing - centre
+    landing_covariance = (covariance_weights[:, None] * deviation).T @ deviation
+    std_east, std_north = np.sqrt(np.maximum(np.diag(landing_covariance), 0.0))
 
     return {
         "manifest": {
-            "generator": "PCG64",
-            "seed": seed,
-            "samples": samples,
+            "mode": "unscented",
+            "parameters": points.shape[1],
+            "sigma_points": len(points),
+            "alpha": alpha,
+            "beta": beta,
+            "kappa": kappa,
         },
         "runs": runs,
-        "summary": summary,
+        "summary": EnsembleSummary(
+            count=len(runs),
+            mean_east_m=float(centre[0]),
+            mean_north_m=float(centre[1]),
+            std_east_m=float(std_east),
+            std_north_m=float(std_north),
+        ),
+        "covariance": landing_covariance,
+        "weights": {"mean": mean_weights, "covariance": covariance_weights},
     }
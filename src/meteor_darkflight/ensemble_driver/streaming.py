@@ -0,0 +1,255 @@
+"""Constant-memory aggregation of ensemble results.
+
+`StreamingSummary` folds results into running statistics one at a time:
+Welford mean and covariance, min/max and P² quantile markers (Jain &
+Chlamtac, 1985), so an ensemble can be summarised without keeping its runs.
+Runs that should still be inspected later can be spilled to disk with
+`RunSpill` and read back with `load_spilled_runs`.
+"""
+
+from __future__ import annotations
+
+import pickle
+from math import isfinite, sqrt
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+STREAMED_FIELDS = ("east_m", "north_m", "flight_time_s", "terminal_kinetic_energy_j")
+
+
+class RunningMoments:
+    """Welford running mean and covariance of fixed-length vectors, with min/max.
+
+    Kept in plain floats: per-update NumPy overhead dominates for the two- and
+    one-element vectors summarised here.
+    """
+
+    def __init__(self, dimensions: int) -> None:
+        if dimensions < 1:
+            raise ValueError("dimensions must be at least 1")
+        self.count = 0
+        self._mean = [0.0] * dimensions
+        self._m2 = [[0.0] * dimensions for _ in range(dimensions)]
+        self._minimum = [float("inf")] * dimensions
+        self._maximum = [float("-inf")] * dimensions
+
+    @property
+    def mean(self) -> np.ndarray:
+        return np.array(self._mean)
+
+    @property
+    def minimum(self) -> np.ndarray:
+        return np.array(self._minimum)
+
+    @property
+    def maximum(self) -> np.ndarray:
+        return np.array(self._maximum)
+
+    def update(self, values: Sequence[float]) -> None:
+        self.count += 1
+        mean = self._mean
+        delta = [value - centre for value, centre in zip(values, mean)]
+        for index, value in enumerate(values):
+            mean[index] += delta[index] / self.count
+            if value < self._minimum[index]:
+                self._minimum[index] = value
+            if value > self._maximum[index]:
+                self._maximum[index] = value
+        for row, row_delta in zip(self._m2, delta):
+            for column, value in enumerate(values):
+                row[column] += row_delta * (value - mean[column])
+
+    def merge(self, other: "RunningMoments") -> None:
+        """Fold in moments accumulated separately (Chan et al. pairwise update)."""
+
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        m2 = np.array(self._m2) + np.array(other._m2) + np.outer(delta, delta) * (self.count * other.count / total)
+        self._m2 = m2.tolist()
+        self._mean = (self.mean + delta * (other.count / total)).tolist()
+        self._minimum = np.minimum(self.minimum, other.minimum).tolist()
+        self._maximum = np.maximum(self.maximum, other.maximum).tolist()
+        self.count = total
+
+    def covariance(self, ddof: int = 0) -> np.ndarray:
+        if self.count <= ddof:
+            return np.full((len(self._mean), len(self._mean)), np.nan)
+        return np.array(self._m2) / (self.count - ddof)
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile from five markers (the P² algorithm).
+
+    Exact until five values have been seen; afterwards memory and update cost
+    are constant.
+    """
+
+    def __init__(self, probability: float) -> None:
+        if not 0.0 < probability < 1.0:
+            raise ValueError("probability must be between 0 and 1")
+        self.probability = probability
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        p = probability
+        self._desired = [0.0, 2.0 * p, 4.0 * p, 2.0 + 2.0 * p, 4.0]
+        self._increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(index for index in range(4) if value < heights[index + 1])
+        positions = self._positions
+        for index in range(cell + 1, 5):
+            positions[index] += 1.0
+        for index in range(5):
+            self._desired[index] += self._increments[index]
+
+        for index in (1, 2, 3):
+            offset = self._desired[index] - positions[index]
+            if (offset >= 1.0 and positions[index + 1] - positions[index] > 1.0) or (
+                offset <= -1.0 and positions[index - 1] - positions[index] < -1.0
+            ):
+                step = 1 if offset > 0 else -1
+                candidate = self._parabolic(index, step)
+                if not heights[index - 1] < candidate < heights[index + 1]:
+                    candidate = heights[index] + step * (heights[index + step] - heights[index]) / (
+                        positions[index + step] - positions[index]
+                    )
+                heights[index] = candidate
+                positions[index] += step
+
+    def _parabolic(self, index: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[index] + step / (n[index + 1] - n[index - 1]) * (
+            (n[index] - n[index - 1] + step) * (q[index + 1] - q[index]) / (n[index + 1] - n[index])
+            + (n[index + 1] - n[index] - step) * (q[index] - q[index - 1]) / (n[index] - n[index - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        if self.count == 0:
+            return float("nan")
+        if self.count <= 5:
+            return float(np.quantile(self._heights, self.probability))
+        return self._heights[2]
+
+
+class StreamingSummary:
+    """Running statistics of ensemble results in constant memory.
+
+    Each result (a dict or an object, like the `run_ensemble` runners return)
+    contributes its `STREAMED_FIELDS` that are present and finite. East and
+    north feed a joint covariance when both are present.
+    """
+
+    def __init__(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95)) -> None:
+        self.quantiles = tuple(quantiles)
+        self.count = 0
+        self.landing = RunningMoments(2)
+        self.fields: Dict[str, RunningMoments] = {name: RunningMoments(1) for name in STREAMED_FIELDS}
+        self.markers: Dict[str, Tuple[P2Quantile, ...]] = {
+            name: tuple(P2Quantile(probability) for probability in self.quantiles) for name in STREAMED_FIELDS
+        }
+
+    def add(self, result: Any) -> None:
+        self.count += 1
+        values: Dict[str, float] = {}
+        for name in STREAMED_FIELDS:
+            raw = result.get(name) if isinstance(result, dict) else getattr(result, name, None)
+            if raw is None:
+                continue
+            value = float(raw)
+            if not isfinite(value):
+                continue
+            values[name] = value
+            self.fields[name].update((value,))
+            for marker in self.markers[name]:
+                marker.update(value)
+        if "east_m" in values and "north_m" in values:
+            self.landing.update((values["east_m"], values["north_m"]))
+
+    def quantile(self, name: str, probability: float) -> float:
+        for marker in self.markers[name]:
+            if marker.probability == probability:
+                return marker.value
+        raise KeyError(f"quantile {probability} of {name} is not tracked")
+
+    def as_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"count": self.count}
+        for name, moments in self.fields.items():
+            if moments.count == 0:
+                payload[name] = None
+                continue
+            payload[name] = {
+                "count": moments.count,
+                "mean": float(moments.mean[0]),
+                "std": sqrt(float(moments.covariance()[0, 0])),
+                "min": float(moments.minimum[0]),
+                "max": float(moments.maximum[0]),
+                "quantiles": {str(marker.probability): marker.value for marker in self.markers[name]},
+            }
+        payload["landing_covariance"] = self.landing.covariance().tolist() if self.landing.count else None
+        return payload
+
+
+class RunSpill:
+    """Append-only pickle stream of ensemble runs.
+
+    With ``offset`` an existing spill is reopened, truncated to ``offset``
+    bytes (a position from `tell`) and appended to.
+    """
+
+    def __init__(self, path: str | Path, offset: int | None = None) -> None:
+        self.path = Path(path)
+        if offset is None:
+            self._handle: BinaryIO = self.path.open("wb")
+        else:
+            self._handle = self.path.open("r+b")
+            self._handle.truncate(offset)
+            self._handle.seek(offset)
+
+    def write(self, run: Any) -> None:
+        pickle.dump(run, self._handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def tell(self) -> int:
+        """Flush and return the end of the last complete record."""
+
+        self._handle.flush()
+        return self._handle.tell()
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> "RunSpill":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def load_spilled_runs(path: str | Path) -> Iterator[Any]:
+    """Yield the runs written by `RunSpill` in order, one at a time."""
+
+    with Path(path).open("rb") as handle:
+        while True:
+            try:
+                yield pickle.load(handle)
+            except EOFError:
+                return
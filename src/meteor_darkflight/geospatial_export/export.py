@@ -43,11 +43,10 @@ def export_kml(trajectories: List[TrajectoryResult], out_path: str) -> None:
     body = ""
 
     for i, result in enumerate(trajectories):
-        coords_str = ""
-        for state in result.states:
-            lon, lat = transformer.transform(state.x, state.y)
-            alt = state.z
-            coords_str += f"{lon},{lat},{alt} "
+        lons, lats = transformer.transform(result.x, result.y)
+        coords_str = "".join(
+            f"{lon},{lat},{alt} " for lon, lat, alt in zip(lons.tolist(), lats.tolist(), result.z.tolist())
+        )
 
         # Impact Point
         if result.impact_state:
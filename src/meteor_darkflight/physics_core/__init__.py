@@ -7,23 +7,43 @@ from .ablation import (
     simple_ablation_rate,
 )
 from .drag import (
+    CdTable,
     DragParams,
     calculate_cube_cd,
+    calculate_cube_cd_array,
     calculate_sphere_cd,
+    calculate_sphere_cd_array,
     drag_acceleration,
     drag_acceleration_vector,
+    drag_acceleration_vector_array,
     drag_force,
+    drag_force_array,
     dynamic_pressure,
+    dynamic_pressure_array,
     relative_velocity,
+    relative_velocity_array,
     speed_magnitude,
+    speed_magnitude_array,
+)
+from .geometry import (
+    cross_section_from_mass_density,
+    cross_section_from_mass_density_array,
+    radius_from_mass_density,
+    radius_from_mass_density_array,
 )
-from .geometry import cross_section_from_mass_density, radius_from_mass_density
 from .trajectory import (
+    EARTH_ROTATION_RATE_RAD_S,
+    AdaptiveIntegrator,
+    DenseOutput,
+    DormandPrince54Integrator,
     ExplicitEulerIntegrator,
+    ForwardEulerIntegrator,
     IntegrationEnvironment,
     Integrator,
     RungeKutta4Integrator,
     State,
+    StateVector,
+    derivative_function,
 )
 
 __all__ = [
@@ -36,15 +56,32 @@ __all__ = [
     "speed_magnitude",
     "calculate_sphere_cd",
     "calculate_cube_cd",
+    "calculate_sphere_cd_array",
+    "calculate_cube_cd_array",
+    "CdTable",
+    "dynamic_pressure_array",
+    "drag_force_array",
+    "drag_acceleration_vector_array",
+    "relative_velocity_array",
+    "speed_magnitude_array",
     "SimpleAblationParams",
     "ClassicalAblationParams",
     "simple_ablation_rate",
     "classical_ablation_rate",
     "radius_from_mass_density",
     "cross_section_from_mass_density",
+    "radius_from_mass_density_array",
+    "cross_section_from_mass_density_array",
     "State",
+    "StateVector",
+    "EARTH_ROTATION_RATE_RAD_S",
+    "derivative_function",
     "IntegrationEnvironment",
     "Integrator",
     "ExplicitEulerIntegrator",
+    "ForwardEulerIntegrator",
     "RungeKutta4Integrator",
+    "AdaptiveIntegrator",
+    "DormandPrince54Integrator",
+    "DenseOutput",
 ]
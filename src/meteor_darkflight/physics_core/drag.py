@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import hypot
-from typing import Tuple
+from math import exp, hypot
+from typing import Callable, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 
 @dataclass(frozen=True)
@@ -24,8 +27,6 @@ def calculate_sphere_cd(mach: float) -> float:
     """
     if mach <= 0.722:
         return 0.45 * mach**2 + 0.424
-
-    from math import exp
     return 2.1 * exp(-1.2 * (mach + 0.35)) - 8.9 * exp(-2.2 * (mach + 0.35)) + 0.92
 
 
@@ -38,11 +39,88 @@ def calculate_cube_cd(mach: float) -> float:
     """
     if mach <= 1.150:
         return 0.60 * mach**2 + 1.04
-
-    from math import exp
     return 2.1 * exp(-1.16 * (mach + 0.35)) - 6.5 * exp(-2.23 * (mach + 0.35)) + 1.67
 
 
+def calculate_sphere_cd_array(mach: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `calculate_sphere_cd` for an array of Mach numbers."""
+
+    mach = np.asarray(mach, dtype=float)
+    shifted = mach + 0.35
+    return np.where(
+        mach <= 0.722,
+        0.45 * mach**2 + 0.424,
+        2.1 * np.exp(-1.2 * shifted) - 8.9 * np.exp(-2.2 * shifted) + 0.92,
+    )
+
+
+def calculate_cube_cd_array(mach: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `calculate_cube_cd` for an array of Mach numbers."""
+
+    mach = np.asarray(mach, dtype=float)
+    shifted = mach + 0.35
+    return np.where(
+        mach <= 1.150,
+        0.60 * mach**2 + 1.04,
+        2.1 * np.exp(-1.16 * shifted) - 6.5 * np.exp(-2.23 * shifted) + 1.67,
+    )
+
+
+@dataclass(frozen=True)
+class CdTable:
+    """Precomputed Cd(Mach) curve evaluated by linear interpolation.
+
+    Queries outside ``[mach[0], mach[-1]]`` are clamped to the end values, so
+    build the table over the full Mach range the simulation can reach.
+    """
+
+    mach: np.ndarray
+    cd: np.ndarray
+
+    def __post_init__(self) -> None:
+        mach = np.asarray(self.mach, dtype=float)
+        cd = np.asarray(self.cd, dtype=float)
+        if mach.ndim != 1 or mach.shape != cd.shape or mach.size < 2:
+            raise ValueError("mach and cd must be 1-D arrays of equal length >= 2")
+        if np.any(np.diff(mach) <= 0):
+            raise ValueError("mach grid must be strictly increasing")
+        object.__setattr__(self, "mach", mach)
+        object.__setattr__(self, "cd", cd)
+
+    @classmethod
+    def from_function(
+        cls,
+        function: Callable[[np.ndarray], np.ndarray],
+        *,
+        mach_max: float = 10.0,
+        step: float = 1e-3,
+        breakpoints: Tuple[float, ...] = (),
+    ) -> "CdTable":
+        """Tabulate a vectorised Cd curve on ``[0, mach_max]``.
+
+        ``breakpoints`` (regime switches) are inserted into the grid together
+        with the next representable Mach above them, so a jump in the curve is
+        not smeared across a cell.
+        """
+
+        edges = np.asarray(breakpoints, dtype=float)
+        grid = np.union1d(
+            np.arange(0.0, mach_max + step, step),
+            np.concatenate((edges, np.nextafter(edges, np.inf))),
+        )
+        return cls(mach=grid, cd=np.asarray(function(grid), dtype=float))
+
+    @classmethod
+    def sphere(cls, *, mach_max: float = 10.0, step: float = 1e-3) -> "CdTable":
+        return cls.from_function(calculate_sphere_cd_array, mach_max=mach_max, step=step, breakpoints=(0.722,))
+
+    @classmethod
+    def cube(cls, *, mach_max: float = 10.0, step: float = 1e-3) -> "CdTable":
+        return cls.from_function(calculate_cube_cd_array, mach_max=mach_max, step=step, breakpoints=(1.150,))
+
+    def __call__(self, mach: npt.ArrayLike) -> np.ndarray:
+        return np.asarray(np.interp(np.asarray(mach, dtype=float), self.mach, self.cd))
+
 
 def relative_velocity(
     velocity_mps: Tuple[float, float, float],
@@ -60,6 +138,19 @@ def relative_velocity(
     return (vx - wx, vy - wy, vz - wz)
 
 
+def relative_velocity_array(velocity_mps: npt.ArrayLike, wind_mps: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `relative_velocity` for arrays with components on the last axis."""
+
+    return np.asarray(np.asarray(velocity_mps, dtype=float) - np.asarray(wind_mps, dtype=float))
+
+
+def speed_magnitude_array(components: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `speed_magnitude` over the last axis."""
+
+    components = np.asarray(components, dtype=float)
+    return np.asarray(np.sqrt(np.sum(components**2, axis=-1)))
+
+
 def speed_magnitude(components: Tuple[float, float, float]) -> float:
     """Return the Euclidean speed for the provided velocity components."""
 
@@ -72,6 +163,12 @@ def dynamic_pressure(density_kg_m3: float, speed_mps: float) -> float:
     return 0.5 * density_kg_m3 * speed_mps**2
 
 
+def dynamic_pressure_array(density_kg_m3: npt.ArrayLike, speed_mps: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `dynamic_pressure`."""
+
+    return np.asarray(0.5 * np.asarray(density_kg_m3, dtype=float) * np.asarray(speed_mps, dtype=float) ** 2)
+
+
 def drag_force(speed_mps: float, density_kg_m3: float, params: DragParams) -> float:
     """Compute drag force magnitude (N).
 
@@ -82,6 +179,18 @@ def drag_force(speed_mps: float, density_kg_m3: float, params: DragParams) -> fl
     return dynamic_pressure(density_kg_m3, speed_mps) * params.cd * params.area_m2
 
 
+def drag_force_array(
+    speed_mps: npt.ArrayLike,
+    density_kg_m3: npt.ArrayLike,
+    cd: npt.ArrayLike,
+    area_m2: npt.ArrayLike,
+) -> np.ndarray:
+    """Vectorised `drag_force` with per-element ``cd`` and ``area_m2``."""
+
+    pressure = dynamic_pressure_array(density_kg_m3, speed_mps)
+    return np.asarray(pressure * np.asarray(cd, dtype=float) * np.asarray(area_m2, dtype=float))
+
+
 def drag_acceleration(force_newtons: float, mass_kg: float) -> float:
     """Convert drag force to acceleration (m/s²) along velocity direction."""
 
@@ -113,3 +222,26 @@ def drag_acceleration_vector(
     accel_mag = drag_acceleration(force, mass_kg)
     scale = -accel_mag / speed
     return (rel_v[0] * scale, rel_v[1] * scale, rel_v[2] * scale)
+
+
+def drag_acceleration_vector_array(
+    velocity_mps: npt.ArrayLike,
+    wind_mps: npt.ArrayLike,
+    density_kg_m3: npt.ArrayLike,
+    mass_kg: npt.ArrayLike,
+    cd: npt.ArrayLike,
+    area_m2: npt.ArrayLike,
+) -> np.ndarray:
+    """Vectorised `drag_acceleration_vector`; vectors carry components on the last axis.
+
+    Fragments at rest relative to the air get zero drag.
+    """
+
+    mass = np.asarray(mass_kg, dtype=float)
+    if np.any(mass <= 0):
+        raise ValueError("mass_kg must be positive to compute acceleration")
+    rel_v = relative_velocity_array(velocity_mps, wind_mps)
+    speed = speed_magnitude_array(rel_v)
+    accel_mag = drag_force_array(speed, density_kg_m3, cd, area_m2) / mass
+    scale = np.divide(-accel_mag, speed, out=np.zeros(np.broadcast(accel_mag, speed).shape), where=speed != 0.0)
+    return np.asarray(rel_v * scale[..., np.newaxis])
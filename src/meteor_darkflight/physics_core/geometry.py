@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+import numpy.typing as npt
+
 
 def radius_from_mass_density(mass_kg: float, density_kg_m3: float) -> float:
     """Return fragment radius (m) assuming a sphere.
@@ -26,3 +29,21 @@ def cross_section_from_mass_density(mass_kg: float, density_kg_m3: float) -> flo
 
     radius_m = radius_from_mass_density(mass_kg, density_kg_m3)
     return math.pi * radius_m**2
+
+
+def radius_from_mass_density_array(mass_kg: npt.ArrayLike, density_kg_m3: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `radius_from_mass_density`."""
+
+    mass = np.asarray(mass_kg, dtype=float)
+    density = np.asarray(density_kg_m3, dtype=float)
+    if np.any(density <= 0):
+        raise ValueError("density_kg_m3 must be positive")
+    if np.any(mass < 0):
+        raise ValueError("mass_kg cannot be negative")
+    return np.asarray(np.cbrt((3.0 * (mass / density)) / (4.0 * math.pi)))
+
+
+def cross_section_from_mass_density_array(mass_kg: npt.ArrayLike, density_kg_m3: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `cross_section_from_mass_density`."""
+
+    return math.pi * radius_from_mass_density_array(mass_kg, density_kg_m3) ** 2
@@ -5,7 +5,12 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, replace
 from math import sqrt
-from typing import Protocol, Tuple
+from typing import Callable, Protocol, Sequence, Tuple
+
+# Flat (t, x, y, z, vx, vy, vz, mass) used by the allocation-light stepping API.
+StateVector = Tuple[float, float, float, float, float, float, float, float]
+
+EARTH_ROTATION_RATE_RAD_S = 7.2921159e-5  # sidereal rotation rate used for Coriolis terms
 
 
 @dataclass(frozen=True)
@@ -24,6 +29,11 @@ class State:
 
         return sqrt(self.vx**2 + self.vy**2 + self.vz**2)
 
+    def as_tuple(self) -> StateVector:
+        """Return ``(t, x, y, z, vx, vy, vz, mass)`` for the flat stepping API."""
+
+        return (self.t, self.x, self.y, self.z, self.vx, self.vy, self.vz, self.mass)
+
     def horizontal_displacement(self) -> float:
         """Return horizontal drift magnitude (m)."""
 
@@ -56,8 +66,17 @@ class State:
         )
 
 
+Derivative = Tuple[float, float, float, float, float, float, float]
+DerivativeFunction = Callable[[StateVector], Derivative]
+
+
 class IntegrationEnvironment(Protocol):
-    """Minimal hooks the integrator expects from the simulation context."""
+    """Minimal hooks the integrator expects from the simulation context.
+
+    Environments may additionally provide ``derivatives(values)`` taking a
+    `StateVector` and returning ``(vx, vy, vz, ax, ay, az, dm/dt)`` in one call;
+    `derivative_function` prefers it over the two per-state hooks.
+    """
 
     def acceleration(self, state: State) -> Tuple[float, float, float]:
         """Return acceleration components (ax, ay, az) in m/s²."""
@@ -66,69 +85,511 @@ class IntegrationEnvironment(Protocol):
         """Return dm/dt (kg/s) accounting for ablation and fragmentation."""
 
 
+def derivative_function(env: IntegrationEnvironment) -> DerivativeFunction:
+    """Return ``env``'s flat derivative hook, adapting the per-state hooks if absent."""
+
+    derivatives = getattr(env, "derivatives", None)
+    if derivatives is not None:
+        return derivatives  # type: ignore[no-any-return]
+
+    def adapted(values: StateVector) -> Derivative:
+        state = State(*values)
+        ax, ay, az = env.acceleration(state)
+        return (values[4], values[5], values[6], ax, ay, az, env.mass_derivative(state))
+
+    return adapted
+
+
+class _DerivativeEnvironment:
+    """Per-state hooks over a flat derivative function (for `Integrator.advance`)."""
+
+    def __init__(self, derivatives: DerivativeFunction) -> None:
+        self.derivatives = derivatives
+
+    def acceleration(self, state: State) -> Tuple[float, float, float]:
+        rate = self.derivatives(state.as_tuple())
+        return (rate[3], rate[4], rate[5])
+
+    def mass_derivative(self, state: State) -> float:
+        return self.derivatives(state.as_tuple())[6]
+
+
+def _components(state: State) -> Derivative:
+    return (state.x, state.y, state.z, state.vx, state.vy, state.vz, state.mass)
+
+
+def _stage(
+    values: StateVector,
+    dt: float,
+    ks: Sequence[Derivative],
+    weights: Sequence[float],
+    time_fraction: float,
+) -> StateVector:
+    """Return ``values + dt * sum(w_i * k_i)`` with the mass clamped at zero."""
+
+    out = [
+        values[i + 1] + dt * sum(weight * k[i] for weight, k in zip(weights, ks) if weight != 0.0)
+        for i in range(7)
+    ]
+    return (values[0] + dt * time_fraction, out[0], out[1], out[2], out[3], out[4], out[5], max(out[6], 0.0))
+
+
+def _hermite(
+    theta: float,
+    dt: float,
+    start: Derivative,
+    end: Derivative,
+    start_rate: Derivative,
+    end_rate: Derivative,
+) -> list[float]:
+    theta2 = theta * theta
+    theta3 = theta2 * theta
+    h00 = 2.0 * theta3 - 3.0 * theta2 + 1.0
+    h10 = theta3 - 2.0 * theta2 + theta
+    h01 = -2.0 * theta3 + 3.0 * theta2
+    h11 = theta3 - theta2
+    return [
+        h00 * start[i] + h10 * dt * start_rate[i] + h01 * end[i] + h11 * dt * end_rate[i]
+        for i in range(7)
+    ]
+
+
+def _state_at(t: float, values: Sequence[float]) -> State:
+    return State(
+        t=t,
+        x=values[0],
+        y=values[1],
+        z=values[2],
+        vx=values[3],
+        vy=values[4],
+        vz=values[5],
+        mass=max(values[6], 0.0),
+    )
+
+
+class DenseOutput(ABC):
+    """Continuous interpolant of the state across one accepted step."""
+
+    def __init__(self, start: State, end: State) -> None:
+        self.start = start
+        self.end = end
+
+    @property
+    def t0(self) -> float:
+        return self.start.t
+
+    @property
+    def t1(self) -> float:
+        return self.end.t
+
+    def fraction(self, t: float) -> float:
+        span = self.end.t - self.start.t
+        return 0.0 if span == 0 else (t - self.start.t) / span
+
+    @property
+    def end_rate(self) -> Derivative | None:
+        """Derivative at ``end`` if the step already evaluated it, else None."""
+
+        return None
+
+    @abstractmethod
+    def __call__(self, t: float) -> State:
+        """Return the interpolated state at time ``t`` within the step."""
+
+
+class LinearDenseOutput(DenseOutput):
+    """Linear interpolation between step endpoints (first-order methods)."""
+
+    def __call__(self, t: float) -> State:
+        alpha = self.fraction(t)
+        start = _components(self.start)
+        end = _components(self.end)
+        return _state_at(t, [a + (b - a) * alpha for a, b in zip(start, end)])
+
+
+class HermiteDenseOutput(DenseOutput):
+    """Cubic Hermite interpolant from endpoint states and derivatives.
+
+    The end derivative is only evaluated on first use, so steps that never
+    need interpolation cost no extra environment calls.
+    """
+
+    def __init__(
+        self,
+        start: State,
+        end: State,
+        start_rate: Derivative,
+        end_rate: Callable[[], Derivative],
+    ) -> None:
+        super().__init__(start, end)
+        self._start_rate = start_rate
+        self._end_rate_fn = end_rate
+        self._end_rate: Derivative | None = None
+
+    def __call__(self, t: float) -> State:
+        if self._end_rate is None:
+            self._end_rate = self._end_rate_fn()
+        values = _hermite(
+            self.fraction(t),
+            self.end.t - self.start.t,
+            _components(self.start),
+            _components(self.end),
+            self._start_rate,
+            self._end_rate,
+        )
+        return _state_at(t, values)
+
+
 class Integrator(ABC):
     @abstractmethod
     def step(self, state: State, dt: float, env: IntegrationEnvironment) -> State:
         """Advance state by ``dt`` using the supplied environment."""
 
+    def advance(self, values: StateVector, dt: float, derivatives: DerivativeFunction) -> StateVector:
+        """Advance a flat state vector by ``dt`` without building `State` objects.
+
+        ``derivatives`` is typically obtained once per run from
+        `derivative_function`. Built-in integrators implement this directly and
+        `step` delegates to it; the default round-trips through `step`.
+        """
+
+        return self.step(State(*values), dt, _DerivativeEnvironment(derivatives)).as_tuple()
+
+    def step_dense(
+        self, state: State, dt: float, env: IntegrationEnvironment
+    ) -> Tuple[State, DenseOutput]:
+        """Advance state by ``dt`` and return a continuous interpolant of the step.
+
+        The interpolant comes from `dense_output`.
+        """
+
+        next_state = self.step(state, dt, env)
+        return next_state, self.dense_output(state, next_state, env)
+
+    def dense_output(self, state: State, candidate: State, env: IntegrationEnvironment) -> DenseOutput:
+        """Return an interpolant for a step already taken from ``state`` to ``candidate``.
+
+        Defaults to linear interpolation between the endpoints; higher-order
+        integrators override this with an interpolant matching their accuracy,
+        so callers stepping with `advance` need not integrate a step twice.
+        """
+
+        return LinearDenseOutput(state, candidate)
+
 
 class ExplicitEulerIntegrator(Integrator):
     """Simple explicit Euler integrator mirroring workbook slice stepping."""
 
     def step(self, state: State, dt: float, env: IntegrationEnvironment) -> State:
-        ax, ay, az = env.acceleration(state)
-        dm_dt = env.mass_derivative(state)
+        return State(*self.advance(state.as_tuple(), dt, derivative_function(env)))
 
-        vx = state.vx + ax * dt
-        vy = state.vy + ay * dt
-        vz = state.vz + az * dt
-        x = state.x + vx * dt
-        y = state.y + vy * dt
-        z = state.z + vz * dt
-        mass = max(state.mass + dm_dt * dt, 0.0)
+    def advance(self, values: StateVector, dt: float, derivatives: DerivativeFunction) -> StateVector:
+        t, x, y, z, vx, vy, vz, mass = values
+        _, _, _, ax, ay, az, dm_dt = derivatives(values)
 
-        return state.with_updates(t=state.t + dt, x=x, y=y, z=z, vx=vx, vy=vy, vz=vz, mass=mass)
+        vx = vx + ax * dt
+        vy = vy + ay * dt
+        vz = vz + az * dt
+        return (t + dt, x + vx * dt, y + vy * dt, z + vz * dt, vx, vy, vz, max(mass + dm_dt * dt, 0.0))
+
+
+class ForwardEulerIntegrator(Integrator):
+    """Forward Euler with mass held constant.
+
+    Position and velocity both advance with the derivatives at the start of
+    the step, and ablation is ignored. This is the backward-leg scheme of
+    `run_reverse_trajectory`.
+    """
+
+    def step(self, state: State, dt: float, env: IntegrationEnvironment) -> State:
+        return State(*self.advance(state.as_tuple(), dt, derivative_function(env)))
+
+    def advance(self, values: StateVector, dt: float, derivatives: DerivativeFunction) -> StateVector:
+        t, x, y, z, vx, vy, vz, mass = values
+        _, _, _, ax, ay, az, _ = derivatives(values)
+        return (t + dt, x + vx * dt, y + vy * dt, z + vz * dt, vx + ax * dt, vy + ay * dt, vz + az * dt, mass)
 
 
 class RungeKutta4Integrator(Integrator):
     """Classical 4th-order Runge–Kutta integrator for trajectory evolution."""
 
     def step(self, state: State, dt: float, env: IntegrationEnvironment) -> State:
-        def derivative(s: State) -> Tuple[float, float, float, float, float, float, float]:
-            ax, ay, az = env.acceleration(s)
-            dm_dt = env.mass_derivative(s)
-            return (s.vx, s.vy, s.vz, ax, ay, az, dm_dt)
-
-        def combine(
-            base: State,
-            k: Tuple[float, float, float, float, float, float, float],
-            scale: float,
-        ) -> State:
-            return base.with_updates(
-                t=base.t + dt * scale,
-                x=base.x + k[0] * dt * scale,
-                y=base.y + k[1] * dt * scale,
-                z=base.z + k[2] * dt * scale,
-                vx=base.vx + k[3] * dt * scale,
-                vy=base.vy + k[4] * dt * scale,
-                vz=base.vz + k[5] * dt * scale,
-                mass=max(base.mass + k[6] * dt * scale, 0.0),
+        return State(*self.advance_with_rate(state.as_tuple(), dt, derivative_function(env))[0])
+
+    def step_dense(
+        self, state: State, dt: float, env: IntegrationEnvironment
+    ) -> Tuple[State, DenseOutput]:
+        derivatives = derivative_function(env)
+        next_values, k1 = self.advance_with_rate(state.as_tuple(), dt, derivatives)
+        next_state = State(*next_values)
+        return next_state, HermiteDenseOutput(state, next_state, k1, lambda: derivatives(next_values))
+
+    def dense_output(self, state: State, candidate: State, env: IntegrationEnvironment) -> DenseOutput:
+        derivatives = derivative_function(env)
+        return HermiteDenseOutput(
+            state, candidate, derivatives(state.as_tuple()), lambda: derivatives(candidate.as_tuple())
+        )
+
+    def advance(self, values: StateVector, dt: float, derivatives: DerivativeFunction) -> StateVector:
+        return self.advance_with_rate(values, dt, derivatives)[0]
+
+    def advance_with_rate(
+        self, values: StateVector, dt: float, derivatives: DerivativeFunction
+    ) -> Tuple[StateVector, Derivative]:
+        """`advance` that also returns the derivative at the start of the step."""
+
+        t, x, y, z, vx, vy, vz, mass = values
+
+        def combine(k: Derivative, scale: float) -> StateVector:
+            return (
+                t + dt * scale,
+                x + k[0] * dt * scale,
+                y + k[1] * dt * scale,
+                z + k[2] * dt * scale,
+                vx + k[3] * dt * scale,
+                vy + k[4] * dt * scale,
+                vz + k[5] * dt * scale,
+                max(mass + k[6] * dt * scale, 0.0),
             )
 
-        k1 = derivative(state)
-        k2 = derivative(combine(state, k1, 0.5))
-        k3 = derivative(combine(state, k2, 0.5))
-        k4 = derivative(combine(state, k3, 1.0))
+        k1 = derivatives(values)
+        k2 = derivatives(combine(k1, 0.5))
+        k3 = derivatives(combine(k2, 0.5))
+        k4 = derivatives(combine(k3, 1.0))
+
+        sixth = dt / 6.0
+        return (
+            t + dt,
+            x + sixth * (k1[0] + 2.0 * k2[0] + 2.0 * k3[0] + k4[0]),
+            y + sixth * (k1[1] + 2.0 * k2[1] + 2.0 * k3[1] + k4[1]),
+            z + sixth * (k1[2] + 2.0 * k2[2] + 2.0 * k3[2] + k4[2]),
+            vx + sixth * (k1[3] + 2.0 * k2[3] + 2.0 * k3[3] + k4[3]),
+            vy + sixth * (k1[4] + 2.0 * k2[4] + 2.0 * k3[4] + k4[4]),
+            vz + sixth * (k1[5] + 2.0 * k2[5] + 2.0 * k3[5] + k4[5]),
+            max(mass + sixth * (k1[6] + 2.0 * k2[6] + 2.0 * k3[6] + k4[6]), 0.0),
+        ), k1
+
+
+class AdaptiveIntegrator(Integrator):
+    """Embedded-pair integrator that chooses its own step size.
+
+    ``rtol``/``atol`` bound the local error estimate per state component
+    (positions in m, velocities in m/s, mass in kg); ``dt_min``/``dt_max`` bound
+    the step magnitude. Negative step sizes integrate backwards in time.
+    """
+
+    order: int = 5
+
+    def __init__(
+        self,
+        *,
+        rtol: float = 1e-6,
+        atol: float = 1e-3,
+        dt_min: float = 1e-4,
+        dt_max: float = 30.0,
+        safety: float = 0.9,
+        max_rejections: int = 50,
+    ) -> None:
+        if rtol <= 0 or atol <= 0:
+            raise ValueError("rtol and atol must be positive")
+        if not 0 < dt_min <= dt_max:
+            raise ValueError("require 0 < dt_min <= dt_max")
+        self.rtol = rtol
+        self.atol = atol
+        self.dt_min = dt_min
+        self.dt_max = dt_max
+        self.safety = safety
+        self.max_rejections = max_rejections
+
+    # Whether `attempt_dense` reuses the derivative at the start of the step
+    # (first-same-as-last pairs), so it is worth evaluating once per step.
+    first_same_as_last: bool = False
+
+    @abstractmethod
+    def attempt(self, state: State, dt: float, env: IntegrationEnvironment) -> Tuple[State, Derivative]:
+        """Return the candidate state and the embedded local error estimate."""
+
+    def attempt_dense(
+        self,
+        state: State,
+        dt: float,
+        env: IntegrationEnvironment,
+        start_rate: Derivative | None = None,
+    ) -> Tuple[State, Derivative, Callable[[], DenseOutput]]:
+        """`attempt` plus a builder for the step's dense output.
+
+        ``start_rate`` is the derivative at ``state`` under ``env`` when the
+        caller already has it.
+        """
+
+        candidate, error = self.attempt(state, dt, env)
+        return candidate, error, lambda: self.dense_output(state, candidate, env)
+
+    def step(self, state: State, dt: float, env: IntegrationEnvironment) -> State:
+        return self.attempt(state, dt, env)[0]
+
+    def error_norm(self, state: State, candidate: State, error: Derivative) -> float:
+        """Return the RMS error scaled by ``atol + rtol * |y|`` (accept when <= 1)."""
+
+        start = _components(state)
+        end = _components(candidate)
+        total = 0.0
+        for err, y0, y1 in zip(error, start, end):
+            scale = self.atol + self.rtol * max(abs(y0), abs(y1))
+            total += (err / scale) ** 2
+        return sqrt(total / 7.0)
+
+    def dense_output(self, state: State, candidate: State, env: IntegrationEnvironment) -> DenseOutput:
+        """Return an interpolant for the accepted step ``state`` -> ``candidate``."""
+
+        derivatives = derivative_function(env)
+        return HermiteDenseOutput(
+            state, candidate, derivatives(state.as_tuple()), lambda: derivatives(candidate.as_tuple())
+        )
+
+    def adaptive_step(
+        self, state: State, dt: float, env: IntegrationEnvironment
+    ) -> Tuple[State, float, float]:
+        """Take one accepted step starting from trial size ``dt``.
+
+        Returns ``(new_state, dt_taken, dt_next)``; the signs of both step sizes
+        follow ``dt``.
+        """
+
+        next_state, dt_taken, dt_next, _ = self.adaptive_step_dense(state, dt, env)
+        return next_state, dt_taken, dt_next
+
+    def adaptive_step_dense(
+        self,
+        state: State,
+        dt: float,
+        env: IntegrationEnvironment,
+        *,
+        start_rate: Derivative | None = None,
+    ) -> Tuple[State, float, float, DenseOutput]:
+        """`adaptive_step` that also returns the step's dense output.
+
+        ``start_rate`` may pass in the derivative at ``state`` under ``env``,
+        typically the previous step's ``dense.end_rate``; first-same-as-last
+        pairs then skip their first stage.
+        """
+
+        direction = -1.0 if dt < 0 else 1.0
+        size = min(max(abs(dt), self.dt_min), self.dt_max)
+        exponent = -1.0 / self.order
+        if start_rate is None and self.first_same_as_last:
+            # Shared by every attempt, including those after a rejection.
+            start_rate = derivative_function(env)(state.as_tuple())
+
+        for _ in range(self.max_rejections + 1):
+            candidate, error, dense = self.attempt_dense(state, direction * size, env, start_rate)
+            norm = self.error_norm(state, candidate, error)
+            if norm <= 1.0 or size <= self.dt_min:
+                factor = 5.0 if norm == 0.0 else min(5.0, self.safety * norm**exponent)
+                next_size = min(max(size * max(factor, 0.2), self.dt_min), self.dt_max)
+                return candidate, direction * size, direction * next_size, dense()
+            factor = max(0.2, self.safety * norm**exponent)
+            size = max(size * factor, self.dt_min)
 
-        def rk4_component(index: int) -> float:
-            return k1[index] + 2.0 * k2[index] + 2.0 * k3[index] + k4[index]
+        raise RuntimeError("adaptive step size control failed to converge")
+
+
+class DormandPrince54Integrator(AdaptiveIntegrator):
+    """Dormand–Prince 5(4) embedded Runge–Kutta pair with local extrapolation."""
+
+    _C = (0.0, 1.0 / 5.0, 3.0 / 10.0, 4.0 / 5.0, 8.0 / 9.0, 1.0, 1.0)
+    _A: Tuple[Tuple[float, ...], ...] = (
+        (),
+        (1.0 / 5.0,),
+        (3.0 / 40.0, 9.0 / 40.0),
+        (44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0),
+        (19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0),
+        (9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0),
+        (35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0),
+    )
+    # Difference between the 5th- and embedded 4th-order weights.
+    _E = (
+        71.0 / 57600.0,
+        0.0,
+        -71.0 / 16695.0,
+        71.0 / 1920.0,
+        -17253.0 / 339200.0,
+        22.0 / 525.0,
+        -1.0 / 40.0,
+    )
+
+    # Continuous extension coefficients (Hairer, Nørsett & Wanner), 4th order:
+    # y(t0 + θh) = y0 + h Σ_j k_j Σ_m P[j][m] θ^(m+1).
+    _P = (
+        (1.0, -8048581381.0 / 2820520608.0, 8663915743.0 / 2820520608.0, -12715105075.0 / 11282082432.0),
+        (0.0, 0.0, 0.0, 0.0),
+        (0.0, 131558114200.0 / 32700410799.0, -68118460800.0 / 10900136933.0, 87487479700.0 / 32700410799.0),
+        (0.0, -1754552775.0 / 470086768.0, 14199869525.0 / 1410260304.0, -10690763975.0 / 1880347072.0),
+        (0.0, 127303824393.0 / 49829197408.0, -318862633887.0 / 49829197408.0, 701980252875.0 / 199316789632.0),
+        (0.0, -282668133.0 / 205662961.0, 2019193451.0 / 616988883.0, -1453857185.0 / 822651844.0),
+        (0.0, 40617522.0 / 29380423.0, -110615467.0 / 29380423.0, 69997945.0 / 29380423.0),
+    )
+
+    # The final stage of an accepted step is the next step's first.
+    first_same_as_last = True
+
+    def attempt(self, state: State, dt: float, env: IntegrationEnvironment) -> Tuple[State, Derivative]:
+        candidate, error, _ = self.attempt_dense(state, dt, env)
+        return candidate, error
+
+    def attempt_dense(
+        self,
+        state: State,
+        dt: float,
+        env: IntegrationEnvironment,
+        start_rate: Derivative | None = None,
+    ) -> Tuple[State, Derivative, Callable[[], DenseOutput]]:
+        derivatives = derivative_function(env)
+        values = state.as_tuple()
+        ks = [start_rate if start_rate is not None else derivatives(values)]
+        for c, row in zip(self._C[1:6], self._A[1:6]):
+            ks.append(derivatives(_stage(values, dt, ks, row, c)))
+
+        # Row 7 of the tableau equals the 5th-order weights, so the last stage
+        # is evaluated at the solution itself.
+        candidate_values = _stage(values, dt, ks, self._A[6], 1.0)
+        candidate = State(*candidate_values)
+        ks.append(derivatives(candidate_values))
+        stages = tuple(ks)
+        error = [dt * sum(e * k[i] for e, k in zip(self._E, ks) if e != 0.0) for i in range(7)]
+        return (
+            candidate,
+            (error[0], error[1], error[2], error[3], error[4], error[5], error[6]),
+            lambda: DormandPrinceDenseOutput(state, candidate, stages, self._P),
+        )
+
+
+class DormandPrinceDenseOutput(DenseOutput):
+    """4th-order continuous extension reusing the seven Dormand–Prince stages."""
+
+    def __init__(
+        self,
+        start: State,
+        end: State,
+        stages: Sequence[Derivative],
+        coefficients: Sequence[Sequence[float]],
+    ) -> None:
+        super().__init__(start, end)
+        self._stages = stages
+        self._coefficients = coefficients
 
-        x = state.x + (dt / 6.0) * rk4_component(0)
-        y = state.y + (dt / 6.0) * rk4_component(1)
-        z = state.z + (dt / 6.0) * rk4_component(2)
-        vx = state.vx + (dt / 6.0) * rk4_component(3)
-        vy = state.vy + (dt / 6.0) * rk4_component(4)
-        vz = state.vz + (dt / 6.0) * rk4_component(5)
-        mass = max(state.mass + (dt / 6.0) * rk4_component(6), 0.0)
+    @property
+    def end_rate(self) -> Derivative:
+        return self._stages[6]
 
-        return state.with_updates(t=state.t + dt, x=x, y=y, z=z, vx=vx, vy=vy, vz=vz, mass=mass)
+    def __call__(self, t: float) -> State:
+        theta = self.fraction(t)
+        dt = self.end.t - self.start.t
+        powers = (theta, theta**2, theta**3, theta**4)
+        weights = [sum(p * c for p, c in zip(powers, row)) for row in self._coefficients]
+        base = _components(self.start)
+        values = [
+            base[i] + dt * sum(w * k[i] for w, k in zip(weights, self._stages) if w != 0.0)
+            for i in range(7)
+        ]
+        return _state_at(t, values)
@@ -3,30 +3,118 @@
 # Re-export Integrator for convenience
 from meteor_darkflight.physics_core import ExplicitEulerIntegrator
 
+from .batch import BatchTrajectoryResult, run_trajectory_batch, supports_batch
+from .cache import (
+    CacheStats,
+    TrajectoryCache,
+    ballistic_coefficient,
+    environment_fingerprint,
+)
 from .environment import (
     AtmosphericLevel,
     AtmosphericProfile,
+    CompiledAtmosphericProfile,
+    CompiledDarkflightEnvironment,
     DarkflightEnvironment,
 )
+from .events import (
+    EventRecord,
+    TrajectoryEvent,
+    altitude_event,
+    mach_event,
+    speed_event,
+)
 from .integrator import (
+    RecordingMode,
+    RecordingPolicy,
     TerminationReason,
     TrajectoryResult,
     run_trajectory,
 )
 from .mass_finder import find_mass_for_flight_time
-from .reverse_integration import run_reverse_trajectory
-from .strewn_field import calculate_simulated_terminus, generate_strewn_field
+from .reverse_integration import (
+    TerminusEstimate,
+    run_reverse_trajectory,
+    run_reverse_trajectory_batch,
+)
+from .slices import (
+    SliceRecord,
+    SliceTable,
+    SliceTrajectoryResult,
+    run_slice_trajectory,
+)
+from .storage import STATE_COLUMNS, StateArray
+from .strewn_field import (
+    FragmentHypothesis,
+    StrewnFieldOutcome,
+    StrewnFieldSweep,
+    StrewnFieldTask,
+    calculate_simulated_terminus,
+    generate_strewn_field,
+    sweep_strewn_field,
+)
+from .surrogate import (
+    SURROGATE_PARAMETERS,
+    LandingSurrogate,
+    SurrogateValidation,
+    entry_velocity,
+)
+from .terminal import (
+    TerminalDescentComparison,
+    TerminalDescentPolicy,
+    TerminalDescentRecord,
+    compare_terminal_descent,
+    descend_at_terminal_speed,
+)
 
 __all__ = [
     "AtmosphericLevel",
     "AtmosphericProfile",
+    "CompiledAtmosphericProfile",
     "DarkflightEnvironment",
+    "CompiledDarkflightEnvironment",
     "run_trajectory",
+    "run_trajectory_batch",
+    "supports_batch",
+    "BatchTrajectoryResult",
     "TrajectoryResult",
+    "StateArray",
+    "STATE_COLUMNS",
     "TerminationReason",
+    "RecordingMode",
+    "RecordingPolicy",
+    "TrajectoryEvent",
+    "EventRecord",
+    "altitude_event",
+    "speed_event",
+    "mach_event",
     "find_mass_for_flight_time",
     "run_reverse_trajectory",
+    "run_reverse_trajectory_batch",
+    "TerminusEstimate",
     "calculate_simulated_terminus",
     "generate_strewn_field",
+    "sweep_strewn_field",
+    "FragmentHypothesis",
+    "StrewnFieldOutcome",
+    "StrewnFieldSweep",
+    "StrewnFieldTask",
+    "TerminalDescentPolicy",
+    "TerminalDescentRecord",
+    "TerminalDescentComparison",
+    "compare_terminal_descent",
+    "descend_at_terminal_speed",
+    "SliceTable",
+    "SliceRecord",
+    "SliceTrajectoryResult",
+    "run_slice_trajectory",
+    "TrajectoryCache",
+    "CacheStats",
+    "ballistic_coefficient",
+    "environment_fingerprint",
+    "LandingSurrogate",
+    "SurrogateValidation",
+    "SURROGATE_PARAMETERS",
+    "entry_velocity",
     "ExplicitEulerIntegrator",
 ]
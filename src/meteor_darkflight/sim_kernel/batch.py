@@ -0,0 +1,466 @@
+"""Batched structure-of-arrays trajectory engine for many fragments at once."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from meteor_darkflight.physics_core import (
+    EARTH_ROTATION_RATE_RAD_S,
+    CdTable,
+    ExplicitEulerIntegrator,
+    ForwardEulerIntegrator,
+    Integrator,
+    RungeKutta4Integrator,
+    State,
+    calculate_cube_cd_array,
+    calculate_sphere_cd_array,
+    cross_section_from_mass_density_array,
+    drag_force_array,
+)
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.integrator import TerminationReason, TrajectoryResult
+from meteor_darkflight.sim_kernel.storage import STATE_COLUMNS, StateArray
+
+# Rows of the integrated block: x, y, z, vx, vy, vz, mass (time is tracked separately).
+_X, _Y, _Z, _VX, _VY, _VZ, _M = range(7)
+
+Derivative = Callable[[np.ndarray], np.ndarray]
+
+
+def _as_fragment_array(value: float | Sequence[float] | np.ndarray | None, default: float, count: int) -> np.ndarray:
+    if value is None:
+        return np.full(count, default, dtype=float)
+    array = np.broadcast_to(np.asarray(value, dtype=float), (count,))
+    return np.array(array, dtype=float)
+
+
+def _mach_cd(drag_model: str, mach: np.ndarray, constant_cd: np.ndarray, cd_table: CdTable | None) -> np.ndarray:
+    if cd_table is not None:
+        return cd_table(mach)
+    if drag_model == "sphere":
+        return calculate_sphere_cd_array(mach)
+    if drag_model == "cube":
+        return calculate_cube_cd_array(mach)
+    return constant_cd
+
+
+class _BatchDarkflightEnvironment:
+    """Array counterpart of `DarkflightEnvironment` with per-fragment parameters."""
+
+    def __init__(
+        self,
+        env: DarkflightEnvironment,
+        fragment_density_kg_m3: np.ndarray,
+        drag_coefficient: np.ndarray,
+        shape_factor: np.ndarray,
+        cd_table: CdTable | None = None,
+    ) -> None:
+        if np.any(fragment_density_kg_m3 <= 0):
+            raise ValueError("fragment_density_kg_m3 must be positive")
+        self.env = env
+        self.profile = env.profile.compile()
+        self.fragment_density_kg_m3 = fragment_density_kg_m3
+        self.drag_coefficient = drag_coefficient
+        self.shape_factor = shape_factor
+        self.cd_table = cd_table
+        if env.latitude_deg != 0.0:
+            lat_rad = np.radians(env.latitude_deg)
+            self.coriolis: Tuple[float, float] | None = (
+                EARTH_ROTATION_RATE_RAD_S * float(np.cos(lat_rad)),
+                EARTH_ROTATION_RATE_RAD_S * float(np.sin(lat_rad)),
+            )
+        else:
+            self.coriolis = None
+
+    def derivative(self, block: np.ndarray, active: np.ndarray) -> np.ndarray:
+        """Return d/dt of the (7, n) state block for the fragments in ``active``."""
+
+        z = block[_Z]
+        vx, vy, vz = block[_VX], block[_VY], block[_VZ]
+        mass = block[_M]
+        altitude = np.maximum(z, 0.0)
+
+        density = self.profile.density_array(altitude)
+        if self.env.wind_model is not None:
+            winds = np.array([self.env.wind_model(float(value)) for value in z], dtype=float).reshape(-1, 3)
+            wind_u, wind_v, wind_w = winds[:, 0], winds[:, 1], winds[:, 2]
+        else:
+            wind_u, wind_v = self.profile.wind_array(altitude)
+            wind_w = np.zeros_like(z)
+
+        rel_x = vx - wind_u
+        rel_y = vy - wind_v
+        rel_z = vz - wind_w
+        speed = np.sqrt(rel_x**2 + rel_y**2 + rel_z**2)
+        speed_sound = self.profile.speed_of_sound_array(altitude)
+        mach = np.divide(speed, speed_sound, out=np.zeros_like(speed), where=speed_sound > 0)
+        cd = _mach_cd(self.env.drag_model, mach, self.drag_coefficient[active], self.cd_table)
+
+        area = cross_section_from_mass_density_array(np.maximum(mass, 0.0), self.fragment_density_kg_m3[active])
+        force = drag_force_array(speed, density, cd * self.shape_factor[active], area)
+        accel_mag = force / np.maximum(mass, 1e-9)
+        scale = np.divide(-accel_mag, speed, out=np.zeros_like(speed), where=speed > 0)
+
+        derivative = np.empty_like(block)
+        derivative[_X] = vx
+        derivative[_Y] = vy
+        derivative[_Z] = vz
+        derivative[_VX] = rel_x * scale
+        derivative[_VY] = rel_y * scale
+        derivative[_VZ] = rel_z * scale - self.env.gravity_mps2
+        if self.coriolis is not None:
+            wy, wz = self.coriolis
+            derivative[_VX] += -2.0 * (wy * vz - wz * vy)
+            derivative[_VY] += -2.0 * (wz * vx)
+            derivative[_VZ] += -2.0 * (-wy * vx)
+        if self.env.ablation is not None:
+            derivative[_M] = -self.env.ablation.k_ab * density * speed**3
+        else:
+            derivative[_M] = 0.0
+        return derivative
+
+
+def _euler_step(block: np.ndarray, dt: float, derivative: Derivative) -> Tuple[np.ndarray, np.ndarray]:
+    d = derivative(block)
+    out = np.empty_like(block)
+    out[_VX:_M] = block[_VX:_M] + d[_VX:_M] * dt
+    out[_X:_VX] = block[_X:_VX] + out[_VX:_M] * dt
+    out[_M] = np.maximum(block[_M] + d[_M] * dt, 0.0)
+    return out, d
+
+
+def _forward_euler_step(block: np.ndarray, dt: float, derivative: Derivative) -> Tuple[np.ndarray, np.ndarray]:
+    d = derivative(block)
+    out = block.copy()
+    out[_X:_M] += d[_X:_M] * dt
+    return out, d
+
+
+def _rk4_step(block: np.ndarray, dt: float, derivative: Derivative) -> Tuple[np.ndarray, np.ndarray]:
+    def combine(k: np.ndarray, scale: float) -> np.ndarray:
+        staged = block + k * dt * scale
+        staged[_M] = np.maximum(staged[_M], 0.0)
+        return staged
+
+    k1 = derivative(block)
+    k2 = derivative(combine(k1, 0.5))
+    k3 = derivative(combine(k2, 0.5))
+    k4 = derivative(combine(k3, 1.0))
+    out = block + (dt / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+    out[_M] = np.maximum(out[_M], 0.0)
+    return out, k1
+
+
+# Stepper plus whether ground contact is located on a cubic Hermite interpolant
+# (matching `RungeKutta4Integrator.step_dense`) rather than linearly.
+_BATCH_STEPPERS: dict[type, Tuple[Callable[[np.ndarray, float, Derivative], Tuple[np.ndarray, np.ndarray]], bool]] = {
+    ExplicitEulerIntegrator: (_euler_step, False),
+    ForwardEulerIntegrator: (_forward_euler_step, False),
+    RungeKutta4Integrator: (_rk4_step, True),
+}
+
+
+def supports_batch(integrator: Integrator) -> bool:
+    """Whether `run_trajectory_batch` has a stepper for ``integrator``."""
+
+    return type(integrator) in _BATCH_STEPPERS
+
+
+def _hermite_rows(
+    theta: np.ndarray,
+    dt: float,
+    prev: np.ndarray,
+    nxt: np.ndarray,
+    rate_prev: np.ndarray,
+    rate_next: np.ndarray,
+) -> np.ndarray:
+    theta2 = theta * theta
+    theta3 = theta2 * theta
+    h00 = 2.0 * theta3 - 3.0 * theta2 + 1.0
+    h10 = theta3 - 2.0 * theta2 + theta
+    h01 = -2.0 * theta3 + 3.0 * theta2
+    h11 = theta3 - theta2
+    return np.asarray(h00 * prev + h10 * dt * rate_prev + h01 * nxt + h11 * dt * rate_next)
+
+
+def _hermite_ground_rows(
+    prev_t: np.ndarray,
+    prev: np.ndarray,
+    next_t: np.ndarray,
+    nxt: np.ndarray,
+    dt: float,
+    rate_prev: np.ndarray,
+    rate_next: np.ndarray,
+    level: float = 0.0,
+    direction: int = -1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows where z crosses ``level`` on the cubic Hermite interpolant (bisection on z).
+
+    ``direction`` is -1 for a descending crossing and +1 for a rising one.
+    """
+
+    lo = np.zeros(prev.shape[1])
+    hi = np.ones(prev.shape[1])
+    for _ in range(60):
+        mid = 0.5 * (lo + hi)
+        z_mid = _hermite_rows(mid, dt, prev[_Z], nxt[_Z], rate_prev[_Z], rate_next[_Z])
+        before = direction * (z_mid - level) < 0.0
+        lo = np.where(before, mid, lo)
+        hi = np.where(before, hi, mid)
+    theta = 0.5 * (lo + hi)
+    rows = _hermite_rows(theta, dt, prev, nxt, rate_prev, rate_next)
+    rows[_M] = np.maximum(rows[_M], 0.0)
+    times = prev_t + theta * dt
+    past = direction * (prev[_Z] - level) >= 0.0
+    rows = np.where(past, nxt, rows)
+    times = np.where(past, next_t, times)
+    rows[_Z] = level
+    return times, rows
+
+
+def _ground_rows(
+    prev_t: np.ndarray,
+    prev: np.ndarray,
+    next_t: np.ndarray,
+    nxt: np.ndarray,
+    level: float = 0.0,
+    direction: int = -1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows where z crosses ``level``, from linear interpolation across the step."""
+
+    z0 = prev[_Z] - level
+    denominator = prev[_Z] - nxt[_Z]
+    safe = np.where(denominator != 0, denominator, 1.0)
+    alpha = np.clip(z0 / safe, 0.0, 1.0)
+    use_next = (direction * z0 >= 0) | (denominator == 0)
+    rows = np.where(use_next, nxt, prev + (nxt - prev) * alpha)
+    times = np.where(use_next, next_t, prev_t + (next_t - prev_t) * alpha)
+    rows[_Z] = level
+    return times, rows
+
+
+@dataclass(frozen=True)
+class BatchTrajectoryResult:
+    """Per-fragment outcome of `run_trajectory_batch` stored column-wise.
+
+    ``initial_states`` and ``final_states`` are ``(n, 8)`` arrays ordered as
+    `STATE_COLUMNS`. The final row is the interpolated ground-touch state for
+    impacting fragments and the last integrated state otherwise.
+    """
+
+    initial_states: np.ndarray
+    final_states: np.ndarray
+    termination_reasons: Tuple[TerminationReason, ...]
+    max_speed_mps: np.ndarray
+    steps: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.termination_reasons)
+
+    @property
+    def impacted(self) -> np.ndarray:
+        return np.array([reason is TerminationReason.GROUND for reason in self.termination_reasons], dtype=bool)
+
+    @property
+    def flight_time_s(self) -> np.ndarray:
+        return np.asarray(self.final_states[:, 0] - self.initial_states[:, 0])
+
+    @property
+    def horizontal_drift_m(self) -> np.ndarray:
+        return np.asarray(np.hypot(self.final_states[:, 1], self.final_states[:, 2]))
+
+    @property
+    def terminal_speed_mps(self) -> np.ndarray:
+        return np.asarray(np.sqrt(np.sum(self.final_states[:, 4:7] ** 2, axis=1)))
+
+    @property
+    def terminal_kinetic_energy_j(self) -> np.ndarray:
+        """Impact kinetic energy (J); NaN for fragments that did not reach ground."""
+
+        energy = 0.5 * self.final_states[:, 7] * self.terminal_speed_mps**2
+        return np.where(self.impacted, energy, np.nan)
+
+    def result(self, index: int) -> TrajectoryResult:
+        """Return fragment ``index`` as a `TrajectoryResult` (initial and final states only)."""
+
+        states = StateArray(np.stack((self.initial_states[index], self.final_states[index])))
+        initial, final = states
+        reason = self.termination_reasons[index]
+        impacted = reason is TerminationReason.GROUND
+        return TrajectoryResult(
+            states=states,
+            termination_reason=reason,
+            impact_state=final if impacted else None,
+            flight_time_s=final.t - initial.t,
+            max_speed_mps=float(self.max_speed_mps[index]),
+            horizontal_drift_m=final.horizontal_displacement(),
+            terminal_speed_mps=final.speed(),
+            terminal_kinetic_energy_j=0.5 * final.mass * final.speed() ** 2 if impacted else None,
+        )
+
+    def results(self) -> List[TrajectoryResult]:
+        return [self.result(index) for index in range(len(self))]
+
+
+def run_trajectory_batch(
+    initial_states: Sequence[State],
+    integrator: Integrator,
+    env: DarkflightEnvironment,
+    *,
+    dt: float = 0.5,
+    max_steps: int = 100_000,
+    stall_speed_mps: float = 1e-3,
+    fragment_density_kg_m3: float | Sequence[float] | np.ndarray | None = None,
+    drag_coefficient: float | Sequence[float] | np.ndarray | None = None,
+    shape_factor: float | Sequence[float] | np.ndarray | None = None,
+    cd_table: CdTable | None = None,
+    target_altitude_m: float | None = None,
+    target_direction: int = -1,
+) -> BatchTrajectoryResult:
+    """Integrate many fragments simultaneously until each lands, stalls or times out.
+
+    Fragments advance together as NumPy arrays and retire individually, so the
+    per-step cost is a handful of vector operations regardless of batch size.
+    Per-fragment ``fragment_density_kg_m3``, ``drag_coefficient`` and
+    ``shape_factor`` override the scalar values on ``env``; everything else
+    (profile, drag model, Coriolis, ablation) is shared. Termination rules match
+    `run_trajectory`. A ``cd_table`` replaces the drag-model Cd(Mach) curve with
+    a precomputed lookup.
+
+    With ``target_altitude_m``, fragments crossing that altitude (descending for
+    ``target_direction=-1``, rising for +1) stop there with
+    `TerminationReason.EVENT` and the crossing state as their final row,
+    matching `run_trajectory` with a terminal `altitude_event`. A negative
+    ``dt`` integrates backwards in time.
+    """
+
+    if target_altitude_m is not None and target_altitude_m <= 0:
+        raise ValueError("target_altitude_m must be above ground level")
+    if target_direction not in (-1, 1):
+        raise ValueError("target_direction must be -1 or 1")
+
+    if not supports_batch(integrator):
+        raise TypeError(f"No batched stepper available for {type(integrator).__name__}")
+    stepper, hermite = _BATCH_STEPPERS[type(integrator)]
+
+    count = len(initial_states)
+    initial = np.array(
+        [[getattr(state, column) for column in STATE_COLUMNS] for state in initial_states],
+        dtype=float,
+    ).reshape(count, len(STATE_COLUMNS))
+    batch_env = _BatchDarkflightEnvironment(
+        env,
+        _as_fragment_array(fragment_density_kg_m3, env.fragment_density_kg_m3, count),
+        _as_fragment_array(drag_coefficient, env.drag_coefficient, count),
+        _as_fragment_array(shape_factor, env.shape_factor, count),
+        cd_table,
+    )
+
+    final = initial.copy()
+    reasons: List[TerminationReason] = [TerminationReason.MAX_STEPS] * count
+    max_speed = np.sqrt(np.sum(initial[:, 4:7] ** 2, axis=1))
+    steps = np.zeros(count, dtype=np.int64)
+
+    active = np.arange(count)
+    times = initial[:, 0].copy()
+    block = initial[:, 1:].T.copy()
+
+    for step in range(1, max_steps + 1):
+        if active.size == 0:
+            break
+
+        current_active = active
+
+        def derivative(values: np.ndarray) -> np.ndarray:
+            return batch_env.derivative(values, current_active)
+
+        next_block, rate = stepper(block, dt, derivative)
+        next_times = times + dt
+        speed = np.sqrt(np.sum(next_block[_VX:_M] ** 2, axis=0))
+        max_speed[active] = np.maximum(max_speed[active], speed)
+
+        if target_altitude_m is not None:
+            before = target_direction * (block[_Z] - target_altitude_m) < 0.0
+            after = target_direction * (next_block[_Z] - target_altitude_m) >= 0.0
+            reached = before & after
+        else:
+            reached = np.zeros(active.size, dtype=bool)
+        grounded = ~reached & (next_block[_Z] <= 0.0)
+        stalled = ~reached & ~grounded & (speed <= stall_speed_mps)
+        if np.any(reached):
+            assert target_altitude_m is not None
+            indices = active[reached]
+            if hermite:
+                cross_times, cross_rows = _hermite_ground_rows(
+                    times[reached],
+                    block[:, reached],
+                    next_times[reached],
+                    next_block[:, reached],
+                    dt,
+                    rate[:, reached],
+                    batch_env.derivative(next_block[:, reached], indices),
+                    level=target_altitude_m,
+                    direction=target_direction,
+                )
+            else:
+                cross_times, cross_rows = _ground_rows(
+                    times[reached],
+                    block[:, reached],
+                    next_times[reached],
+                    next_block[:, reached],
+                    target_altitude_m,
+                    target_direction,
+                )
+            final[indices, 0] = cross_times
+            final[indices, 1:] = cross_rows.T
+            for index in indices:
+                reasons[index] = TerminationReason.EVENT
+        if np.any(grounded):
+            indices = active[grounded]
+            if hermite:
+                ground_times, ground_rows = _hermite_ground_rows(
+                    times[grounded],
+                    block[:, grounded],
+                    next_times[grounded],
+                    next_block[:, grounded],
+                    dt,
+                    rate[:, grounded],
+                    batch_env.derivative(next_block[:, grounded], indices),
+                )
+            else:
+                ground_times, ground_rows = _ground_rows(
+                    times[grounded], block[:, grounded], next_times[grounded], next_block[:, grounded]
+                )
+            final[indices, 0] = ground_times
+            final[indices, 1:] = ground_rows.T
+            for index in indices:
+                reasons[index] = TerminationReason.GROUND
+        if np.any(stalled):
+            indices = active[stalled]
+            final[indices, 0] = next_times[stalled]
+            final[indices, 1:] = next_block[:, stalled].T
+            for index in indices:
+                reasons[index] = TerminationReason.STALLED
+
+        retired = reached | grounded | stalled
+        steps[active[retired]] = step
+        keep = ~retired
+        active = active[keep]
+        times = next_times[keep]
+        block = next_block[:, keep]
+
+    if active.size:
+        final[active, 0] = times
+        final[active, 1:] = block.T
+        steps[active] = max_steps
+
+    return BatchTrajectoryResult(
+        initial_states=initial,
+        final_states=final,
+        termination_reasons=tuple(reasons),
+        max_speed_mps=max_speed,
+        steps=steps,
+    )
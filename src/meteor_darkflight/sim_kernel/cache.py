@@ -0,0 +1,315 @@
+"""Trajectory cache keyed by ballistic coefficient.
+
+Without ablation a fragment enters the equations of motion only through its
+ballistic coefficient ``m / (Cd·A·shape_factor)`` (with the drag model's
+Cd(Mach) curve shared by every fragment), and the environment does not depend
+on horizontal position or absolute time. Trajectories are therefore cached
+relative to their initial ``(t, x, y)`` under a key of the initial altitude and
+velocity, the quantised ballistic coefficient, the drag model, an environment
+fingerprint and the integration settings, and replayed for any fragment that
+maps to the same key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from math import log, log1p
+from pathlib import Path
+from typing import Any, Hashable, List, Tuple
+
+import numpy as np
+
+from meteor_darkflight.physics_core import Integrator, State, cross_section_from_mass_density
+from meteor_darkflight.physics_core.trajectory import IntegrationEnvironment
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.integrator import (
+    RecordingPolicy,
+    TerminationReason,
+    TrajectoryResult,
+)
+from meteor_darkflight.sim_kernel.storage import StateArray
+from meteor_darkflight.sim_kernel.terminal import TerminalDescentPolicy, TerminalDescentRecord
+
+# Parameters folded into the ballistic coefficient rather than the fingerprint.
+_FRAGMENT_FIELDS = {"fragment_density_kg_m3", "drag_coefficient", "shape_factor", "use_jit"}
+_MACH_DRAG_MODELS = {"sphere", "cube"}
+# Recent environments whose fingerprints are remembered by each cache.
+_FINGERPRINT_MEMO_SIZE = 16
+
+
+def ballistic_coefficient(mass_kg: float, env: DarkflightEnvironment) -> float:
+    """Return ``m / (Cd·A·shape_factor)`` (kg/m²), with Cd = 1 for Mach-dependent models."""
+
+    area = cross_section_from_mass_density(mass_kg, env.fragment_density_kg_m3)
+    cd = 1.0 if env.drag_model in _MACH_DRAG_MODELS else env.drag_coefficient
+    return mass_kg / (cd * env.shape_factor * area)
+
+
+def _fingerprinted_fields(env: DarkflightEnvironment) -> List[str]:
+    return [
+        spec.name
+        for spec in fields(env)
+        if spec.init and spec.name not in _FRAGMENT_FIELDS and spec.name != "profile"
+    ]
+
+
+def environment_fingerprint(env: DarkflightEnvironment) -> str:
+    """Content hash of everything in ``env`` except the fragment parameters."""
+
+    payload = [repr(getattr(env, name)) for name in _fingerprinted_fields(env)]
+    payload.extend(
+        repr((level.altitude_m, level.density_kg_m3, level.temperature_k, level.wind_u_mps, level.wind_v_mps))
+        for level in env.profile.levels
+    )
+    return hashlib.sha256("\n".join(payload).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class TrajectoryCache:
+    """LRU cache of trajectories with an optional on-disk tier.
+
+    ``ballistic_tolerance`` is the relative bin width used to quantise the
+    ballistic coefficient; fragments within a bin share one trajectory. Hits
+    are translated to the requested initial ``(t, x, y)`` and mass, so they
+    match a fresh integration to within rounding when the tolerance is tight.
+    With ``directory`` set, results are also written there as ``.npz`` files
+    and misses in memory are looked up on disk before integrating.
+
+    Environments with ablation or a custom ``wind_model``, and runs with
+    events, are not cacheable and bypass the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        directory: str | Path | None = None,
+        ballistic_tolerance: float = 1e-6,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ballistic_tolerance <= 0:
+            raise ValueError("ballistic_tolerance must be positive")
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._log_bin = log1p(ballistic_tolerance)
+        self._entries: "OrderedDict[Hashable, TrajectoryResult]" = OrderedDict()
+        self._fingerprints: List[Tuple[tuple, str]] = []
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, disk_hits=self.disk_hits, evictions=self.evictions)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the disk tier is left in place)."""
+
+        self._entries.clear()
+
+    def fingerprint(self, env: DarkflightEnvironment) -> str:
+        """`environment_fingerprint` of ``env``, memoised on its content.
+
+        The last few environments are remembered by value and compared by
+        equality rather than hashed: equal level tuples built from the same
+        level objects compare by identity, which is far cheaper than hashing
+        or fingerprinting the profile again.
+        """
+
+        content = (tuple(env.profile.levels), *(getattr(env, name) for name in _fingerprinted_fields(env)))
+        for known, digest in self._fingerprints:
+            if known == content:
+                return digest
+        digest = environment_fingerprint(env)
+        self._fingerprints.insert(0, (content, digest))
+        del self._fingerprints[_FINGERPRINT_MEMO_SIZE:]
+        return digest
+
+    def key(
+        self,
+        initial_state: State,
+        integrator: Integrator,
+        env: IntegrationEnvironment,
+        *,
+        dt: float,
+        max_steps: int,
+        stall_speed_mps: float,
+        recording: RecordingPolicy | None = None,
+        terminal_descent: TerminalDescentPolicy | None = None,
+        engine: str = "scalar",
+    ) -> Hashable | None:
+        """Return the cache key for a run, or None when it cannot be cached."""
+
+        if not isinstance(env, DarkflightEnvironment) or env.ablation is not None or env.wind_model is not None:
+            return None
+        if initial_state.mass <= 0:
+            return None
+        beta = ballistic_coefficient(initial_state.mass, env)
+        integrator_settings = tuple(
+            sorted(
+                (name, value)
+                for name, value in vars(integrator).items()
+                if not name.startswith("_") and isinstance(value, (int, float, str))
+            )
+        )
+        return (
+            engine,
+            self.fingerprint(env),
+            env.drag_model,
+            round(log(beta) / self._log_bin),
+            initial_state.z,
+            initial_state.vx,
+            initial_state.vy,
+            initial_state.vz,
+            type(integrator).__name__,
+            integrator_settings,
+            dt,
+            max_steps,
+            stall_speed_mps,
+            repr(recording or RecordingPolicy()),
+            repr(terminal_descent),
+        )
+
+    def get(self, key: Hashable, initial_state: State) -> TrajectoryResult | None:
+        """Return the cached trajectory replayed from ``initial_state``, counting the lookup."""
+
+        relative = self._entries.get(key)
+        if relative is not None:
+            self._entries.move_to_end(key)
+        else:
+            relative = self._load(key)
+            if relative is not None:
+                self.disk_hits += 1
+                self._remember(key, relative)
+        if relative is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _translate(relative, initial_state.t, initial_state.x, initial_state.y, initial_state.mass)
+
+    def put(self, key: Hashable, initial_state: State, result: TrajectoryResult) -> None:
+        """Store ``result`` (integrated from ``initial_state``) under ``key``."""
+
+        relative = _translate(result, -initial_state.t, -initial_state.x, -initial_state.y, initial_state.mass)
+        self._remember(key, relative)
+        if self.directory is not None:
+            self._save(key, relative)
+
+    def _remember(self, key: Hashable, relative: TrajectoryResult) -> None:
+        self._entries[key] = relative
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: Hashable) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{hashlib.sha256(repr(key).encode('utf-8')).hexdigest()}.npz"
+
+    def _save(self, key: Hashable, relative: TrajectoryResult) -> None:
+        descent = relative.terminal_descent
+        meta = {
+            "termination_reason": relative.termination_reason.value,
+            "max_speed_mps": relative.max_speed_mps,
+            "terminal_descent_step": descent.step if descent is not None else None,
+        }
+        descent_row = np.array(descent.state.as_tuple() if descent is not None else (), dtype=float)
+        path = self._path(key)
+        partial = path.with_suffix(".tmp.npz")
+        np.savez(partial, states=relative.states.data, descent=descent_row, meta=np.array(json.dumps(meta)))
+        partial.replace(path)
+
+    def _load(self, key: Hashable) -> TrajectoryResult | None:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as archive:
+            states = StateArray(archive["states"])
+            descent_row = archive["descent"]
+            meta: dict[str, Any] = json.loads(str(archive["meta"]))
+        step = meta["terminal_descent_step"]
+        descent = TerminalDescentRecord(step=step, state=State(*descent_row.tolist())) if step is not None else None
+        return _result_from_states(
+            states, TerminationReason(meta["termination_reason"]), float(meta["max_speed_mps"]), descent
+        )
+
+
+def replay(result: TrajectoryResult, source: State, target: State) -> TrajectoryResult:
+    """Move ``result``, integrated from ``source``, to start from ``target``.
+
+    Only valid when both states map to the same cache key.
+    """
+
+    return _translate(result, target.t - source.t, target.x - source.x, target.y - source.y, target.mass)
+
+
+def _translate(result: TrajectoryResult, dt: float, dx: float, dy: float, mass: float) -> TrajectoryResult:
+    data = result.states.data.copy()
+    data[:, 0] += dt
+    data[:, 1] += dx
+    data[:, 2] += dy
+    data[:, 7] = mass
+    descent = result.terminal_descent
+    if descent is not None:
+        shifted = descent.state
+        descent = TerminalDescentRecord(
+            step=descent.step,
+            state=shifted.with_updates(t=shifted.t + dt, x=shifted.x + dx, y=shifted.y + dy, mass=mass),
+        )
+    return _result_from_states(StateArray(data), result.termination_reason, result.max_speed_mps, descent)
+
+
+def _result_from_states(
+    states: StateArray,
+    reason: TerminationReason,
+    max_speed_mps: float,
+    descent: TerminalDescentRecord | None,
+) -> TrajectoryResult:
+    initial: State = states[0]
+    final: State = states[len(states) - 1]
+    impacted = reason is TerminationReason.GROUND
+    return TrajectoryResult(
+        states=states,
+        termination_reason=reason,
+        impact_state=final if impacted else None,
+        flight_time_s=final.t - initial.t,
+        max_speed_mps=max_speed_mps,
+        horizontal_drift_m=final.horizontal_displacement(),
+        terminal_speed_mps=final.speed(),
+        terminal_kinetic_energy_j=0.5 * final.mass * final.speed() ** 2 if impacted else None,
+        terminal_descent=descent,
+    )
+
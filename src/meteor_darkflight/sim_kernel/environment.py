@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from math import exp, log
+from bisect import bisect_left
+from dataclasses import dataclass, field, fields
+from math import cos, exp, hypot, log, radians, sin
 from typing import Callable, Iterable, List, Tuple
 
+import numpy as np
+
 from meteor_darkflight.physics_core import (
+    EARTH_ROTATION_RATE_RAD_S,
     DragParams,
     SimpleAblationParams,
     calculate_cube_cd,
@@ -17,7 +21,13 @@ from meteor_darkflight.physics_core import (
     simple_ablation_rate,
     speed_magnitude,
 )
-from meteor_darkflight.physics_core.trajectory import IntegrationEnvironment, State
+from meteor_darkflight.physics_core.trajectory import (
+    Derivative,
+    IntegrationEnvironment,
+    State,
+    StateVector,
+)
+from meteor_darkflight.sim_kernel.jit import NUMBA_AVAILABLE, JitDerivatives
 
 _R_SPECIFIC_DRY_AIR = 287.05  # J / (kg·K)
 
@@ -64,10 +74,14 @@ class AtmosphericProfile:
             return self.levels[0], self.levels[0]
         if altitude_m >= self.levels[-1].altitude_m:
             return self.levels[-1], self.levels[-1]
-        for lower, upper in zip(self.levels, self.levels[1:]):
-            if lower.altitude_m <= altitude_m <= upper.altitude_m:
-                return lower, upper
-        return self.levels[-1], self.levels[-1]
+        # First level at or above the query, i.e. the first bracket with lower <= z <= upper.
+        index = bisect_left(self.levels, altitude_m, key=lambda level: level.altitude_m)
+        return self.levels[index - 1], self.levels[index]
+
+    def compile(self, cells_per_level: int = 4) -> "CompiledAtmosphericProfile":
+        """Return a lookup-table snapshot of this profile for fast queries."""
+
+        return CompiledAtmosphericProfile(list(self.levels), cells_per_level=cells_per_level)
 
     def density(self, altitude_m: float) -> float:
         lower, upper = self._bracket(altitude_m)
@@ -104,6 +118,151 @@ class AtmosphericProfile:
         return float((1.4 * _R_SPECIFIC_DRY_AIR * temp_k) ** 0.5)
 
 
+@dataclass
+class CompiledAtmosphericProfile(AtmosphericProfile):
+    """Atmospheric profile with precomputed lookup tables.
+
+    Level columns (altitude, density, log-density, temperature, wind) are cached
+    as lists for scalar queries and NumPy arrays for vectorised ones. A uniform
+    altitude cell index maps any query to its bracketing levels in constant
+    expected time, and scalar results are bit-identical to `AtmosphericProfile`.
+    The tables are a snapshot: later edits to ``levels`` are not reflected.
+    """
+
+    cells_per_level: int = 4
+    _altitudes: List[float] = field(init=False, repr=False)
+    _densities: List[float] = field(init=False, repr=False)
+    _log_densities: List[float] = field(init=False, repr=False)
+    _log_valid: List[bool] = field(init=False, repr=False)
+    _temperatures: List[float] = field(init=False, repr=False)
+    _winds_u: List[float] = field(init=False, repr=False)
+    _winds_v: List[float] = field(init=False, repr=False)
+    _cell_start: List[int] = field(init=False, repr=False)
+    _inv_cell_m: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.levels:
+            raise ValueError("AtmosphericProfile requires at least one level")
+        if self.cells_per_level < 1:
+            raise ValueError("cells_per_level must be at least 1")
+        self.levels = sorted(self.levels, key=lambda level: level.altitude_m)
+        self._altitudes = [level.altitude_m for level in self.levels]
+        self._densities = [level.density_kg_m3 for level in self.levels]
+        self._log_densities = [log(d) if d > 0 else 0.0 for d in self._densities]
+        self._log_valid = [d > 0 for d in self._densities]
+        self._temperatures = [level.temperature_k for level in self.levels]
+        self._winds_u = [level.wind_u_mps for level in self.levels]
+        self._winds_v = [level.wind_v_mps for level in self.levels]
+
+        self.altitude_array = np.array(self._altitudes, dtype=float)
+        self.density_table = np.array(self._densities, dtype=float)
+        self.log_density_table = np.array(self._log_densities, dtype=float)
+        self.temperature_table = np.array(self._temperatures, dtype=float)
+        self.wind_u_table = np.array(self._winds_u, dtype=float)
+        self.wind_v_table = np.array(self._winds_v, dtype=float)
+
+        span = self._altitudes[-1] - self._altitudes[0]
+        cells = max(1, self.cells_per_level * (len(self._altitudes) - 1))
+        self._inv_cell_m = cells / span if span > 0 else 0.0
+        cell_m = span / cells
+        self._cell_start = [
+            max(1, bisect_left(self._altitudes, self._altitudes[0] + k * cell_m)) for k in range(cells)
+        ]
+
+    def _upper_index(self, altitude_m: float) -> int:
+        """Index of the first level strictly inside the profile with altitude >= query."""
+
+        altitudes = self._altitudes
+        cell = min(int((altitude_m - altitudes[0]) * self._inv_cell_m), len(self._cell_start) - 1)
+        index = self._cell_start[cell]
+        while altitudes[index] < altitude_m:
+            index += 1
+        while index > 1 and altitudes[index - 1] >= altitude_m:
+            index -= 1
+        return index
+
+    def _bracket(self, altitude_m: float) -> Tuple[AtmosphericLevel, AtmosphericLevel]:
+        if altitude_m <= self._altitudes[0]:
+            return self.levels[0], self.levels[0]
+        if altitude_m >= self._altitudes[-1]:
+            return self.levels[-1], self.levels[-1]
+        index = self._upper_index(altitude_m)
+        return self.levels[index - 1], self.levels[index]
+
+    def _locate(self, altitude_m: float) -> Tuple[int, int, float]:
+        """Return (lower, upper, frac) matching `_bracket` semantics."""
+
+        altitudes = self._altitudes
+        if altitude_m <= altitudes[0]:
+            return 0, 0, 0.0
+        if altitude_m >= altitudes[-1]:
+            last = len(altitudes) - 1
+            return last, last, 0.0
+        # Inlined `_upper_index`; this sits on the per-derivative hot path.
+        cell = min(int((altitude_m - altitudes[0]) * self._inv_cell_m), len(self._cell_start) - 1)
+        upper = self._cell_start[cell]
+        while altitudes[upper] < altitude_m:
+            upper += 1
+        while upper > 1 and altitudes[upper - 1] >= altitude_m:
+            upper -= 1
+        lower = upper - 1
+        return lower, upper, (altitude_m - altitudes[lower]) / (altitudes[upper] - altitudes[lower])
+
+    def compile(self, cells_per_level: int = 4) -> "CompiledAtmosphericProfile":
+        if cells_per_level == self.cells_per_level:
+            return self
+        return CompiledAtmosphericProfile(list(self.levels), cells_per_level=cells_per_level)
+
+    def density(self, altitude_m: float) -> float:
+        lower, upper, frac = self._locate(altitude_m)
+        if lower == upper:
+            return self._densities[lower]
+        if not (self._log_valid[lower] and self._log_valid[upper]):
+            return self._densities[lower] + frac * (self._densities[upper] - self._densities[lower])
+        return exp((1 - frac) * self._log_densities[lower] + frac * self._log_densities[upper])
+
+    def wind(self, altitude_m: float) -> Tuple[float, float, float]:
+        lower, upper, frac = self._locate(altitude_m)
+        if lower == upper:
+            return (self._winds_u[lower], self._winds_v[lower], 0.0)
+        u = self._winds_u[lower] + frac * (self._winds_u[upper] - self._winds_u[lower])
+        v = self._winds_v[lower] + frac * (self._winds_v[upper] - self._winds_v[lower])
+        return (u, v, 0.0)
+
+    def temperature(self, altitude_m: float) -> float:
+        lower, upper, frac = self._locate(altitude_m)
+        if lower == upper:
+            return self._temperatures[lower]
+        return self._temperatures[lower] + frac * (self._temperatures[upper] - self._temperatures[lower])
+
+    def density_array(self, altitude_m: np.ndarray) -> np.ndarray:
+        """Vectorised `density` for an array of altitudes."""
+
+        query = np.asarray(altitude_m, dtype=float)
+        if all(self._log_valid):
+            return np.asarray(np.exp(np.interp(query, self.altitude_array, self.log_density_table)))
+        return np.array([self.density(float(value)) for value in query.ravel()]).reshape(query.shape)
+
+    def wind_array(self, altitude_m: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorised horizontal wind components (u, v) for an array of altitudes."""
+
+        query = np.asarray(altitude_m, dtype=float)
+        u = np.interp(query, self.altitude_array, self.wind_u_table)
+        v = np.interp(query, self.altitude_array, self.wind_v_table)
+        return u, v
+
+    def temperature_array(self, altitude_m: np.ndarray) -> np.ndarray:
+        """Vectorised `temperature` for an array of altitudes."""
+
+        query = np.asarray(altitude_m, dtype=float)
+        return np.asarray(np.interp(query, self.altitude_array, self.temperature_table))
+
+    def speed_of_sound_array(self, altitude_m: np.ndarray) -> np.ndarray:
+        """Vectorised `speed_of_sound` for an array of altitudes."""
+
+        return np.asarray(np.sqrt(1.4 * _R_SPECIFIC_DRY_AIR * self.temperature_array(altitude_m)))
+
+
 @dataclass
 class DarkflightEnvironment(IntegrationEnvironment):
     """Environment bridging physics helpers with the integrator."""
@@ -118,19 +277,116 @@ class DarkflightEnvironment(IntegrationEnvironment):
     drag_model: str = "constant" # "constant", "sphere", "cube"
     ablation: SimpleAblationParams | None = None
     wind_model: Callable[[float], Tuple[float, float, float]] | None = None
+    use_jit: bool = True
+    _compiled: Tuple[tuple, "CompiledDarkflightEnvironment"] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _parameter_key(self) -> tuple:
+        # Identifies the configuration a cached compiled copy was built from. The levels are compared by content (cheaply, since equal
+        # tuples of the same level objects short-circuit on identity), so a
+        # replaced profile or an in-place edit of its levels is picked up.
+        return (
+            tuple(self.profile.levels),
+            self.latitude_deg,
+            self.magnetic_declination_deg,
+            self.gravity_mps2,
+            self.fragment_density_kg_m3,
+            self.drag_coefficient,
+            self.shape_factor,
+            self.drag_model,
+            self.ablation,
+            self.wind_model,
+            self.use_jit,
+        )
+
+    def compile(self) -> "CompiledDarkflightEnvironment":
+        """Return a specialised copy with per-call invariants precomputed.
+
+        The result is cached until a parameter changes, so calling this once per
+        trajectory is cheap. See `CompiledDarkflightEnvironment`.
+        """
+
+        key = self._parameter_key()
+        if self._compiled is None or self._compiled[0] != key:
+            values = {spec.name: getattr(self, spec.name) for spec in fields(self) if spec.init}
+            self._compiled = (key, CompiledDarkflightEnvironment(**values))
+        return self._compiled[1]
 
     def _drag_params(self, mass_kg: float, cd: float) -> DragParams:
         area = cross_section_from_mass_density(mass_kg, self.fragment_density_kg_m3)
         return DragParams(cd=cd * self.shape_factor, area_m2=area)
 
+    def derivatives(self, values: StateVector) -> Derivative:
+        """Return ``(vx, vy, vz, ax, ay, az, dm/dt)`` from a single atmosphere lookup.
+
+        Evaluates the Python helpers. The compiled environment from `compile`
+        (which `run_trajectory` uses) instead calls the numba kernel from
+        `meteor_darkflight.sim_kernel.jit`, resolved once when it is built, if
+        numba is installed, ``use_jit`` is set and the configuration is
+        supported (no custom ``wind_model``).
+        """
+
+        kernel = self._jit_kernel()
+        if kernel is not None:
+            return kernel(values)
+        _, _, _, z, vx, vy, vz, mass = values
+        altitude = max(z, 0.0)
+        density = self.profile.density(altitude)
+        wind = self.wind_model(z) if self.wind_model else self.profile.wind(altitude)
+        ax, ay, az = self._acceleration(altitude, vx, vy, vz, mass, density, wind)
+        return (vx, vy, vz, ax, ay, az, self._mass_rate(vx, vy, vz, density, wind))
+
+    def _jit_kernel(self) -> JitDerivatives | None:
+        # Parameters may change between calls; only a compiled snapshot has a kernel.
+        return None
+
     def acceleration(self, state: State) -> Tuple[float, float, float]:
         altitude = max(state.z, 0.0)
         density = self.profile.density(altitude)
         wind = self.wind_model(state.z) if self.wind_model else self.profile.wind(altitude)
+        return self._acceleration(altitude, state.vx, state.vy, state.vz, state.mass, density, wind)
 
+    def mass_derivative(self, state: State) -> float:
+        if not self.ablation:
+            return 0.0
+        altitude = max(state.z, 0.0)
+        density = self.profile.density(altitude)
+        wind = self.wind_model(state.z) if self.wind_model else self.profile.wind(altitude)
+        return self._mass_rate(state.vx, state.vy, state.vz, density, wind)
+
+    def acceleration_and_mass_rate(
+        self,
+        altitude_m: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        mass_kg: float,
+        density: float,
+        wind: Tuple[float, float, float],
+    ) -> Tuple[float, float, float, float]:
+        """Return ``(ax, ay, az, dm/dt)`` for the given air density and wind.
+
+        Unlike `acceleration` the atmosphere is not looked up, so callers can
+        evaluate the forces with their own (e.g. slice-averaged) air values.
+        """
+
+        ax, ay, az = self._acceleration(altitude_m, vx, vy, vz, mass_kg, density, wind)
+        return ax, ay, az, self._mass_rate(vx, vy, vz, density, wind)
+
+    def _acceleration(
+        self,
+        altitude: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        mass: float,
+        density: float,
+        wind: Tuple[float, float, float],
+    ) -> Tuple[float, float, float]:
         # Calculate Mach number
         speed_sound = self.profile.speed_of_sound(altitude)
-        rel_v = relative_velocity((state.vx, state.vy, state.vz), wind)
+        rel_v = relative_velocity((vx, vy, vz), wind)
         speed = speed_magnitude(rel_v)
         mach = speed / speed_sound if speed_sound > 0 else 0.0
 
@@ -143,37 +399,22 @@ class DarkflightEnvironment(IntegrationEnvironment):
             cd = self.drag_coefficient
 
         drag = drag_acceleration_vector(
-            (state.vx, state.vy, state.vz),
+            (vx, vy, vz),
             wind,
             density,
-            max(state.mass, 1e-9),
-            self._drag_params(max(state.mass, 0.0), cd),
+            max(mass, 1e-9),
+            self._drag_params(max(mass, 0.0), cd),
         )
 
-        # Coriolis Effect
-        # a_c = -2 * Omega x v
-        # Omega = [0, Omega * cos(lat), Omega * sin(lat)] (North-Up-East frame? No.)
-        # Standard ENU (East-North-Up):
-        # Omega vector at latitude phi:
-        # Omega_x = 0 (East)
-        # Omega_y = Omega * cos(phi) (North)
-        # Omega_z = Omega * sin(phi) (Up)
-        # v = [vx, vy, vz]
-        # Cross product:
-        # ax = -2 (Wy*vz - Wz*vy)
-        # ay = -2 (Wz*vx - Wx*vz)
-        # az = -2 (Wx*vy - Wy*vx)
-
         ax = drag[0]
         ay = drag[1]
         az = drag[2] - self.gravity_mps2
 
         if self.latitude_deg != 0.0:
-            from math import cos, radians, sin
-            omega = 7.2921159e-5  # Earth rotation rate rad/s
+            omega = EARTH_ROTATION_RATE_RAD_S
             lat_rad = radians(self.latitude_deg)
 
-            # Omega vector in ENU
+            # Omega vector in ENU (East-North-Up): (0, omega cos(lat), omega sin(lat))
             wy = omega * cos(lat_rad)
             wz = omega * sin(lat_rad)
 
@@ -183,11 +424,9 @@ class DarkflightEnvironment(IntegrationEnvironment):
             # y component: -2 * (wz*vx - 0)
             # z component: -2 * (0 - wy*vx)
 
-            ac_x = -2.0 * (wy * state.vz - wz * state.vy)
-            ac_y = -2.0 * (wz * state.vx)
-            ac_z = -2.0 * (-wy * state.vx)
-
-            # print(f"DEBUG: Coriolis ax={ac_x:.4f}, ay={ac_y:.4f}, az={ac_z:.4f}")
+            ac_x = -2.0 * (wy * vz - wz * vy)
+            ac_y = -2.0 * (wz * vx)
+            ac_z = -2.0 * (-wy * vx)
 
             ax += ac_x
             ay += ac_y
@@ -195,15 +434,98 @@ class DarkflightEnvironment(IntegrationEnvironment):
 
         return (ax, ay, az)
 
-    def mass_derivative(self, state: State) -> float:
+    def _mass_rate(
+        self, vx: float, vy: float, vz: float, density: float, wind: Tuple[float, float, float]
+    ) -> float:
         if not self.ablation:
             return 0.0
-        altitude = max(state.z, 0.0)
-        density = self.profile.density(altitude)
-        wind = self.wind_model(state.z) if self.wind_model else self.profile.wind(altitude)
-        rel_v = relative_velocity((state.vx, state.vy, state.vz), wind)
+        rel_v = relative_velocity((vx, vy, vz), wind)
         speed_sq = rel_v[0] ** 2 + rel_v[1] ** 2 + rel_v[2] ** 2
         if speed_sq == 0.0:
             return 0.0
         speed = speed_sq ** 0.5
         return simple_ablation_rate(density, speed, self.ablation)
+
+
+_CD_MODELS: dict[str, Callable[[float], float]] = {
+    "sphere": calculate_sphere_cd,
+    "cube": calculate_cube_cd,
+}
+
+
+@dataclass
+class CompiledDarkflightEnvironment(DarkflightEnvironment):
+    """`DarkflightEnvironment` with per-call invariants resolved up front.
+
+    The profile is compiled, the drag-model Cd function and the Coriolis
+    components are resolved once, and the cross-section of the last mass seen
+    is memoised (mass is constant without ablation). Results are bit-identical
+    to `DarkflightEnvironment`; like `CompiledAtmosphericProfile` it is a
+    snapshot of the source environment.
+    """
+
+    _cd_fn: Callable[[float], float] | None = field(init=False, repr=False, compare=False)
+    _coriolis: Tuple[float, float] | None = field(init=False, repr=False, compare=False)
+    _kernel: JitDerivatives | None = field(init=False, repr=False, compare=False)
+    _area_mass: float = field(default=-1.0, init=False, repr=False, compare=False)
+    _area: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.profile = self.profile.compile()
+        self._cd_fn = _CD_MODELS.get(self.drag_model)
+        if self.latitude_deg != 0.0:
+            lat_rad = radians(self.latitude_deg)
+            self._coriolis = (EARTH_ROTATION_RATE_RAD_S * cos(lat_rad), EARTH_ROTATION_RATE_RAD_S * sin(lat_rad))
+        else:
+            self._coriolis = None
+        supported = NUMBA_AVAILABLE and self.use_jit and JitDerivatives.supports(self)
+        self._kernel = JitDerivatives(self) if supported else None
+
+    def compile(self) -> "CompiledDarkflightEnvironment":
+        return self
+
+    def _jit_kernel(self) -> JitDerivatives | None:
+        return self._kernel
+
+    def _cross_section(self, mass_kg: float) -> float:
+        if mass_kg != self._area_mass:
+            self._area = cross_section_from_mass_density(mass_kg, self.fragment_density_kg_m3)
+            self._area_mass = mass_kg
+        return self._area
+
+    def _acceleration(
+        self,
+        altitude: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        mass: float,
+        density: float,
+        wind: Tuple[float, float, float],
+    ) -> Tuple[float, float, float]:
+        # Inlined `drag_acceleration_vector` with the same operation order.
+        rel_x = vx - wind[0]
+        rel_y = vy - wind[1]
+        rel_z = vz - wind[2]
+        speed = hypot(rel_x, rel_y, rel_z)
+        speed_sound = self.profile.speed_of_sound(altitude)
+        mach = speed / speed_sound if speed_sound > 0 else 0.0
+        cd = self._cd_fn(mach) if self._cd_fn is not None else self.drag_coefficient
+        area = self._cross_section(max(mass, 0.0))
+
+        if speed == 0.0:
+            ax = ay = az = 0.0
+        else:
+            force = 0.5 * density * speed**2 * (cd * self.shape_factor) * area
+            scale = -(force / max(mass, 1e-9)) / speed
+            ax = rel_x * scale
+            ay = rel_y * scale
+            az = rel_z * scale
+        az = az - self.gravity_mps2
+
+        if self._coriolis is not None:
+            wy, wz = self._coriolis
+            ax += -2.0 * (wy * vz - wz * vy)
+            ay += -2.0 * (wz * vx)
+            az += -2.0 * (-wy * vx)
+        return (ax, ay, az)
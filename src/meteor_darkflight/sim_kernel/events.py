@@ -0,0 +1,123 @@
+"""Trajectory events located by root finding on integrator dense output."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from meteor_darkflight.physics_core import State
+from meteor_darkflight.physics_core.trajectory import DenseOutput
+from meteor_darkflight.sim_kernel.environment import AtmosphericProfile
+
+
+@dataclass(frozen=True)
+class TrajectoryEvent:
+    """Zero crossing of ``function(state)`` to detect during integration.
+
+    ``direction`` restricts detection to falling (-1) or rising (+1)
+    crossings; 0 accepts either. Terminal events stop `run_trajectory`.
+    """
+
+    name: str
+    function: Callable[[State], float]
+    terminal: bool = True
+    direction: int = 0
+
+    def crossed(self, before: float, after: float) -> bool:
+        if before == 0.0:
+            return False
+        if self.direction <= 0 and before > 0.0 >= after:
+            return True
+        if self.direction >= 0 and before < 0.0 <= after:
+            return True
+        return False
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """Interpolated state at which an event fired."""
+
+    name: str
+    state: State
+
+
+def altitude_event(
+    altitude_m: float,
+    *,
+    direction: int = -1,
+    terminal: bool = True,
+    name: str | None = None,
+) -> TrajectoryEvent:
+    """Fire when the fragment crosses ``altitude_m`` (descending by default)."""
+
+    return TrajectoryEvent(
+        name=name or f"altitude_{altitude_m:g}m",
+        function=lambda state: state.z - altitude_m,
+        terminal=terminal,
+        direction=direction,
+    )
+
+
+def speed_event(
+    threshold_mps: float,
+    *,
+    direction: int = -1,
+    terminal: bool = True,
+    name: str | None = None,
+) -> TrajectoryEvent:
+    """Fire when ground-relative speed crosses ``threshold_mps`` (slowing by default)."""
+
+    return TrajectoryEvent(
+        name=name or f"speed_{threshold_mps:g}mps",
+        function=lambda state: state.speed() - threshold_mps,
+        terminal=terminal,
+        direction=direction,
+    )
+
+
+def mach_event(
+    profile: AtmosphericProfile,
+    mach: float = 1.0,
+    *,
+    direction: int = -1,
+    terminal: bool = False,
+    name: str | None = None,
+) -> TrajectoryEvent:
+    """Fire when the air-relative Mach number crosses ``mach`` (subsonic transition by default)."""
+
+    def mach_margin(state: State) -> float:
+        altitude = max(state.z, 0.0)
+        wind_u, wind_v, wind_w = profile.wind(altitude)
+        rel_speed = ((state.vx - wind_u) ** 2 + (state.vy - wind_v) ** 2 + (state.vz - wind_w) ** 2) ** 0.5
+        return float(rel_speed / profile.speed_of_sound(altitude) - mach)
+
+    return TrajectoryEvent(
+        name=name or f"mach_{mach:g}",
+        function=mach_margin,
+        terminal=terminal,
+        direction=direction,
+    )
+
+
+def locate_root(
+    dense: DenseOutput,
+    function: Callable[[State], float],
+    *,
+    xtol: float = 1e-9,
+) -> float:
+    """Return the time within ``dense`` where ``function`` changes sign."""
+
+    from scipy.optimize import brentq  # type: ignore
+
+    f_start = function(dense(dense.t0))
+    f_end = function(dense(dense.t1))
+    if f_end == 0.0:
+        return dense.t1
+    if f_start == 0.0:
+        return dense.t0
+    if f_start * f_end > 0:
+        # The interpolant endpoints differ from the step endpoints only by
+        # rounding, so a missing sign change means the crossing is at the end.
+        return dense.t1
+    lo, hi = sorted((dense.t0, dense.t1))
+    return float(brentq(lambda t: function(dense(t)), lo, hi, xtol=xtol))
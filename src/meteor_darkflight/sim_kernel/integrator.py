@@ -2,25 +2,145 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Sequence
+from math import sqrt
+from typing import TYPE_CHECKING, Callable, List, Sequence, Tuple
 
-from meteor_darkflight.physics_core import Integrator, State
-from meteor_darkflight.physics_core.trajectory import IntegrationEnvironment
+import numpy as np
+
+from meteor_darkflight.physics_core import AdaptiveIntegrator, Integrator, State
+from meteor_darkflight.physics_core.trajectory import (
+    DenseOutput,
+    Derivative,
+    IntegrationEnvironment,
+    StateVector,
+    derivative_function,
+)
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.events import EventRecord, TrajectoryEvent, locate_root
+from meteor_darkflight.sim_kernel.storage import StateArray
+from meteor_darkflight.sim_kernel.terminal import (
+    TerminalDescentPolicy,
+    TerminalDescentRecord,
+    descend_at_terminal_speed,
+    interpolate_altitudes,
+)
+
+if TYPE_CHECKING:
+    from meteor_darkflight.sim_kernel.cache import TrajectoryCache
 
 
 class TerminationReason(str, Enum):
     GROUND = "ground"
     MAX_STEPS = "max_steps"
     STALLED = "stalled"
+    EVENT = "event"
+
+
+class RecordingMode(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+    DECIMATED = "decimated"
+    ALTITUDE_SLICES = "altitude_slices"
+
+
+@dataclass(frozen=True)
+class RecordingPolicy:
+    """Select which states `run_trajectory` keeps on `TrajectoryResult.states`.
+
+    The initial and final states are always kept; summary metrics are tracked
+    on every step regardless of the policy.
+    """
+
+    mode: RecordingMode = RecordingMode.FULL
+    every_n_steps: int = 1
+    altitudes_m: Tuple[float, ...] = field(default=())
+
+    def __post_init__(self) -> None:
+        if self.every_n_steps < 1:
+            raise ValueError("every_n_steps must be at least 1")
+        if self.mode is RecordingMode.ALTITUDE_SLICES and not self.altitudes_m:
+            raise ValueError("altitude slice recording requires at least one altitude")
+        object.__setattr__(self, "altitudes_m", tuple(sorted(float(z) for z in self.altitudes_m)))
+
+    @classmethod
+    def full(cls) -> "RecordingPolicy":
+        return cls()
+
+    @classmethod
+    def summary(cls) -> "RecordingPolicy":
+        """Keep only the initial and final (impact/event/last) states."""
+
+        return cls(mode=RecordingMode.SUMMARY)
+
+    @classmethod
+    def every(cls, n_steps: int) -> "RecordingPolicy":
+        """Keep every ``n_steps``-th integrator step."""
+
+        return cls(mode=RecordingMode.DECIMATED, every_n_steps=n_steps)
+
+    @classmethod
+    def altitude_slices(cls, altitudes_m: Sequence[float]) -> "RecordingPolicy":
+        """Keep states interpolated onto the given altitudes as they are crossed."""
+
+        return cls(mode=RecordingMode.ALTITUDE_SLICES, altitudes_m=tuple(altitudes_m))
+
+    @classmethod
+    def altitude_spacing(cls, spacing_m: float, top_m: float) -> "RecordingPolicy":
+        """Keep a state every ``spacing_m`` metres of altitude below ``top_m``."""
+
+        if spacing_m <= 0:
+            raise ValueError("spacing_m must be positive")
+        count = int(top_m // spacing_m)
+        return cls.altitude_slices([spacing_m * (index + 1) for index in range(count)])
+
+    def records_step(self, step: int) -> bool:
+        """Return whether accepted, non-final step number ``step`` is kept."""
+
+        if self.mode is RecordingMode.FULL:
+            return True
+        if self.mode is RecordingMode.DECIMATED:
+            return step % self.every_n_steps == 0
+        return False
+
+    def crossed_altitudes(self, z_prev: float, z_next: float) -> Tuple[float, ...]:
+        """Return the slice altitudes crossed between ``z_prev`` and ``z_next``, in crossing order."""
+
+        if self.mode is not RecordingMode.ALTITUDE_SLICES:
+            return ()
+        if z_next < z_prev:
+            crossed = self.altitudes_m[bisect_left(self.altitudes_m, z_next) : bisect_left(self.altitudes_m, z_prev)]
+            return tuple(reversed(crossed))
+        return self.altitudes_m[bisect_right(self.altitudes_m, z_prev) : bisect_right(self.altitudes_m, z_next)]
+
+    @staticmethod
+    def slice_states(crossed: Sequence[float], dense: DenseOutput) -> List[State]:
+        """Interpolate a step onto each of the ``crossed`` altitudes."""
+
+        states: List[State] = []
+        for altitude in crossed:
+            t_slice = locate_root(dense, _altitude_offset(altitude))
+            states.append(dense(t_slice).with_updates(z=altitude))
+        return states
+
+
+def _altitude_offset(altitude_m: float) -> Callable[[State], float]:
+    return lambda state: state.z - altitude_m
 
 
 @dataclass(frozen=True)
 class TrajectoryResult:
-    """Bundle simulation output and derived metrics."""
+    """Bundle simulation output and derived metrics.
 
-    states: Sequence[State]
+    ``states`` is packed into a `StateArray` on construction; the column
+    properties (``result.z``, ``result.vx``, ...) are zero-copy views of it.
+    ``terminal_descent`` records where the terminal-velocity fast path took
+    over, if it did.
+    """
+
+    states: StateArray
     termination_reason: TerminationReason
     impact_state: State | None
     flight_time_s: float
@@ -28,6 +148,44 @@ class TrajectoryResult:
     horizontal_drift_m: float
     terminal_speed_mps: float
     terminal_kinetic_energy_j: float | None
+    events: Tuple[EventRecord, ...] = ()
+    terminal_descent: TerminalDescentRecord | None = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.states, StateArray):
+            object.__setattr__(self, "states", StateArray.from_states(self.states))
+
+    @property
+    def t(self) -> np.ndarray:
+        return self.states.t
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.states.x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.states.y
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.states.z
+
+    @property
+    def vx(self) -> np.ndarray:
+        return self.states.vx
+
+    @property
+    def vy(self) -> np.ndarray:
+        return self.states.vy
+
+    @property
+    def vz(self) -> np.ndarray:
+        return self.states.vz
+
+    @property
+    def mass(self) -> np.ndarray:
+        return self.states.mass
 
     def as_dict(self) -> dict[str, float]:
         """Return summary metrics for downstream parity comparisons."""
@@ -41,35 +199,16 @@ class TrajectoryResult:
         }
 
 
-def _interpolate_state(prev_state: State, next_state: State) -> State:
-    """Interpolate linearly in time to locate the ground-touch state."""
+_FULL_RECORDING = RecordingPolicy()
 
-    if prev_state.z <= 0 <= next_state.z:
-        # Already straddled ground but previous state is underground; swap.
-        prev_state, next_state = next_state, prev_state
 
-    if prev_state.z <= 0 and next_state.z <= 0:
-        return next_state.with_updates(z=0.0)
+def _ground_state(prev_state: State, next_state: State, dense: DenseOutput) -> State:
+    """Locate the ground-touch state by root finding on the step interpolant."""
 
-    denominator = prev_state.z - next_state.z
-    if denominator == 0:
+    if prev_state.z <= 0:
         return next_state.with_updates(z=0.0)
-
-    alpha = max(0.0, min(1.0, prev_state.z / denominator))
-
-    def lerp(a: float, b: float) -> float:
-        return a + (b - a) * alpha
-
-    return prev_state.with_updates(
-        t=lerp(prev_state.t, next_state.t),
-        x=lerp(prev_state.x, next_state.x),
-        y=lerp(prev_state.y, next_state.y),
-        z=0.0,
-        vx=lerp(prev_state.vx, next_state.vx),
-        vy=lerp(prev_state.vy, next_state.vy),
-        vz=lerp(prev_state.vz, next_state.vz),
-        mass=lerp(prev_state.mass, next_state.mass),
-    )
+    t_ground = locate_root(dense, lambda state: state.z)
+    return dense(t_ground).with_updates(z=0.0)
 
 
 def run_trajectory(
@@ -80,55 +219,244 @@ def run_trajectory(
     dt: float = 0.5,
     max_steps: int = 100_000,
     stall_speed_mps: float = 1e-3,
+    events: Sequence[TrajectoryEvent] = (),
+    recording: RecordingPolicy | None = None,
+    terminal_descent: TerminalDescentPolicy | None = None,
+    cache: "TrajectoryCache | None" = None,
 ) -> TrajectoryResult:
-    """Integrate trajectory steps until ground intersection or timeout."""
+    """Integrate trajectory steps until ground intersection or timeout.
+
+    With an `AdaptiveIntegrator`, ``dt`` is only the initial trial step and
+    ``max_steps`` counts accepted steps. Ground contact and any ``events`` are
+    located on the integrator's dense output rather than the step endpoints;
+    fired events are returned on the result and a terminal event stops the run
+    with `TerminationReason.EVENT`. A negative ``dt`` integrates backwards.
+
+    ``recording`` controls which intermediate states are kept (every step by
+    default); the summary metrics are exact under every policy. A
+    `DarkflightEnvironment` is compiled (see `DarkflightEnvironment.compile`)
+    before integrating.
+
+    ``terminal_descent`` opts into finishing the fall with the quasi-steady
+    terminal-velocity model (see `meteor_darkflight.sim_kernel.terminal`) once
+    the fragment has settled; use `compare_terminal_descent` to measure the
+    resulting error for a given case.
 
-    states: List[State] = [initial_state]
-    current = initial_state
+    With a ``cache`` (see `meteor_darkflight.sim_kernel.cache`), a run whose
+    fragment and settings map to a cached trajectory is replayed from it
+    instead of integrated; runs with events are never cached.
+    """
+
+    if cache is not None and not events:
+        key = cache.key(
+            initial_state,
+            integrator,
+            env,
+            dt=dt,
+            max_steps=max_steps,
+            stall_speed_mps=stall_speed_mps,
+            recording=recording,
+            terminal_descent=terminal_descent,
+        )
+        if key is not None:
+            cached = cache.get(key, initial_state)
+            if cached is not None:
+                return cached
+            result = run_trajectory(
+                initial_state,
+                integrator,
+                env,
+                dt=dt,
+                max_steps=max_steps,
+                stall_speed_mps=stall_speed_mps,
+                recording=recording,
+                terminal_descent=terminal_descent,
+            )
+            cache.put(key, initial_state, result)
+            return result
+
+    if terminal_descent is not None:
+        if not isinstance(env, DarkflightEnvironment):
+            raise TypeError("terminal_descent requires a DarkflightEnvironment")
+        if events:
+            raise ValueError("terminal_descent cannot be combined with events")
+        if dt < 0:
+            raise ValueError("terminal_descent requires forward integration")
+    if isinstance(env, DarkflightEnvironment):
+        env = env.compile()
+
+    policy = recording or _FULL_RECORDING
+    derivatives = derivative_function(env)
+    adaptive = integrator if isinstance(integrator, AdaptiveIntegrator) else None
+    # The interpolant of a step is normally built from its endpoints; only an
+    # integrator with a custom `step_dense` but no `dense_output` is re-stepped.
+    restep_dense = (
+        type(integrator).step_dense is not Integrator.step_dense
+        and type(integrator).dense_output is Integrator.dense_output
+    )
+    records: List[EventRecord] = []
+    event_values = [event.function(initial_state) for event in events]
+
+    # Steps run on flat tuples; `State` objects are only built when events,
+    # interpolation or the final result need them.
+    values = initial_state.as_tuple()
+    current: State | None = initial_state
+    rows: List[StateVector] = [values]
     max_speed = initial_state.speed()
+    settled_steps = 0
+    start_rate: Derivative | None = None
 
-    for _ in range(max_steps):
-        next_state = integrator.step(current, dt, env)
-        max_speed = max(max_speed, next_state.speed())
+    for step in range(1, max_steps + 1):
+        next_state: State | None = None
+        dense: DenseOutput | None = None
+        if adaptive is not None:
+            assert current is not None
+            next_state, _, dt, dense = adaptive.adaptive_step_dense(current, dt, env, start_rate=start_rate)
+            start_rate = dense.end_rate
+            next_values = next_state.as_tuple()
+        else:
+            next_values = integrator.advance(values, dt, derivatives)
+        speed = sqrt(next_values[4] ** 2 + next_values[5] ** 2 + next_values[6] ** 2)
+        max_speed = max(max_speed, speed)
+        forward = next_values[0] >= values[0]
+        crossed = policy.crossed_altitudes(values[3], next_values[3])
 
-        if next_state.z <= 0.0:
-            impact_state = _interpolate_state(current, next_state)
-            states.append(impact_state)
-            return TrajectoryResult(
-                states=tuple(states),
-                termination_reason=TerminationReason.GROUND,
-                impact_state=impact_state,
-                flight_time_s=impact_state.t - initial_state.t,
-                max_speed_mps=max_speed,
-                horizontal_drift_m=impact_state.horizontal_displacement(),
-                terminal_speed_mps=impact_state.speed(),
-                terminal_kinetic_energy_j=0.5
-                * impact_state.mass
-                * impact_state.speed() ** 2,
+        candidates: List[TrajectoryEvent] = []
+        if events:
+            if next_state is None:
+                next_state = State(*next_values)
+            next_event_values = [event.function(next_state) for event in events]
+            candidates = [
+                event
+                for event, before, after in zip(events, event_values, next_event_values)
+                if event.crossed(before, after)
+            ]
+            event_values = next_event_values
+
+        if dense is None and (next_values[3] <= 0.0 or crossed or candidates):
+            if current is None:
+                current = State(*values)
+            if restep_dense:
+                next_state, dense = integrator.step_dense(current, dt, env)
+            else:
+                if next_state is None:
+                    next_state = State(*next_values)
+                dense = integrator.dense_output(current, next_state, env)
+
+        if dense is not None:
+            assert current is not None and next_state is not None
+            impact_state = _ground_state(current, next_state, dense) if next_values[3] <= 0.0 else None
+            fired = sorted(
+                ((locate_root(dense, event.function), event) for event in candidates),
+                key=lambda item: item[0] if forward else -item[0],
             )
+            for t_event, event in fired:
+                if impact_state is not None and (t_event > impact_state.t if forward else t_event < impact_state.t):
+                    break
+                event_state = dense(t_event)
+                records.append(EventRecord(name=event.name, state=event_state))
+                if event.terminal:
+                    forward_sign = 1.0 if forward else -1.0
+                    rows.extend(
+                        state.as_tuple()
+                        for state in policy.slice_states(crossed, dense)
+                        if forward_sign * (state.t - t_event) < 0.0
+                    )
+                    rows.append(event_state.as_tuple())
+                    return TrajectoryResult(
+                        states=StateArray.from_rows(rows),
+                        termination_reason=TerminationReason.EVENT,
+                        impact_state=None,
+                        flight_time_s=event_state.t - initial_state.t,
+                        max_speed_mps=max_speed,
+                        horizontal_drift_m=event_state.horizontal_displacement(),
+                        terminal_speed_mps=event_state.speed(),
+                        terminal_kinetic_energy_j=None,
+                        events=tuple(records),
+                    )
 
-        states.append(next_state)
-        current = next_state
+            if impact_state is not None:
+                rows.extend(state.as_tuple() for state in policy.slice_states(crossed, dense) if state.z > 0.0)
+                rows.append(impact_state.as_tuple())
+                return TrajectoryResult(
+                    states=StateArray.from_rows(rows),
+                    termination_reason=TerminationReason.GROUND,
+                    impact_state=impact_state,
+                    flight_time_s=impact_state.t - initial_state.t,
+                    max_speed_mps=max_speed,
+                    horizontal_drift_m=impact_state.horizontal_displacement(),
+                    terminal_speed_mps=impact_state.speed(),
+                    terminal_kinetic_energy_j=0.5
+                    * impact_state.mass
+                    * impact_state.speed() ** 2,
+                    events=tuple(records),
+                )
+
+            rows.extend(state.as_tuple() for state in policy.slice_states(crossed, dense))
 
-        if next_state.speed() <= stall_speed_mps:
+        if speed <= stall_speed_mps:
+            final = next_state if next_state is not None else State(*next_values)
+            rows.append(next_values)
             return TrajectoryResult(
-                states=tuple(states),
+                states=StateArray.from_rows(rows),
                 termination_reason=TerminationReason.STALLED,
                 impact_state=None,
-                flight_time_s=current.t - initial_state.t,
+                flight_time_s=final.t - initial_state.t,
                 max_speed_mps=max_speed,
-                horizontal_drift_m=current.horizontal_displacement(),
-                terminal_speed_mps=current.speed(),
+                horizontal_drift_m=final.horizontal_displacement(),
+                terminal_speed_mps=final.speed(),
                 terminal_kinetic_energy_j=None,
+                events=tuple(records),
             )
 
+        if terminal_descent is not None and 0.0 < next_values[3] <= terminal_descent.max_altitude_m:
+            acceleration = sqrt(
+                (next_values[4] - values[4]) ** 2
+                + (next_values[5] - values[5]) ** 2
+                + (next_values[6] - values[6]) ** 2
+            ) / abs(next_values[0] - values[0])
+            settled_steps = settled_steps + 1 if acceleration <= terminal_descent.acceleration_threshold_mps2 else 0
+            if settled_steps >= terminal_descent.settle_steps:
+                assert isinstance(env, DarkflightEnvironment)
+                engaged = next_state if next_state is not None else State(*next_values)
+                descent = descend_at_terminal_speed(engaged, env, altitude_step_m=terminal_descent.altitude_step_m)
+                rows.append(next_values)
+                if policy.mode is RecordingMode.FULL:
+                    rows.extend(descent.data[1:-1].tolist())
+                else:
+                    slices = policy.crossed_altitudes(next_values[3], 0.0)
+                    rows.extend(interpolate_altitudes(descent, [z for z in slices if z > 0.0]).data.tolist())
+                impact_state = descent[len(descent) - 1]
+                rows.append(impact_state.as_tuple())
+                return TrajectoryResult(
+                    states=StateArray.from_rows(rows),
+                    termination_reason=TerminationReason.GROUND,
+                    impact_state=impact_state,
+                    flight_time_s=impact_state.t - initial_state.t,
+                    max_speed_mps=max(max_speed, float(descent.speed().max())),
+                    horizontal_drift_m=impact_state.horizontal_displacement(),
+                    terminal_speed_mps=impact_state.speed(),
+                    terminal_kinetic_energy_j=0.5 * impact_state.mass * impact_state.speed() ** 2,
+                    events=tuple(records),
+                    terminal_descent=TerminalDescentRecord(step=step, state=engaged),
+                )
+
+        if policy.records_step(step):
+            rows.append(next_values)
+        values = next_values
+        current = next_state
+
+    final = current if current is not None else State(*values)
+    if rows[-1] is not values:
+        rows.append(values)
     return TrajectoryResult(
-        states=tuple(states),
+        states=StateArray.from_rows(rows),
         termination_reason=TerminationReason.MAX_STEPS,
         impact_state=None,
-        flight_time_s=current.t - initial_state.t,
+        flight_time_s=final.t - initial_state.t,
         max_speed_mps=max_speed,
-        horizontal_drift_m=current.horizontal_displacement(),
-        terminal_speed_mps=current.speed(),
+        horizontal_drift_m=final.horizontal_displacement(),
+        terminal_speed_mps=final.speed(),
         terminal_kinetic_energy_j=None,
+        events=tuple(records),
     )
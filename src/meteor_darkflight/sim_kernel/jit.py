@@ -0,0 +1,228 @@
+"""Optional numba-compiled darkflight derivative kernel.
+
+The kernel mirrors `DarkflightEnvironment.derivatives` (atmosphere
+interpolation, Mach-dependent Cd, drag, Coriolis and simple ablation) in
+scalar code numba can compile. Without numba the decorator is a no-op and
+`DarkflightEnvironment` keeps using its Python path; the kernel functions
+still run interpreted, which is how the parity tests exercise them.
+"""
+
+from __future__ import annotations
+
+from math import cos, exp, log, pi, pow, radians, sin, sqrt
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+
+from meteor_darkflight.physics_core.trajectory import (
+    EARTH_ROTATION_RATE_RAD_S,
+    Derivative,
+    StateVector,
+)
+
+try:  # pragma: no cover - depends on the optional "speed" extra
+    from numba import njit as _njit  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    _njit = None
+    NUMBA_AVAILABLE = False
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_R_SPECIFIC_DRY_AIR = 287.05  # J / (kg·K)
+
+DRAG_MODEL_CODES = {"constant": 0, "sphere": 1, "cube": 2}
+
+
+def jit(function: _F) -> _F:
+    """Compile ``function`` with numba in nopython mode when it is installed."""
+
+    if _njit is None:
+        return function
+    return _njit(cache=True, fastmath=False)(function)  # type: ignore[no-any-return]
+
+
+@jit
+def _bracket(altitudes: np.ndarray, z: float) -> tuple[int, int, float]:
+    count = altitudes.shape[0]
+    if z <= altitudes[0]:
+        return 0, 0, 0.0
+    if z >= altitudes[count - 1]:
+        return count - 1, count - 1, 0.0
+    lo = 0
+    hi = count - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if altitudes[mid] < z:
+            lo = mid
+        else:
+            hi = mid
+    return lo, hi, (z - altitudes[lo]) / (altitudes[hi] - altitudes[lo])
+
+
+@jit
+def atmosphere(
+    z: float,
+    altitudes: np.ndarray,
+    densities: np.ndarray,
+    temperatures: np.ndarray,
+    winds_u: np.ndarray,
+    winds_v: np.ndarray,
+) -> tuple[float, float, float, float]:
+    """Return ``(density, wind_u, wind_v, temperature)`` interpolated at ``z``."""
+
+    lower, upper, frac = _bracket(altitudes, z)
+    if lower == upper:
+        return densities[lower], winds_u[lower], winds_v[lower], temperatures[lower]
+    d0 = densities[lower]
+    d1 = densities[upper]
+    if d0 <= 0.0 or d1 <= 0.0:
+        density = d0 + frac * (d1 - d0)
+    else:
+        density = exp((1 - frac) * log(d0) + frac * log(d1))
+    wind_u = winds_u[lower] + frac * (winds_u[upper] - winds_u[lower])
+    wind_v = winds_v[lower] + frac * (winds_v[upper] - winds_v[lower])
+    temperature = temperatures[lower] + frac * (temperatures[upper] - temperatures[lower])
+    return density, wind_u, wind_v, temperature
+
+
+@jit
+def drag_coefficient(drag_code: int, mach: float, constant_cd: float) -> float:
+    """Return Cd for drag model code 0 (constant), 1 (sphere) or 2 (cube)."""
+
+    if drag_code == 1:
+        if mach <= 0.722:
+            return 0.45 * mach**2 + 0.424
+        return 2.1 * exp(-1.2 * (mach + 0.35)) - 8.9 * exp(-2.2 * (mach + 0.35)) + 0.92
+    if drag_code == 2:
+        if mach <= 1.150:
+            return 0.60 * mach**2 + 1.04
+        return 2.1 * exp(-1.16 * (mach + 0.35)) - 6.5 * exp(-2.23 * (mach + 0.35)) + 1.67
+    return constant_cd
+
+
+@jit
+def darkflight_derivatives(
+    z: float,
+    vx: float,
+    vy: float,
+    vz: float,
+    mass: float,
+    altitudes: np.ndarray,
+    densities: np.ndarray,
+    temperatures: np.ndarray,
+    winds_u: np.ndarray,
+    winds_v: np.ndarray,
+    gravity: float,
+    fragment_density: float,
+    constant_cd: float,
+    shape_factor: float,
+    drag_code: int,
+    coriolis_wy: float,
+    coriolis_wz: float,
+    k_ab: float,
+) -> tuple[float, float, float, float, float, float, float]:
+    """Return ``(vx, vy, vz, ax, ay, az, dm/dt)`` for one fragment state."""
+
+    altitude = max(z, 0.0)
+    density, wind_u, wind_v, temperature = atmosphere(altitude, altitudes, densities, temperatures, winds_u, winds_v)
+    rel_x = vx - wind_u
+    rel_y = vy - wind_v
+    rel_z = vz
+    speed = sqrt(rel_x * rel_x + rel_y * rel_y + rel_z * rel_z)
+
+    speed_sound = (1.4 * _R_SPECIFIC_DRY_AIR * temperature) ** 0.5
+    mach = speed / speed_sound if speed_sound > 0 else 0.0
+    cd = drag_coefficient(drag_code, mach, constant_cd)
+
+    ax = 0.0
+    ay = 0.0
+    az = 0.0
+    if speed != 0.0:
+        volume = max(mass, 0.0) / fragment_density
+        radius = pow((3.0 * volume) / (4.0 * pi), 1.0 / 3.0)
+        area = pi * radius**2
+        force = 0.5 * density * speed**2 * (cd * shape_factor) * area
+        scale = -(force / max(mass, 1e-9)) / speed
+        ax = rel_x * scale
+        ay = rel_y * scale
+        az = rel_z * scale
+    az -= gravity
+
+    if coriolis_wy != 0.0 or coriolis_wz != 0.0:
+        ax += -2.0 * (coriolis_wy * vz - coriolis_wz * vy)
+        ay += -2.0 * (coriolis_wz * vx)
+        az += -2.0 * (-coriolis_wy * vx)
+
+    dm_dt = 0.0
+    if k_ab != 0.0 and speed != 0.0:
+        dm_dt = -k_ab * density * speed**3
+    return vx, vy, vz, ax, ay, az, dm_dt
+
+
+class JitDerivatives:
+    """`DerivativeFunction` evaluating `darkflight_derivatives` for one environment.
+
+    Atmospheric levels and parameters are packed when the kernel is built, so
+    it is a snapshot of the environment at that time.
+    """
+
+    def __init__(self, env: Any) -> None:
+        levels = env.profile.levels
+        if env.fragment_density_kg_m3 <= 0:
+            raise ValueError("density_kg_m3 must be positive")
+        if env.drag_model not in DRAG_MODEL_CODES:
+            raise ValueError(f"unsupported drag model {env.drag_model!r}")
+        if env.wind_model is not None:
+            raise ValueError("custom wind models are evaluated in Python and cannot be compiled")
+        self.altitudes = np.array([level.altitude_m for level in levels], dtype=float)
+        self.densities = np.array([level.density_kg_m3 for level in levels], dtype=float)
+        self.temperatures = np.array([level.temperature_k for level in levels], dtype=float)
+        self.winds_u = np.array([level.wind_u_mps for level in levels], dtype=float)
+        self.winds_v = np.array([level.wind_v_mps for level in levels], dtype=float)
+        self.gravity = float(env.gravity_mps2)
+        self.fragment_density = float(env.fragment_density_kg_m3)
+        self.constant_cd = float(env.drag_coefficient)
+        self.shape_factor = float(env.shape_factor)
+        self.drag_code = DRAG_MODEL_CODES[env.drag_model]
+        if env.latitude_deg != 0.0:
+            lat_rad = radians(env.latitude_deg)
+            self.coriolis_wy = EARTH_ROTATION_RATE_RAD_S * cos(lat_rad)
+            self.coriolis_wz = EARTH_ROTATION_RATE_RAD_S * sin(lat_rad)
+        else:
+            self.coriolis_wy = self.coriolis_wz = 0.0
+        self.k_ab = float(env.ablation.k_ab) if env.ablation else 0.0
+
+    @staticmethod
+    def supports(env: Any) -> bool:
+        """Return whether ``env`` can be evaluated by the compiled kernel."""
+
+        return (
+            env.wind_model is None
+            and env.drag_model in DRAG_MODEL_CODES
+            and env.fragment_density_kg_m3 > 0
+            and len(env.profile.levels) > 0
+        )
+
+    def __call__(self, values: StateVector) -> Derivative:
+        return darkflight_derivatives(
+            values[3],
+            values[4],
+            values[5],
+            values[6],
+            values[7],
+            self.altitudes,
+            self.densities,
+            self.temperatures,
+            self.winds_u,
+            self.winds_v,
+            self.gravity,
+            self.fragment_density,
+            self.constant_cd,
+            self.shape_factor,
+            self.drag_code,
+            self.coriolis_wy,
+            self.coriolis_wz,
+            self.k_ab,
+        )
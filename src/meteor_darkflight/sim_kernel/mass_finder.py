@@ -2,8 +2,133 @@
 
 from __future__ import annotations
 
-from meteor_darkflight.physics_core import ExplicitEulerIntegrator, State
-from meteor_darkflight.sim_kernel import DarkflightEnvironment
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from meteor_darkflight.physics_core import ExplicitEulerIntegrator, Integrator, State
+from meteor_darkflight.sim_kernel.batch import run_trajectory_batch, supports_batch
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.events import altitude_event
+from meteor_darkflight.sim_kernel.integrator import (
+    RecordingPolicy,
+    TerminationReason,
+    run_trajectory,
+)
+
+
+@dataclass(frozen=True)
+class FlightTimeTable:
+    """Terminus-to-radar flight time tabulated over a log-spaced mass grid.
+
+    ``masses_kg`` increase and ``flight_times_s`` strictly decrease (heavier
+    fragments are slowed less), so the table inverts by interpolating
+    log-mass against flight time.
+    """
+
+    masses_kg: np.ndarray
+    flight_times_s: np.ndarray
+    radar_altitude_m: float
+
+    @classmethod
+    def build(
+        cls,
+        terminus_state: State,
+        radar_altitude_m: float,
+        env: DarkflightEnvironment,
+        *,
+        mass_min_kg: float = 0.001,
+        mass_max_kg: float = 10000.0,
+        samples: int = 64,
+        integrator: Integrator | None = None,
+        dt: float = 0.1,
+        max_steps: int = 100_000,
+    ) -> "FlightTimeTable":
+        """Simulate every grid mass in one batched pass (Euler or RK4).
+
+        Integrators without a batched stepper (the adaptive ones) simulate the
+        grid masses one at a time instead.
+
+        Raises:
+            ValueError: If too few grid masses reach the radar altitude or the
+                flight time is not monotonic in mass over the grid.
+        """
+
+        if not 0 < mass_min_kg < mass_max_kg:
+            raise ValueError("require 0 < mass_min_kg < mass_max_kg")
+        if samples < 2:
+            raise ValueError("samples must be at least 2")
+        masses = np.geomspace(mass_min_kg, mass_max_kg, samples)
+        states = [terminus_state.with_updates(mass=float(mass)) for mass in masses]
+        integrator = integrator or ExplicitEulerIntegrator()
+        if supports_batch(integrator):
+            batch = run_trajectory_batch(
+                states,
+                integrator,
+                env,
+                dt=dt,
+                max_steps=max_steps,
+                target_altitude_m=radar_altitude_m,
+            )
+            reasons = batch.termination_reasons
+            flight_times = batch.flight_time_s
+        else:
+            results = [
+                run_trajectory(
+                    state,
+                    integrator,
+                    env,
+                    dt=dt,
+                    max_steps=max_steps,
+                    events=[altitude_event(radar_altitude_m)],
+                    recording=RecordingPolicy.summary(),
+                )
+                for state in states
+            ]
+            reasons = tuple(result.termination_reason for result in results)
+            flight_times = np.array([result.flight_time_s for result in results])
+        reached = np.array([reason is TerminationReason.EVENT for reason in reasons])
+        if np.count_nonzero(reached) < 2:
+            raise ValueError(f"Fewer than two grid masses reach {radar_altitude_m} m")
+        times = flight_times[reached]
+        if np.any(np.diff(times) >= 0):
+            raise ValueError("Flight time is not monotonic in mass over the grid")
+        return cls(masses_kg=masses[reached], flight_times_s=times, radar_altitude_m=radar_altitude_m)
+
+    @property
+    def duration_range_s(self) -> tuple[float, float]:
+        return float(self.flight_times_s[-1]), float(self.flight_times_s[0])
+
+    def flight_time(self, mass_kg: npt.ArrayLike) -> np.ndarray:
+        """Interpolated flight time (s) for ``mass_kg`` within the grid."""
+
+        log_mass = np.log(np.asarray(mass_kg, dtype=float))
+        return np.asarray(np.interp(log_mass, np.log(self.masses_kg), self.flight_times_s))
+
+    def mass_for(self, duration_s: npt.ArrayLike) -> np.ndarray:
+        """Invert the table for one or many observed durations.
+
+        Durations outside `duration_range_s` map to NaN.
+        """
+
+        duration = np.asarray(duration_s, dtype=float)
+        # np.interp needs increasing abscissae; flight time decreases with mass.
+        log_mass = np.interp(
+            duration,
+            self.flight_times_s[::-1],
+            np.log(self.masses_kg)[::-1],
+            left=np.nan,
+            right=np.nan,
+        )
+        return np.asarray(np.exp(log_mass))
+
+    def bracket(self, duration_s: float) -> tuple[float, float]:
+        """Return the adjacent grid masses whose flight times bracket ``duration_s``."""
+
+        index = int(np.searchsorted(-self.flight_times_s, -duration_s))
+        index = min(max(index, 1), len(self.masses_kg) - 1)
+        return float(self.masses_kg[index - 1]), float(self.masses_kg[index])
 
 
 def find_mass_for_flight_time(
@@ -15,12 +140,22 @@ def find_mass_for_flight_time(
     mass_max_kg: float = 10000.0,
     tolerance_s: float = 0.1,
     max_iterations: int = 50,
+    integrator: Integrator | None = None,
+    dt: float = 0.1,
+    method: str = "bisection",
+    table_samples: int = 64,
+    refine: bool = True,
 ) -> float:
     """Find the mass that results in the observed flight time from Terminus to Radar.
 
     Uses a bisection method to find the mass.
     Assumes flight time is monotonic with mass (heavier = faster = shorter time).
 
+    With ``method="table"`` the mass range is instead simulated once as a
+    batched `FlightTimeTable` and inverted by interpolation; with ``refine`` a
+    single root solve between the bracketing grid masses then polishes the
+    estimate. Build a `FlightTimeTable` directly to solve many durations.
+
     Args:
         terminus_state: State at the fireball terminus (mass is ignored/overwritten).
         radar_altitude_m: Target altitude of the radar signature.
@@ -30,6 +165,11 @@ def find_mass_for_flight_time(
         mass_max_kg: Maximum mass to search.
         tolerance_s: Convergence tolerance in seconds.
         max_iterations: Maximum bisection iterations.
+        integrator: Integrator for the terminus-to-radar leg (explicit Euler by default).
+        dt: Time step (initial trial step for adaptive integrators).
+        method: "bisection" (root solve over the full range) or "table".
+        table_samples: Grid size for ``method="table"``.
+        refine: Polish the table estimate with a bracketed root solve.
 
     Returns:
         The estimated mass in kg.
@@ -52,27 +192,17 @@ def find_mass_for_flight_time(
             mass=mass
         )
 
-        integrator = ExplicitEulerIntegrator()
-
-        state = trial_state
-        dt = 0.1
-
-        for _ in range(100_000):
-            # Store previous state for interpolation
-            prev_state = state
-
-            # Step
-            state = integrator.step(state, dt, env)
-
-            if state.z <= radar_altitude_m:
-                 # Interpolate
-                 # z_prev > radar_alt >= z_curr
-                 if prev_state.z == state.z:
-                     return state.t - terminus_state.t
-
-                 fraction = (prev_state.z - radar_altitude_m) / (prev_state.z - state.z)
-                 t_interp = prev_state.t + fraction * dt
-                 return t_interp - terminus_state.t
+        result = run_trajectory(
+            trial_state,
+            integrator or ExplicitEulerIntegrator(),
+            env,
+            dt=dt,
+            max_steps=100_000,
+            events=[altitude_event(radar_altitude_m)],
+            recording=RecordingPolicy.summary(),
+        )
+        if result.termination_reason is TerminationReason.EVENT:
+            return result.events[-1].state.t - terminus_state.t
 
         return float('inf') # Did not reach altitude
 
@@ -93,6 +223,33 @@ def find_mass_for_flight_time(
     # Use scipy.optimize.brentq
     from scipy.optimize import brentq  # type: ignore
 
+    if method == "table":
+        table = FlightTimeTable.build(
+            terminus_state,
+            radar_altitude_m,
+            env,
+            mass_min_kg=mass_min_kg,
+            mass_max_kg=mass_max_kg,
+            samples=table_samples,
+            integrator=integrator,
+            dt=dt,
+        )
+        estimate = float(table.mass_for(observed_duration_s))
+        if np.isnan(estimate):
+            low, high = table.duration_range_s
+            raise ValueError(
+                f"No solution in mass range [{mass_min_kg}, {mass_max_kg}]: "
+                f"tabulated durations span [{low:.2f}, {high:.2f}] s"
+            )
+        if not refine:
+            return estimate
+        lower, upper = table.bracket(observed_duration_s)
+        if time_error(lower) * time_error(upper) > 0:
+            return estimate
+        return float(brentq(time_error, lower, upper, xtol=1e-3, maxiter=max_iterations))
+    if method != "bisection":
+        raise ValueError(f"Unknown method {method!r}; expected 'bisection' or 'table'")
+
     try:
         # Check bounds first to ensure sign change
         err_min = time_error(mass_min_kg)
@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
-from meteor_darkflight.physics_core import State
-from meteor_darkflight.sim_kernel import DarkflightEnvironment
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from meteor_darkflight.physics_core import ForwardEulerIntegrator, Integrator, State
+from meteor_darkflight.sim_kernel.batch import run_trajectory_batch
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.events import altitude_event
+from meteor_darkflight.sim_kernel.integrator import (
+    RecordingPolicy,
+    TerminationReason,
+    run_trajectory,
+)
 
 
 def run_reverse_trajectory(
@@ -12,6 +24,7 @@ def run_reverse_trajectory(
     env: DarkflightEnvironment,
     dt: float = -0.1, # Negative time step for reverse integration
     max_steps: int = 100_000,
+    integrator: Integrator | None = None,
 ) -> State:
     """Run a reverse trajectory simulation from Radar state to Terminus altitude.
 
@@ -21,68 +34,106 @@ def run_reverse_trajectory(
         env: Simulation environment.
         dt: Time step (should be negative).
         max_steps: Maximum steps to prevent infinite loops.
+        integrator: Integrator for the backward leg (by default
+            `ForwardEulerIntegrator`: start-of-step velocity and constant mass).
 
     Returns:
-        The estimated State at the Terminus.
+        The estimated State at the Terminus, interpolated onto the target altitude.
     """
 
     if dt > 0:
         dt = -dt # Ensure negative time step
 
-    state = radar_state
-
-    for _ in range(max_steps):
-        if state.z >= target_altitude_m:
-            return state
-
-        # In reverse integration:
-        # We are solving: dX/dt = V, dV/dt = A
-        # But we are moving backwards in time.
-        # X_{n-1} = X_n - V_n * dt ?
-        # Or simply use the same Euler step with negative dt?
-        # V_{t+dt} = V_t + a(V_t) * dt
-        # If dt is negative, we are effectively subtracting.
-
-        # However, drag opposes velocity.
-        # In forward flight: a_drag = -C * v^2 * v_hat
-        # In reverse flight: We are tracing back where it came from.
-        # The velocity vector points DOWN (mostly).
-        # We are moving UP.
-        # The physical forces (Gravity, Drag) still act in their usual directions based on the state.
-        # Gravity points DOWN. Drag points OPPOSITE to Velocity.
-
-        # If we just use negative dt:
-        # V_{prev} = V_{curr} + a(V_{curr}) * (-dt)
-        # X_{prev} = X_{curr} + V_{curr} * (-dt)
-
-        # Let's check the logic:
-        # V_{curr} = V_{prev} + a(V_{prev}) * dt_pos
-        # V_{prev} = V_{curr} - a(V_{prev}) * dt_pos
-        # We approximate a(V_{prev}) with a(V_{curr}).
-        # So V_{prev} approx V_{curr} - a(V_{curr}) * dt\_pos
-        # Which is V_{curr} + a(V_{curr}) * dt_neg.
-
-        # So yes, standard Euler with negative dt works for simple reversibility
-        # (ignoring chaotic divergence for now, which is fine for short ballistic segments).
-
-        acc = env.acceleration(state)
-        # Mass change?
-        # If we assume constant mass for this segment (dark flight), mdot = 0.
-        # If ablation happened, we'd need to add mass back.
-        # For now, assume constant mass in dark flight.
-        # mdot = 0.0
-
-        vx_new = state.vx + acc[0] * dt
-        vy_new = state.vy + acc[1] * dt
-        vz_new = state.vz + acc[2] * dt
-
-        x_new = state.x + state.vx * dt
-        y_new = state.y + state.vy * dt
-        z_new = state.z + state.vz * dt
-
-        m_new = state.mass # Constant mass
-        t_new = state.t + dt
-
-        state = State(t_new, x_new, y_new, z_new, vx_new, vy_new, vz_new, m_new)
-
-    return state # Return last state if max_steps reached (warn user?)
+    if radar_state.z >= target_altitude_m:
+        return radar_state
+
+    # Stepping with a negative dt traces the fragment back up its path: gravity
+    # and drag keep acting in their usual directions for the current state, so
+    # each step approximates the earlier state (adequate for short ballistic
+    # segments). Mass is assumed constant in dark flight.
+    result = run_trajectory(
+        radar_state,
+        integrator or ForwardEulerIntegrator(),
+        env,
+        dt=dt,
+        max_steps=max_steps,
+        stall_speed_mps=0.0,
+        events=[altitude_event(target_altitude_m, direction=1)],
+        recording=RecordingPolicy.summary(),
+    )
+    if result.events:
+        return result.events[-1].state
+    return result.states[-1] # Last state if max_steps reached (warn user?)
+
+
+@dataclass(frozen=True)
+class TerminusEstimate:
+    """Back-calculated terminus points for a set of radar states.
+
+    ``states`` is an ``(n, 8)`` array (`STATE_COLUMNS` order) holding each
+    radar state's terminus, or its last integrated state when ``reached`` is
+    False. The centroid and covariance are over the horizontal (x, y) points.
+    """
+
+    states: np.ndarray
+    reached: np.ndarray
+
+    @property
+    def points(self) -> np.ndarray:
+        return self.states[:, 1:3]
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        if len(self.states) == 0:
+            return (0.0, 0.0)
+        mean = self.points.mean(axis=0)
+        return (float(mean[0]), float(mean[1]))
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Sample covariance (m²) of the terminus points; zeros for fewer than two."""
+
+        if len(self.states) < 2:
+            return np.zeros((2, 2))
+        return np.asarray(np.cov(self.points, rowvar=False))
+
+    def state(self, index: int) -> State:
+        return State(*self.states[index].tolist())
+
+
+def run_reverse_trajectory_batch(
+    radar_states: Sequence[State],
+    target_altitude_m: float,
+    env: DarkflightEnvironment,
+    dt: float = -0.1,
+    max_steps: int = 100_000,
+    integrator: Integrator | None = None,
+) -> TerminusEstimate:
+    """Back-propagate many radar states together to the terminus altitude.
+
+    Batched counterpart of `run_reverse_trajectory`: all states advance as
+    NumPy arrays and each retires as it rises through ``target_altitude_m``.
+    States already at or above the target are returned unchanged.
+    """
+
+    if dt > 0:
+        dt = -dt
+
+    count = len(radar_states)
+    states = np.array([state.as_tuple() for state in radar_states], dtype=float).reshape(count, 8)
+    reached = np.ones(count, dtype=bool)
+    below = np.flatnonzero(states[:, 3] < target_altitude_m)
+    if below.size:
+        batch = run_trajectory_batch(
+            [radar_states[int(index)] for index in below],
+            integrator or ForwardEulerIntegrator(),
+            env,
+            dt=dt,
+            max_steps=max_steps,
+            stall_speed_mps=0.0,
+            target_altitude_m=target_altitude_m,
+            target_direction=1,
+        )
+        states[below] = batch.final_states
+        reached[below] = [reason is TerminationReason.EVENT for reason in batch.termination_reasons]
+    return TerminusEstimate(states=states, reached=reached)
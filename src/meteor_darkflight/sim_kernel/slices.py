@@ -0,0 +1,296 @@
+"""Altitude-slice integration mirroring the legacy workbook's RAOB stepping.
+
+The workbook advances a fragment one radiosonde slice at a time: each slice
+has constant atmospheric properties, its top (``i``) state comes from the
+previous slice's bottom (``f``) state, and the time spent in the slice follows
+from the altitude drop and the mean vertical speed (methodology §19). The
+per-slice trace is emitted as ``vertical_grid.json``
+(``docs/schemas/vertical_grid.schema.json``).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+from meteor_darkflight.physics_core import State
+from meteor_darkflight.sim_kernel.environment import AtmosphericProfile, DarkflightEnvironment
+from meteor_darkflight.sim_kernel.integrator import TerminationReason, TrajectoryResult
+from meteor_darkflight.sim_kernel.storage import StateArray
+
+_VERTICAL_GRID_UNITS = {
+    "altitude_m": "metres",
+    "delta_altitude_m": "metres",
+    "vertical_speed_mps": "metres per second",
+    "time_in_slice_s": "seconds",
+    "in_range": "boolean",
+}
+
+
+@dataclass(frozen=True)
+class SliceTable:
+    """Per-slice atmospheric constants, precomputed once per profile.
+
+    Slice ``k`` spans ``bottoms_m[k]`` to ``tops_m[k]`` (ascending order) and
+    uses the density, wind and speed of sound at its mid-altitude.
+    """
+
+    bottoms_m: np.ndarray
+    tops_m: np.ndarray
+    densities: np.ndarray
+    winds_u: np.ndarray
+    winds_v: np.ndarray
+    mid_altitudes_m: np.ndarray
+
+    @classmethod
+    def from_profile(
+        cls,
+        profile: AtmosphericProfile,
+        *,
+        altitudes_m: Sequence[float] | None = None,
+        max_slice_m: float | None = None,
+    ) -> "SliceTable":
+        """Slice ``profile`` at its level altitudes (or ``altitudes_m``) down to 0 m.
+
+        ``max_slice_m`` splits thicker slices evenly.
+        """
+
+        if max_slice_m is not None and max_slice_m <= 0:
+            raise ValueError("max_slice_m must be positive")
+        source = altitudes_m if altitudes_m is not None else [level.altitude_m for level in profile.levels]
+        edges = np.unique(np.concatenate(([0.0], [float(z) for z in source if z > 0.0])))
+        if len(edges) < 2:
+            raise ValueError("slice table requires at least one altitude above ground")
+        if max_slice_m is not None:
+            refined: List[float] = [float(edges[0])]
+            for bottom, top in zip(edges[:-1], edges[1:]):
+                parts = max(1, int(np.ceil((top - bottom) / max_slice_m)))
+                refined.extend(np.linspace(bottom, top, parts + 1)[1:].tolist())
+            edges = np.array(refined)
+
+        compiled = profile.compile()
+        mids = 0.5 * (edges[:-1] + edges[1:])
+        winds_u, winds_v = compiled.wind_array(mids)
+        return cls(
+            bottoms_m=edges[:-1],
+            tops_m=edges[1:],
+            densities=compiled.density_array(mids),
+            winds_u=np.asarray(winds_u),
+            winds_v=np.asarray(winds_v),
+            mid_altitudes_m=mids,
+        )
+
+    def __len__(self) -> int:
+        return len(self.bottoms_m)
+
+    def slice_containing(self, altitude_m: float) -> int:
+        """Index of the slice whose top is at or above ``altitude_m`` (the last slice above the table)."""
+
+        return min(int(np.searchsorted(self.tops_m, altitude_m, side="left")), len(self) - 1)
+
+
+@dataclass(frozen=True)
+class SliceRecord:
+    """Top (``i``) and bottom (``f``) states of one traversed slice."""
+
+    index: int
+    top: State
+    bottom: State
+
+    @property
+    def altitude_m(self) -> float:
+        return self.bottom.z
+
+    @property
+    def delta_altitude_m(self) -> float:
+        return self.top.z - self.bottom.z
+
+    @property
+    def time_in_slice_s(self) -> float:
+        return self.bottom.t - self.top.t
+
+    @property
+    def vertical_speed_mps(self) -> float:
+        """Mean descent speed through the slice."""
+
+        if self.time_in_slice_s == 0.0:
+            return 0.0
+        return self.delta_altitude_m / self.time_in_slice_s
+
+
+@dataclass(frozen=True)
+class SliceTrajectoryResult:
+    """Slice-by-slice trajectory with its workbook-style vertical grid."""
+
+    trajectory: TrajectoryResult
+    slices: Tuple[SliceRecord, ...]
+    table: SliceTable
+
+    def vertical_grid(self, provenance: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Return a ``vertical_grid.json`` payload covering every table slice.
+
+        Slices the fragment did not traverse are reported with zero time and
+        ``in_range`` False, as in the workbook.
+        """
+
+        traversed = {record.index: record for record in self.slices}
+        rows: List[dict[str, Any]] = []
+        for index in range(len(self.table)):
+            record = traversed.get(index)
+            bottom = float(self.table.bottoms_m[index])
+            delta = float(self.table.tops_m[index] - bottom)
+            if record is None:
+                rows.append(
+                    {
+                        "altitude_m": bottom,
+                        "delta_altitude_m": delta,
+                        "vertical_speed_mps": 0.0,
+                        "time_in_slice_s": 0.0,
+                        "in_range": False,
+                    }
+                )
+                continue
+            rows.append(
+                {
+                    "altitude_m": record.altitude_m,
+                    "delta_altitude_m": record.delta_altitude_m,
+                    "vertical_speed_mps": record.vertical_speed_mps,
+                    "time_in_slice_s": record.time_in_slice_s,
+                    "in_range": True,
+                }
+            )
+        return {
+            "$schema": "../schemas/vertical_grid.schema.json",
+            "meta": {
+                "units": {"slices": dict(_VERTICAL_GRID_UNITS)},
+                "provenance": provenance or {"agent": "sim_kernel.slices"},
+            },
+            "slices": rows,
+        }
+
+    def write_vertical_grid(self, path: str | Path, provenance: dict[str, Any] | None = None) -> None:
+        """Write `vertical_grid` to ``path`` as JSON."""
+
+        with Path(path).open("w", encoding="utf-8") as handle:
+            json.dump(self.vertical_grid(provenance), handle, indent=2)
+            handle.write("\n")
+
+
+def run_slice_trajectory(
+    initial_state: State,
+    env: DarkflightEnvironment,
+    table: SliceTable | None = None,
+    *,
+    corrector_iterations: int = 3,
+    drag_time_fraction: float = 0.5,
+) -> SliceTrajectoryResult:
+    """Integrate a descending fragment one altitude slice per step.
+
+    Within a slice the atmosphere is held at the table's constants and the
+    slice is crossed with a trapezoidal predictor-corrector whose time step is
+    the altitude drop over the mean vertical speed, so every step ends exactly
+    on the next slice boundary. Where the crossing would take longer than
+    ``drag_time_fraction`` of the drag relaxation time (fast, light fragments
+    high up) the slice is split into equal-height sub-steps with the same
+    constants. Stops with `TerminationReason.STALLED` if the fragment stops
+    descending. ``table`` defaults to slices at the profile levels.
+    """
+
+    if corrector_iterations < 1:
+        raise ValueError("corrector_iterations must be at least 1")
+    if drag_time_fraction <= 0:
+        raise ValueError("drag_time_fraction must be positive")
+    if table is None:
+        table = SliceTable.from_profile(env.profile)
+    compiled = env.compile()
+    gravity = compiled.gravity_mps2
+
+    values = initial_state.as_tuple()
+    rows: List[Tuple[float, ...]] = [values]
+    records: List[SliceRecord] = []
+    max_speed = initial_state.speed()
+    reason = TerminationReason.GROUND
+    index = table.slice_containing(values[3])
+
+    while index >= 0 and values[3] > 0.0:
+        bottom_z = float(table.bottoms_m[index])
+        if values[3] <= bottom_z:
+            index -= 1
+            continue
+        if values[6] >= 0.0:
+            reason = TerminationReason.STALLED
+            break
+
+        wind = (float(table.winds_u[index]), float(table.winds_v[index]), 0.0)
+        density = float(table.densities[index])
+        altitude = float(table.mid_altitudes_m[index])
+
+        def rates(vx: float, vy: float, vz: float, mass: float) -> Tuple[float, float, float, float]:
+            return compiled.acceleration_and_mass_rate(altitude, vx, vy, vz, mass, density, wind)
+
+        top = values
+        start_rates = rates(*values[4:])
+        rel_speed = ((values[4] - wind[0]) ** 2 + (values[5] - wind[1]) ** 2 + values[6] ** 2) ** 0.5
+        drag = (start_rates[0] ** 2 + start_rates[1] ** 2 + (start_rates[2] + gravity) ** 2) ** 0.5
+        crossing_s = (values[3] - bottom_z) / -values[6]
+        substeps = 1
+        if drag > 0.0:
+            substeps = max(1, int(np.ceil(crossing_s / (drag_time_fraction * rel_speed / drag))))
+        boundaries = np.linspace(values[3], bottom_z, substeps + 1)[1:]
+        boundaries[-1] = bottom_z
+
+        for sub_bottom in boundaries:
+            t, x, y, z, vx, vy, vz, mass = values
+            drop = z - float(sub_bottom)
+            ax, ay, az, dm = start_rates
+            end_rates = start_rates
+            nvx, nvy, nvz, nmass = vx, vy, vz, mass
+            dt = drop / -vz
+            for _ in range(corrector_iterations):
+                nvx = vx + 0.5 * (ax + end_rates[0]) * dt
+                nvy = vy + 0.5 * (ay + end_rates[1]) * dt
+                nvz = vz + 0.5 * (az + end_rates[2]) * dt
+                nmass = mass + 0.5 * (dm + end_rates[3]) * dt
+                if vz + nvz >= 0.0:
+                    break
+                dt = 2.0 * drop / -(vz + nvz)
+                end_rates = rates(nvx, nvy, nvz, nmass)
+            if vz + nvz >= 0.0:
+                reason = TerminationReason.STALLED
+                break
+            values = (
+                t + dt,
+                x + 0.5 * (vx + nvx) * dt,
+                y + 0.5 * (vy + nvy) * dt,
+                float(sub_bottom),
+                nvx,
+                nvy,
+                nvz,
+                nmass,
+            )
+            start_rates = end_rates
+            max_speed = max(max_speed, (nvx * nvx + nvy * nvy + nvz * nvz) ** 0.5)
+        if reason is TerminationReason.STALLED:
+            break
+
+        records.append(SliceRecord(index=index, top=State(*top), bottom=State(*values)))
+        rows.append(values)
+        index -= 1
+
+    final = State(*values)
+    impacted = reason is TerminationReason.GROUND
+    trajectory = TrajectoryResult(
+        states=StateArray.from_rows(rows),
+        termination_reason=reason,
+        impact_state=final if impacted else None,
+        flight_time_s=final.t - initial_state.t,
+        max_speed_mps=max_speed,
+        horizontal_drift_m=final.horizontal_displacement(),
+        terminal_speed_mps=final.speed(),
+        terminal_kinetic_energy_j=0.5 * final.mass * final.speed() ** 2 if impacted else None,
+    )
+    return SliceTrajectoryResult(trajectory=trajectory, slices=tuple(records), table=table)
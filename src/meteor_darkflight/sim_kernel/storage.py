@@ -0,0 +1,132 @@
+"""Columnar trajectory storage backed by a single float64 array."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence, Tuple, overload
+
+import numpy as np
+
+from meteor_darkflight.physics_core import State
+
+STATE_COLUMNS: Tuple[str, ...] = ("t", "x", "y", "z", "vx", "vy", "vz", "mass")
+
+
+class StateArray(Sequence[State]):
+    """Immutable sequence of states stored as an ``(n, 8)`` float64 array.
+
+    Rows follow `STATE_COLUMNS`. Indexing and iteration yield `State` objects,
+    so the container is a drop-in for a tuple of states, while the column
+    properties (``z``, ``vx``, ...) are zero-copy views for vectorised work.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: np.ndarray) -> None:
+        array = np.asarray(data, dtype=float)
+        if array.ndim != 2 or array.shape[1] != len(STATE_COLUMNS):
+            raise ValueError(f"state array must have shape (n, {len(STATE_COLUMNS)}), got {array.shape}")
+        view = array.view()
+        view.flags.writeable = False
+        self._data = view
+
+    @classmethod
+    def from_states(cls, states: Iterable[State]) -> "StateArray":
+        """Pack states into a new array (returns ``states`` unchanged if already packed)."""
+
+        if isinstance(states, StateArray):
+            return states
+        return cls.from_rows([(s.t, s.x, s.y, s.z, s.vx, s.vy, s.vz, s.mass) for s in states])
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[float]]) -> "StateArray":
+        """Pack ``(t, x, y, z, vx, vy, vz, mass)`` rows into a new array."""
+
+        return cls(np.array(rows, dtype=float).reshape(len(rows), len(STATE_COLUMNS)))
+
+    @classmethod
+    def load(cls, path: str | Path, *, mmap: bool = True) -> "StateArray":
+        """Load an array written by `save`, memory-mapped read-only by default."""
+
+        return cls(np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False))
+
+    def save(self, path: str | Path) -> None:
+        """Write the states as a ``.npy`` file."""
+
+        np.save(path, np.ascontiguousarray(self._data), allow_pickle=False)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Read-only ``(n, 8)`` view of the underlying array."""
+
+        return self._data
+
+    def column(self, name: str) -> np.ndarray:
+        return self._data[:, STATE_COLUMNS.index(name)]
+
+    @property
+    def t(self) -> np.ndarray:
+        return self.column("t")
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.column("x")
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.column("y")
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.column("z")
+
+    @property
+    def vx(self) -> np.ndarray:
+        return self.column("vx")
+
+    @property
+    def vy(self) -> np.ndarray:
+        return self.column("vy")
+
+    @property
+    def vz(self) -> np.ndarray:
+        return self.column("vz")
+
+    @property
+    def mass(self) -> np.ndarray:
+        return self.column("mass")
+
+    def speed(self) -> np.ndarray:
+        """Return the speed magnitude (m/s) of every state."""
+
+        return np.asarray(np.sqrt(np.sum(self._data[:, 4:7] ** 2, axis=1)))
+
+    def __len__(self) -> int:
+        return int(self._data.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> State: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "StateArray": ...
+
+    def __getitem__(self, index: int | slice) -> State | "StateArray":
+        if isinstance(index, slice):
+            return StateArray(self._data[index])
+        return State(*self._data[index].tolist())
+
+    def __iter__(self) -> Iterator[State]:
+        for row in self._data.tolist():
+            yield State(*row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StateArray):
+            return bool(np.array_equal(self._data, other._data))
+        if isinstance(other, (tuple, list)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"StateArray(n={len(self)})"
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from time import perf_counter
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
 
 from meteor_darkflight.physics_core import ExplicitEulerIntegrator, State
-from meteor_darkflight.sim_kernel import DarkflightEnvironment, run_trajectory
-from meteor_darkflight.sim_kernel.reverse_integration import run_reverse_trajectory
+from meteor_darkflight.sim_kernel.batch import run_trajectory_batch
+from meteor_darkflight.sim_kernel.cache import TrajectoryCache, replay
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.integrator import (
+    RecordingPolicy,
+    TerminationReason,
+    TrajectoryResult,
+)
+from meteor_darkflight.sim_kernel.reverse_integration import run_reverse_trajectory_batch
 
 
 def calculate_simulated_terminus(
@@ -23,24 +33,231 @@ def calculate_simulated_terminus(
 
     Returns:
         Tuple of (Centroid X, Centroid Y) in the simulation coordinate frame.
+        Use `run_reverse_trajectory_batch` for the individual points and their
+        covariance.
     """
 
-    terminus_points = []
+    # All radar states are back-propagated together through the batched engine.
+    estimate = run_reverse_trajectory_batch(radar_states, terminus_altitude_m, env)
+    return estimate.centroid
 
-    for state in radar_states:
-        # Reverse integrate to terminus altitude
-        term_state = run_reverse_trajectory(state, terminus_altitude_m, env)
-        terminus_points.append((term_state.x, term_state.y))
 
-    # Calculate Centroid
-    if not terminus_points:
-        return (0.0, 0.0)
+@dataclass(frozen=True)
+class FragmentHypothesis:
+    """Fragment properties to sweep; ``None`` keeps the environment's value."""
 
-    sum_x = sum(p[0] for p in terminus_points)
-    sum_y = sum(p[1] for p in terminus_points)
-    count = len(terminus_points)
+    name: str
+    fragment_density_kg_m3: float | None = None
+    shape_factor: float | None = None
+    drag_model: str | None = None
 
-    return (sum_x / count, sum_y / count)
+    def apply(self, env: DarkflightEnvironment) -> DarkflightEnvironment:
+        updates: dict[str, Any] = {}
+        if self.fragment_density_kg_m3 is not None:
+            updates["fragment_density_kg_m3"] = self.fragment_density_kg_m3
+        if self.shape_factor is not None:
+            updates["shape_factor"] = self.shape_factor
+        if self.drag_model is not None:
+            updates["drag_model"] = self.drag_model
+        return replace(env, **updates) if updates else env
+
+
+@dataclass(frozen=True)
+class StrewnFieldOutcome:
+    """Final state of one (hypothesis, mass) run of a strewn-field sweep."""
+
+    hypothesis: str
+    mass_kg: float
+    x: float
+    y: float
+    z: float
+    flight_time_s: float
+    termination_reason: TerminationReason
+
+    @property
+    def impacted(self) -> bool:
+        return self.termination_reason is TerminationReason.GROUND
+
+
+@dataclass(frozen=True)
+class StrewnFieldTask:
+    """Timing of one unit of work (a hypothesis and a slice of the masses)."""
+
+    index: int
+    hypothesis: str
+    mass_count: int
+    elapsed_s: float
+
+
+@dataclass(frozen=True)
+class StrewnFieldSweep:
+    """Outcomes ordered hypothesis-major, then in ``masses_kg`` order."""
+
+    outcomes: Tuple[StrewnFieldOutcome, ...]
+    tasks: Tuple[StrewnFieldTask, ...]
+
+    @property
+    def impacts(self) -> Tuple[StrewnFieldOutcome, ...]:
+        return tuple(outcome for outcome in self.outcomes if outcome.impacted)
+
+    @property
+    def failures(self) -> Tuple[StrewnFieldOutcome, ...]:
+        """Runs that did not reach the ground, with their `TerminationReason`."""
+
+        return tuple(outcome for outcome in self.outcomes if not outcome.impacted)
+
+    def points(self, hypothesis: str | None = None) -> List[Tuple[float, float, float]]:
+        """Return ``(mass, impact_x, impact_y)`` for the impacting runs."""
+
+        return [
+            (outcome.mass_kg, outcome.x, outcome.y)
+            for outcome in self.impacts
+            if hypothesis is None or outcome.hypothesis == hypothesis
+        ]
+
+
+_StrewnTask = Tuple[int, FragmentHypothesis, State, Tuple[float, ...], DarkflightEnvironment, float, int]
+
+_STREWN_INTEGRATOR = ExplicitEulerIntegrator()
+_STREWN_RECORDING = RecordingPolicy.summary()
+_STREWN_STALL_SPEED_MPS = 1e-3
+
+
+def _run_strewn_task(task: _StrewnTask) -> Tuple[List[TrajectoryResult], StrewnFieldTask]:
+    index, hypothesis, terminus, masses, env, dt, max_steps = task
+    start = perf_counter()
+    batch = run_trajectory_batch(
+        [terminus.with_updates(mass=mass) for mass in masses],
+        _STREWN_INTEGRATOR,
+        hypothesis.apply(env),
+        dt=dt,
+        max_steps=max_steps,
+        stall_speed_mps=_STREWN_STALL_SPEED_MPS,
+    )
+    timing = StrewnFieldTask(
+        index=index,
+        hypothesis=hypothesis.name,
+        mass_count=len(masses),
+        elapsed_s=perf_counter() - start,
+    )
+    return batch.results(), timing
+
+
+def sweep_strewn_field(
+    terminus_state: State,
+    masses_kg: Sequence[float],
+    env: DarkflightEnvironment,
+    hypotheses: Sequence[FragmentHypothesis] | None = None,
+    *,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    dt: float = 0.1,
+    max_steps: int = 100_000,
+    cache: TrajectoryCache | None = None,
+) -> StrewnFieldSweep:
+    """Land every mass under every fragment hypothesis.
+
+    Each task integrates one hypothesis over up to ``chunk_size`` masses with
+    the batched engine. ``workers`` greater than one fans the tasks out over a
+    process pool (``env`` must then be picklable); results are reassembled in
+    input order, so the sweep is deterministic regardless of scheduling.
+    ``terminus_state.mass`` is ignored.
+
+    With a ``cache``, runs already cached (or sharing a ballistic coefficient
+    with an earlier run in the sweep) are replayed rather than integrated, and
+    new results are added to it; ``tasks`` then covers only the integrated runs.
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if hypotheses is None:
+        hypotheses = [FragmentHypothesis(name="default")]
+    names = [hypothesis.name for hypothesis in hypotheses]
+    if len(set(names)) != len(names):
+        raise ValueError("fragment hypothesis names must be unique")
+
+    masses = tuple(float(mass) for mass in masses_kg)
+    slots = [(hypothesis, mass) for hypothesis in hypotheses for mass in masses]
+    results: List[TrajectoryResult | None] = [None] * len(slots)
+    keys: List[Hashable | None] = [None] * len(slots)
+    pending: Dict[str, List[float]] = {hypothesis.name: [] for hypothesis in hypotheses}
+    first_slot: Dict[Hashable, int] = {}
+    for slot, (hypothesis, mass) in enumerate(slots):
+        if cache is None:
+            pending[hypothesis.name].append(mass)
+            continue
+        fragment = terminus_state.with_updates(mass=mass)
+        key = cache.key(
+            fragment,
+            _STREWN_INTEGRATOR,
+            hypothesis.apply(env),
+            dt=dt,
+            max_steps=max_steps,
+            stall_speed_mps=_STREWN_STALL_SPEED_MPS,
+            recording=_STREWN_RECORDING,
+            engine="batch",
+        )
+        keys[slot] = key
+        if key is not None and key in first_slot:
+            continue
+        if key is not None:
+            results[slot] = cache.get(key, fragment)
+            first_slot[key] = slot
+        if results[slot] is None:
+            pending[hypothesis.name].append(mass)
+
+    pool_size = workers or 1
+    if chunk_size is None:
+        largest = max((len(chunk) for chunk in pending.values()), default=0)
+        chunk_size = max(1, -(-largest // pool_size))
+    tasks: List[_StrewnTask] = []
+    for hypothesis in hypotheses:
+        todo = tuple(pending[hypothesis.name])
+        for offset in range(0, len(todo), chunk_size):
+            chunk = todo[offset : offset + chunk_size]
+            tasks.append((len(tasks), hypothesis, terminus_state, chunk, env, dt, max_steps))
+
+    if pool_size > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(pool_size, len(tasks))) as executor:
+            completed = list(executor.map(_run_strewn_task, tasks))
+    else:
+        completed = [_run_strewn_task(task) for task in tasks]
+
+    computed = iter([result for task_results, _ in completed for result in task_results])
+    for slot, (hypothesis, mass) in enumerate(slots):
+        key = keys[slot]
+        if results[slot] is not None or (key is not None and first_slot[key] != slot):
+            continue
+        results[slot] = result = next(computed)
+        if cache is not None and key is not None:
+            cache.put(key, terminus_state.with_updates(mass=mass), result)
+    for slot, (hypothesis, mass) in enumerate(slots):
+        key = keys[slot]
+        if results[slot] is None and cache is not None and key is not None:
+            # Shares a ballistic coefficient with an earlier run in this sweep.
+            fragment = terminus_state.with_updates(mass=mass)
+            source = results[first_slot[key]]
+            assert source is not None
+            results[slot] = cache.get(key, fragment) or replay(source, source.states[0], fragment)
+
+    outcomes: List[StrewnFieldOutcome] = []
+    for (hypothesis, mass), trajectory in zip(slots, results):
+        assert trajectory is not None
+        final = trajectory.states[len(trajectory.states) - 1]
+        outcomes.append(
+            StrewnFieldOutcome(
+                hypothesis=hypothesis.name,
+                mass_kg=mass,
+                x=final.x,
+                y=final.y,
+                z=final.z,
+                flight_time_s=trajectory.flight_time_s,
+                termination_reason=trajectory.termination_reason,
+            )
+        )
+    return StrewnFieldSweep(outcomes=tuple(outcomes), tasks=tuple(timing for _, timing in completed))
 
 
 def generate_strewn_field(
@@ -60,26 +277,19 @@ def generate_strewn_field(
         env: Simulation environment.
 
     Returns:
-        List of tuples (mass, impact_x, impact_y).
+        List of tuples (mass, impact_x, impact_y). Masses that do not reach the
+        ground are omitted; `sweep_strewn_field` reports them with their
+        termination reason.
     """
 
-    results = []
-    integrator = ExplicitEulerIntegrator()
-
-    for mass in masses_kg:
-        initial_state = State(
-            t=0.0, # Relative time
-            x=terminus_centroid[0],
-            y=terminus_centroid[1],
-            z=terminus_altitude_m,
-            vx=terminus_velocity[0],
-            vy=terminus_velocity[1],
-            vz=terminus_velocity[2],
-            mass=mass
-        )
-
-        result = run_trajectory(initial_state, integrator, env, dt=0.1, max_steps=100_000)
-        if result.impact_state:
-            results.append((mass, result.impact_state.x, result.impact_state.y))
-
-    return results
+    terminus = State(
+        t=0.0, # Relative time
+        x=terminus_centroid[0],
+        y=terminus_centroid[1],
+        z=terminus_altitude_m,
+        vx=terminus_velocity[0],
+        vy=terminus_velocity[1],
+        vz=terminus_velocity[2],
+        mass=0.0,
+    )
+    return sweep_strewn_field(terminus, masses_kg, env).points()
@@ -0,0 +1,437 @@
+"""Landing-point surrogate interpolated from a precomputed design grid.
+
+For a fixed atmosphere the impact offset from the darkflight start point is a
+smooth function of six fragment and entry parameters (`SURROGATE_PARAMETERS`).
+`LandingSurrogate.build` integrates every point of a regular grid over them
+once with the batched engine; afterwards queries are answered by interpolation
+on that grid, vectorised over any number of queries. The grid is saved under
+the environment fingerprint (`environment_fingerprint`) so later sessions on
+the same event can reuse it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from meteor_darkflight.physics_core import ExplicitEulerIntegrator, Integrator, State
+from meteor_darkflight.sim_kernel.batch import run_trajectory_batch
+from meteor_darkflight.sim_kernel.cache import environment_fingerprint
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+
+SURROGATE_PARAMETERS = (
+    "log10_mass_kg",
+    "fragment_density_kg_m3",
+    "shape_factor",
+    "speed_mps",
+    "elevation_deg",
+    "azimuth_deg",
+)
+_OUTPUTS = ("impact_x_m", "impact_y_m", "flight_time_s")
+
+
+def entry_velocity(
+    speed_mps: npt.ArrayLike,
+    elevation_deg: npt.ArrayLike,
+    azimuth_deg: npt.ArrayLike,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ENU velocity of a descending fragment (methodology §3).
+
+    ``elevation_deg`` is the entry angle below the horizon and ``azimuth_deg``
+    the direction of travel clockwise from north.
+    """
+
+    speed = np.asarray(speed_mps, dtype=float)
+    elevation = np.radians(elevation_deg)
+    azimuth = np.radians(azimuth_deg)
+    horizontal = speed * np.cos(elevation)
+    return (
+        np.asarray(horizontal * np.sin(azimuth)),
+        np.asarray(horizontal * np.cos(azimuth)),
+        np.asarray(-speed * np.sin(elevation)),
+    )
+
+
+@dataclass(frozen=True)
+class SurrogateValidation:
+    """Surrogate predictions against fresh integrations at held-out points.
+
+    ``samples`` holds one row per point in `SURROGATE_PARAMETERS` order;
+    ``expected`` and ``predicted`` hold impact x, y and flight time. Points
+    where either side is NaN (no impact, or a grid cell touching one) are
+    counted in ``failures`` and left out of the error statistics.
+    """
+
+    samples: np.ndarray
+    expected: np.ndarray
+    predicted: np.ndarray
+
+    @property
+    def position_error_m(self) -> np.ndarray:
+        return np.asarray(np.hypot(*(self.predicted[:, :2] - self.expected[:, :2]).T))
+
+    @property
+    def flight_time_error_s(self) -> np.ndarray:
+        return np.asarray(np.abs(self.predicted[:, 2] - self.expected[:, 2]))
+
+    @property
+    def failures(self) -> int:
+        return int(np.count_nonzero(np.isnan(self.position_error_m)))
+
+    def as_dict(self) -> dict[str, float]:
+        position = self.position_error_m[~np.isnan(self.position_error_m)]
+        timing = self.flight_time_error_s[~np.isnan(self.flight_time_error_s)]
+        if position.size == 0:
+            position = timing = np.array([np.nan])
+        return {
+            "samples": float(len(self.samples)),
+            "failures": float(self.failures),
+            "mean_error_m": float(np.mean(position)),
+            "p95_error_m": float(np.percentile(position, 95)),
+            "max_error_m": float(np.max(position)),
+            "max_flight_time_error_s": float(np.max(timing)),
+        }
+
+
+@dataclass(frozen=True)
+class LandingSurrogate:
+    """Impact offsets and flight times tabulated on a regular parameter grid.
+
+    ``axes`` are the strictly increasing grid values for each of
+    `SURROGATE_PARAMETERS`; an axis with a single value holds that parameter
+    fixed and queries along it are ignored. Offsets are relative to the
+    start point directly below the fragment at ``settings["altitude_m"]``;
+    grid points that did not reach the ground are NaN. ``method`` is any
+    `scipy.interpolate.RegularGridInterpolator` method (``"linear"`` or a
+    spline such as ``"cubic"``).
+    """
+
+    axes: Tuple[np.ndarray, ...]
+    impact_x_m: np.ndarray
+    impact_y_m: np.ndarray
+    flight_time_s: np.ndarray
+    profile_hash: str
+    settings: Dict[str, Any]
+    method: str = "linear"
+    _interpolators: Dict[str, Callable[[np.ndarray], np.ndarray]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if len(self.axes) != len(SURROGATE_PARAMETERS):
+            raise ValueError(f"expected {len(SURROGATE_PARAMETERS)} axes")
+        shape = tuple(len(axis) for axis in self.axes)
+        for name, values in zip(_OUTPUTS, (self.impact_x_m, self.impact_y_m, self.flight_time_s)):
+            if values.shape != shape:
+                raise ValueError(f"{name} must have shape {shape}")
+
+    @classmethod
+    def build(
+        cls,
+        env: DarkflightEnvironment,
+        altitude_m: float,
+        *,
+        masses_kg: Sequence[float],
+        densities_kg_m3: Sequence[float],
+        shape_factors: Sequence[float],
+        speeds_mps: Sequence[float],
+        elevations_deg: Sequence[float],
+        azimuths_deg: Sequence[float],
+        integrator: Integrator | None = None,
+        dt: float = 0.1,
+        max_steps: int = 100_000,
+        method: str = "linear",
+        chunk_size: int = 4096,
+    ) -> "LandingSurrogate":
+        """Integrate every grid point from ``altitude_m`` down to the ground.
+
+        Runs use `run_trajectory_batch` in chunks of ``chunk_size`` fragments,
+        with per-point density and shape factor and ``env`` for everything
+        else. ``shape_factor`` scales the drag coefficient, so it stands in
+        for Cd.
+        """
+
+        if altitude_m <= 0:
+            raise ValueError("altitude_m must be above ground level")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        axes = _grid_axes(masses_kg, densities_kg_m3, shape_factors, speeds_mps, elevations_deg, azimuths_deg)
+        integrator = integrator or ExplicitEulerIntegrator()
+        points = np.array(list(product(*axes)), dtype=float)
+        outputs = _land(points, env, altitude_m, integrator, dt, max_steps, chunk_size)
+        shape = tuple(len(axis) for axis in axes)
+        return cls(
+            axes=axes,
+            impact_x_m=outputs[:, 0].reshape(shape),
+            impact_y_m=outputs[:, 1].reshape(shape),
+            flight_time_s=outputs[:, 2].reshape(shape),
+            profile_hash=environment_fingerprint(env),
+            settings=_settings(env, altitude_m, integrator, dt, max_steps),
+            method=method,
+        )
+
+    @property
+    def altitude_m(self) -> float:
+        return float(self.settings["altitude_m"])
+
+    @property
+    def key(self) -> str:
+        """File stem: the profile hash plus a digest of the grid and settings."""
+
+        return _key(self.profile_hash, self.settings, self.axes)
+
+    def predict(
+        self,
+        mass_kg: npt.ArrayLike,
+        fragment_density_kg_m3: npt.ArrayLike,
+        shape_factor: npt.ArrayLike,
+        speed_mps: npt.ArrayLike,
+        elevation_deg: npt.ArrayLike,
+        azimuth_deg: npt.ArrayLike,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return interpolated ``(impact_x_m, impact_y_m, flight_time_s)``.
+
+        Arguments broadcast against each other. Queries outside the grid
+        return NaN.
+        """
+
+        columns = np.broadcast_arrays(
+            np.log10(np.asarray(mass_kg, dtype=float)),
+            *(np.asarray(value, dtype=float) for value in (
+                fragment_density_kg_m3, shape_factor, speed_mps, elevation_deg, azimuth_deg
+            )),
+        )
+        samples = np.stack([np.ravel(column) for column in columns], axis=-1)
+        shape = columns[0].shape
+        predicted = self.predict_samples(samples)
+        return (
+            predicted[:, 0].reshape(shape),
+            predicted[:, 1].reshape(shape),
+            predicted[:, 2].reshape(shape),
+        )
+
+    def predict_samples(self, samples: npt.ArrayLike) -> np.ndarray:
+        """Interpolate ``(n, 6)`` rows in `SURROGATE_PARAMETERS` order into ``(n, 3)`` outputs."""
+
+        points = np.atleast_2d(np.asarray(samples, dtype=float))
+        varying = [index for index, axis in enumerate(self.axes) if len(axis) > 1]
+        query = points[:, varying]
+        return np.column_stack([self._interpolator(name)(query) for name in _OUTPUTS])
+
+    def validate(
+        self,
+        env: DarkflightEnvironment,
+        samples: int = 64,
+        *,
+        seed: int = 0,
+        integrator: Integrator | None = None,
+    ) -> SurrogateValidation:
+        """Compare predictions with true runs at random points inside the grid.
+
+        Points are drawn uniformly over each axis range (log-uniformly in
+        mass) and integrated with the surrogate's settings. ``integrator``
+        must be of the type the surrogate was built with.
+        """
+
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        integrator = integrator or ExplicitEulerIntegrator()
+        self._check_compatible(env, integrator)
+        rng = np.random.default_rng(seed)
+        points = np.column_stack([rng.uniform(axis[0], axis[-1], samples) for axis in self.axes])
+        expected = _land(
+            points,
+            env,
+            self.altitude_m,
+            integrator,
+            float(self.settings["dt"]),
+            int(self.settings["max_steps"]),
+            samples,
+        )
+        return SurrogateValidation(samples=points, expected=expected, predicted=self.predict_samples(points))
+
+    def save(self, directory: str | Path) -> Path:
+        """Write the surrogate to ``directory/<key>.npz`` and return the path."""
+
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        path = target / f"{self.key}.npz"
+        partial = path.with_suffix(".tmp.npz")
+        meta = {"profile_hash": self.profile_hash, "settings": self.settings, "method": self.method}
+        np.savez(
+            partial,
+            impact_x_m=self.impact_x_m,
+            impact_y_m=self.impact_y_m,
+            flight_time_s=self.flight_time_s,
+            axes=np.concatenate(self.axes),
+            axis_lengths=np.array([len(axis) for axis in self.axes]),
+            meta=np.array(json.dumps(meta)),
+        )
+        partial.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LandingSurrogate":
+        with np.load(Path(path), allow_pickle=False) as archive:
+            meta: dict[str, Any] = json.loads(str(archive["meta"]))
+            return cls(
+                axes=tuple(np.split(archive["axes"], np.cumsum(archive["axis_lengths"])[:-1])),
+                impact_x_m=np.asarray(archive["impact_x_m"]),
+                impact_y_m=np.asarray(archive["impact_y_m"]),
+                flight_time_s=np.asarray(archive["flight_time_s"]),
+                profile_hash=meta["profile_hash"],
+                settings=meta["settings"],
+                method=meta["method"],
+            )
+
+    @classmethod
+    def build_or_load(
+        cls,
+        directory: str | Path,
+        env: DarkflightEnvironment,
+        altitude_m: float,
+        **grid: Any,
+    ) -> "LandingSurrogate":
+        """Load a matching surrogate saved in ``directory``, or build and save one.
+
+        ``grid`` takes the keyword arguments of `build`.
+        """
+
+        axes = _grid_axes(
+            grid["masses_kg"],
+            grid["densities_kg_m3"],
+            grid["shape_factors"],
+            grid["speeds_mps"],
+            grid["elevations_deg"],
+            grid["azimuths_deg"],
+        )
+        settings = _settings(
+            env,
+            altitude_m,
+            grid.get("integrator") or ExplicitEulerIntegrator(),
+            grid.get("dt", 0.1),
+            grid.get("max_steps", 100_000),
+        )
+        path = Path(directory) / f"{_key(environment_fingerprint(env), settings, axes)}.npz"
+        if path.exists():
+            return replace(cls.load(path), method=grid.get("method", "linear"))
+        surrogate = cls.build(env, altitude_m, **grid)
+        surrogate.save(directory)
+        return surrogate
+
+    def _check_compatible(self, env: DarkflightEnvironment, integrator: Integrator) -> None:
+        if environment_fingerprint(env) != self.profile_hash:
+            raise ValueError("environment does not match the surrogate's profile hash")
+        if env.drag_coefficient != self.settings["drag_coefficient"]:
+            raise ValueError("environment drag_coefficient does not match the surrogate")
+        if type(integrator).__name__ != self.settings["integrator"]:
+            raise ValueError(f"surrogate was built with {self.settings['integrator']}")
+
+    def _interpolator(self, name: str) -> Callable[[np.ndarray], np.ndarray]:
+        interpolator = self._interpolators.get(name)
+        if interpolator is None:
+            from scipy.interpolate import RegularGridInterpolator  # type: ignore
+
+            varying = [index for index, axis in enumerate(self.axes) if len(axis) > 1]
+            values = np.squeeze(getattr(self, name), axis=tuple(set(range(len(self.axes))) - set(varying)))
+            interpolator = RegularGridInterpolator(
+                tuple(self.axes[index] for index in varying),
+                values,
+                method=self.method,
+                bounds_error=False,
+                fill_value=np.nan,
+            )
+            self._interpolators[name] = interpolator
+        return interpolator
+
+
+def _grid_axes(
+    masses_kg: Sequence[float],
+    densities_kg_m3: Sequence[float],
+    shape_factors: Sequence[float],
+    speeds_mps: Sequence[float],
+    elevations_deg: Sequence[float],
+    azimuths_deg: Sequence[float],
+) -> Tuple[np.ndarray, ...]:
+    if any(mass <= 0 for mass in masses_kg):
+        raise ValueError("masses_kg must be positive")
+    values: Tuple[Sequence[float] | np.ndarray, ...] = (
+        np.log10(masses_kg),
+        densities_kg_m3,
+        shape_factors,
+        speeds_mps,
+        elevations_deg,
+        azimuths_deg,
+    )
+    return tuple(_axis(name, axis) for name, axis in zip(SURROGATE_PARAMETERS, values))
+
+
+def _key(profile_hash: str, settings: Dict[str, Any], axes: Tuple[np.ndarray, ...]) -> str:
+    grid = json.dumps([settings, [axis.tolist() for axis in axes]], sort_keys=True)
+    return f"{profile_hash}-{hashlib.sha256(grid.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _axis(name: str, values: Sequence[float] | np.ndarray) -> np.ndarray:
+    axis = np.asarray(values, dtype=float).ravel()
+    if axis.size == 0:
+        raise ValueError(f"{name} axis must not be empty")
+    if np.any(np.diff(axis) <= 0):
+        raise ValueError(f"{name} axis must be strictly increasing")
+    return axis
+
+
+def _settings(
+    env: DarkflightEnvironment,
+    altitude_m: float,
+    integrator: Integrator,
+    dt: float,
+    max_steps: int,
+) -> Dict[str, Any]:
+    return {
+        "altitude_m": float(altitude_m),
+        "drag_coefficient": float(env.drag_coefficient),
+        "integrator": type(integrator).__name__,
+        "dt": float(dt),
+        "max_steps": int(max_steps),
+    }
+
+
+def _land(
+    points: np.ndarray,
+    env: DarkflightEnvironment,
+    altitude_m: float,
+    integrator: Integrator,
+    dt: float,
+    max_steps: int,
+    chunk_size: int,
+) -> np.ndarray:
+    """Integrate ``(n, 6)`` parameter rows to ``(n, 3)`` impact x, y and flight time (NaN if no impact)."""
+
+    outputs: List[np.ndarray] = []
+    for offset in range(0, len(points), chunk_size):
+        chunk = points[offset : offset + chunk_size]
+        vx, vy, vz = entry_velocity(chunk[:, 3], chunk[:, 4], chunk[:, 5])
+        states = [
+            State(t=0.0, x=0.0, y=0.0, z=altitude_m, vx=float(u), vy=float(v), vz=float(w), mass=float(10.0**log_mass))
+            for log_mass, u, v, w in zip(chunk[:, 0], vx, vy, vz)
+        ]
+        batch = run_trajectory_batch(
+            states,
+            integrator,
+            env,
+            dt=dt,
+            max_steps=max_steps,
+            fragment_density_kg_m3=chunk[:, 1],
+            shape_factor=chunk[:, 2],
+        )
+        result = np.column_stack((batch.final_states[:, 1], batch.final_states[:, 2], batch.flight_time_s))
+        result[~batch.impacted] = np.nan
+        outputs.append(result)
+    return np.concatenate(outputs) if outputs else np.empty((0, 3))
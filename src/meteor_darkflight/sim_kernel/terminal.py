@@ -0,0 +1,254 @@
+"""Quasi-steady terminal-velocity descent for the end of a darkflight trajectory.
+
+Once drag balances gravity, a fragment falls at the local terminal speed and
+drifts with the wind. The remaining fall can then be integrated in altitude
+rather than time: with ``w(z)`` the terminal speed,
+
+    dt/dz = 1 / w(z),   dx/dz = u(z) / w(z),   dy/dz = v(z) / w(z),
+
+so the flight time and wind drift down to the ground are single quadratures
+over the atmospheric layer table. Velocities relax towards ``w`` and the wind
+over a drag length, which carries the fragment's state at the switch and its
+lag behind wind shear through the descent.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import hypot
+from typing import TYPE_CHECKING, Callable, Dict
+
+import numpy as np
+import numpy.typing as npt
+
+from meteor_darkflight.physics_core import (
+    Integrator,
+    State,
+    calculate_cube_cd_array,
+    calculate_sphere_cd_array,
+    cross_section_from_mass_density,
+)
+from meteor_darkflight.sim_kernel.environment import DarkflightEnvironment
+from meteor_darkflight.sim_kernel.storage import StateArray
+
+if TYPE_CHECKING:
+    from meteor_darkflight.sim_kernel.integrator import TrajectoryResult
+
+_CD_ARRAY_MODELS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "sphere": calculate_sphere_cd_array,
+    "cube": calculate_cube_cd_array,
+}
+
+
+@dataclass(frozen=True)
+class TerminalDescentPolicy:
+    """When `run_trajectory` may hand the final descent to `descend_at_terminal_speed`.
+
+    The switch happens below ``max_altitude_m`` once the acceleration
+    magnitude has stayed under ``acceleration_threshold_mps2`` for
+    ``settle_steps`` consecutive steps. ``altitude_step_m`` is the quadrature
+    spacing; the profile levels are always included as nodes.
+    """
+
+    acceleration_threshold_mps2: float = 0.5
+    settle_steps: int = 20
+    max_altitude_m: float = 10000.0
+    altitude_step_m: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.acceleration_threshold_mps2 <= 0:
+            raise ValueError("acceleration_threshold_mps2 must be positive")
+        if self.settle_steps < 1:
+            raise ValueError("settle_steps must be at least 1")
+        if self.altitude_step_m <= 0:
+            raise ValueError("altitude_step_m must be positive")
+
+
+@dataclass(frozen=True)
+class TerminalDescentRecord:
+    """Where a trajectory switched to the terminal-velocity descent."""
+
+    step: int
+    state: State
+
+
+def terminal_speed(
+    env: DarkflightEnvironment,
+    mass_kg: float,
+    altitude_m: np.ndarray,
+    *,
+    iterations: int = 8,
+) -> np.ndarray:
+    """Return the still-air terminal speed (m/s) of a fragment at each altitude.
+
+    Mach-dependent drag models are resolved by fixed-point iteration on
+    ``w = sqrt(2 m g / (rho Cd A))``.
+    """
+
+    profile = env.profile.compile()
+    altitude = np.maximum(np.asarray(altitude_m, dtype=float), 0.0)
+    density = profile.density_array(altitude)
+    area = cross_section_from_mass_density(max(mass_kg, 0.0), env.fragment_density_kg_m3)
+    weight = 2.0 * max(mass_kg, 1e-9) * env.gravity_mps2
+    cd_model = _CD_ARRAY_MODELS.get(env.drag_model)
+    if cd_model is None:
+        return np.asarray(np.sqrt(weight / (density * env.drag_coefficient * env.shape_factor * area)))
+
+    speed_sound = profile.speed_of_sound_array(altitude)
+    speed = np.sqrt(weight / (density * env.drag_coefficient * env.shape_factor * area))
+    for _ in range(iterations):
+        cd = cd_model(speed / speed_sound)
+        speed = np.sqrt(weight / (density * cd * env.shape_factor * area))
+    return np.asarray(speed)
+
+
+def descend_at_terminal_speed(
+    state: State,
+    env: DarkflightEnvironment,
+    *,
+    altitude_step_m: float = 10.0,
+) -> StateArray:
+    """Descend from ``state`` to the ground at the local terminal speed.
+
+    Returns states on the quadrature nodes from ``state.z`` down to 0 m. The
+    fragment's velocity relaxes from its value in ``state`` towards the wind
+    horizontally and the terminal speed vertically. Coriolis and mass loss
+    are neglected over the descent.
+    """
+
+    if altitude_step_m <= 0:
+        raise ValueError("altitude_step_m must be positive")
+    top = state.z
+    if top <= 0.0:
+        return StateArray.from_states([state])
+
+    levels = np.array([level.altitude_m for level in env.profile.levels], dtype=float)
+    nodes = np.concatenate((np.arange(top, 0.0, -altitude_step_m), levels[(levels > 0.0) & (levels < top)], [0.0]))
+    z = np.unique(nodes)[::-1]
+
+    terminal = terminal_speed(env, state.mass, z)
+    if env.wind_model is not None:
+        winds = np.array([env.wind_model(float(altitude))[:2] for altitude in z], dtype=float)
+        wind_u, wind_v = winds[:, 0], winds[:, 1]
+    else:
+        wind_u, wind_v = env.profile.compile().wind_array(z)
+
+    # Near terminal speed, drag relaxes a velocity perturbation over a fall
+    # of w^2/g (horizontal) or w^2/(2g) (vertical), so the fragment trails
+    # the local terminal speed and wind rather than matching them exactly.
+    drop = -np.diff(z)
+    length = terminal**2 / env.gravity_mps2
+    speed = _relax(terminal, -state.vz, drop, 0.5 * length)
+    velocity_u = _relax(wind_u, state.vx, drop, length)
+    velocity_v = _relax(wind_v, state.vy, drop, length)
+
+    inverse = 1.0 / speed
+    elapsed = _cumulative(drop, inverse)
+    x = state.x + _cumulative(drop, velocity_u * inverse)
+    y = state.y + _cumulative(drop, velocity_v * inverse)
+
+    rows = np.column_stack(
+        (state.t + elapsed, x, y, z, velocity_u, velocity_v, -speed, np.full(z.shape, state.mass))
+    )
+    rows[0] = state.as_tuple()
+    return StateArray(rows)
+
+
+def _relax(target: np.ndarray, start: float, drop: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """Integrate ``dv/ds = (target - v) / length`` down the altitude nodes.
+
+    ``s`` is the distance fallen. Each interval is solved exactly for a
+    linearly varying target, starting from ``start`` at the first node.
+    """
+
+    values = np.empty_like(target)
+    values[0] = start
+    scale = 0.5 * (length[:-1] + length[1:])
+    slope = np.diff(target) / drop
+    decay = np.exp(-drop / scale)
+    offset = scale * slope
+    for index in range(len(drop)):
+        values[index + 1] = target[index + 1] - offset[index] + (
+            values[index] - target[index] + offset[index]
+        ) * decay[index]
+    return values
+
+
+def _cumulative(drop: np.ndarray, rate: np.ndarray) -> np.ndarray:
+    """Trapezoidal running integral of ``rate`` over descending altitude nodes."""
+
+    return np.concatenate(([0.0], np.cumsum(drop * 0.5 * (rate[:-1] + rate[1:]))))
+
+
+def interpolate_altitudes(descent: StateArray, altitudes_m: npt.ArrayLike) -> StateArray:
+    """Interpolate a descending `StateArray` (e.g. from `descend_at_terminal_speed`) onto ``altitudes_m``."""
+
+    data = descent.data[::-1]
+    query = np.asarray(altitudes_m, dtype=float)
+    columns = [np.interp(query, data[:, 3], data[:, index]) for index in range(data.shape[1])]
+    return StateArray(np.column_stack(columns).reshape(query.size, data.shape[1]))
+
+
+@dataclass(frozen=True)
+class TerminalDescentComparison:
+    """Fast-path trajectory alongside a fully integrated reference."""
+
+    full: "TrajectoryResult"
+    fast: "TrajectoryResult"
+
+    @property
+    def impact_offset_m(self) -> float:
+        """Horizontal distance between the two ground points."""
+
+        if self.full.impact_state is None or self.fast.impact_state is None:
+            return float("nan")
+        return hypot(self.fast.impact_state.x - self.full.impact_state.x, self.fast.impact_state.y - self.full.impact_state.y)
+
+    @property
+    def flight_time_error_s(self) -> float:
+        return self.fast.flight_time_s - self.full.flight_time_s
+
+    @property
+    def terminal_speed_error_mps(self) -> float:
+        return self.fast.terminal_speed_mps - self.full.terminal_speed_mps
+
+    @property
+    def steps_saved(self) -> int:
+        """Integrator steps avoided by the fast path (0 if it never engaged)."""
+
+        if self.fast.terminal_descent is None:
+            return 0
+        return len(self.full.states) - 1 - self.fast.terminal_descent.step
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "impact_offset_m": self.impact_offset_m,
+            "flight_time_error_s": self.flight_time_error_s,
+            "terminal_speed_error_mps": self.terminal_speed_error_mps,
+            "steps_saved": float(self.steps_saved),
+        }
+
+
+def compare_terminal_descent(
+    initial_state: State,
+    integrator: Integrator,
+    env: DarkflightEnvironment,
+    policy: TerminalDescentPolicy | None = None,
+    *,
+    dt: float = 0.5,
+    max_steps: int = 100_000,
+) -> TerminalDescentComparison:
+    """Run a trajectory with and without the terminal-descent fast path."""
+
+    from meteor_darkflight.sim_kernel.integrator import run_trajectory
+
+    full = run_trajectory(initial_state, integrator, env, dt=dt, max_steps=max_steps)
+    fast = run_trajectory(
+        initial_state,
+        integrator,
+        env,
+        dt=dt,
+        max_steps=max_steps,
+        terminal_descent=policy or TerminalDescentPolicy(),
+    )
+    return TerminalDescentComparison(full=full, fast=fast)
@@ -1,5 +1,19 @@
 """Post-processing of ensemble outputs to compute uncertainty products."""
 
-from .compute import compute_ellipses
+from .compute import UncertaintyEllipse, compute_ellipses, ellipse_from_covariance
+from .linearized import (
+    LANDING_PARAMETERS,
+    LandingSensitivity,
+    landing_sensitivity,
+    propagate_landing_covariance,
+)
 
-__all__ = ["compute_ellipses"]
+__all__ = [
+    "compute_ellipses",
+    "ellipse_from_covariance",
+    "UncertaintyEllipse",
+    "LANDING_PARAMETERS",
+    "LandingSensitivity",
+    "landing_sensitivity",
+    "propagate_landing_covariance",
+]
@@ -1,10 +1,109 @@
 """Compute covariance, ellipses and probability fields from ensemble points."""
-from typing import Any
 
+from __future__ import annotations
 
-def compute_ellipses(points: Any, confidence: float = 0.9) -> Any:
-    """Return ellipse geometries and metadata.
+from dataclasses import dataclass
+from math import atan2, degrees, log, sqrt
+from typing import Any, List, Sequence
 
-    Placeholder.
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True)
+class UncertaintyEllipse:
+    """Confidence ellipse of a bivariate-normal landing distribution.
+
+    ``center`` is ``(east_m, north_m)`` and ``covariance`` the 2×2 landing
+    covariance in the same local ENU plane (methodology §13).
+    """
+
+    center: tuple[float, float]
+    covariance: np.ndarray
+    confidence: float
+
+    @property
+    def scale(self) -> float:
+        """Mahalanobis radius enclosing ``confidence`` (χ² with two degrees of freedom)."""
+
+        return sqrt(-2.0 * log(1.0 - self.confidence))
+
+    @property
+    def major_axis_m(self) -> float:
+        """Semi-major axis."""
+
+        return self.scale * sqrt(max(float(np.linalg.eigvalsh(self.covariance)[1]), 0.0))
+
+    @property
+    def minor_axis_m(self) -> float:
+        """Semi-minor axis."""
+
+        return self.scale * sqrt(max(float(np.linalg.eigvalsh(self.covariance)[0]), 0.0))
+
+    @property
+    def orientation_deg(self) -> float:
+        """Bearing of the major axis, clockwise from north in [0, 180)."""
+
+        _, vectors = np.linalg.eigh(self.covariance)
+        east, north = vectors[:, 1]
+        return degrees(atan2(east, north)) % 180.0
+
+    def polygon(self, vertices: int = 64) -> np.ndarray:
+        """Closed ``(vertices + 1, 2)`` ring of east/north points on the ellipse."""
+
+        if vertices < 3:
+            raise ValueError("vertices must be at least 3")
+        values, vectors = np.linalg.eigh(self.covariance)
+        angles = np.linspace(0.0, 2.0 * np.pi, vertices + 1)
+        unit = np.column_stack((np.cos(angles), np.sin(angles)))
+        axes = vectors * (self.scale * np.sqrt(np.maximum(values, 0.0)))
+        ring = np.asarray(np.array(self.center) + unit @ axes.T)
+        ring[-1] = ring[0]
+        return ring
+
+    def as_properties(self) -> dict[str, Any]:
+        """Metadata for ``uncertainty_ellipses.geojson`` (architecture §7.3)."""
+
+        return {
+            "covariance_matrix": self.covariance.tolist(),
+            "confidence_level": self.confidence,
+            "major_axis_m": self.major_axis_m,
+            "minor_axis_m": self.minor_axis_m,
+            "orientation_deg": self.orientation_deg,
+        }
+
+
+def ellipse_from_covariance(
+    center: Sequence[float],
+    covariance: npt.ArrayLike,
+    confidence: float = 0.9,
+) -> UncertaintyEllipse:
+    """Build an `UncertaintyEllipse` from a mean and 2×2 covariance."""
+
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+    matrix = np.asarray(covariance, dtype=float)
+    if matrix.shape != (2, 2):
+        raise ValueError("covariance must be 2x2")
+    east, north = center
+    return UncertaintyEllipse(center=(float(east), float(north)), covariance=matrix, confidence=confidence)
+
+
+def compute_ellipses(
+    points: npt.ArrayLike,
+    confidence: float | Sequence[float] = 0.9,
+) -> List[UncertaintyEllipse]:
+    """Return one ellipse per confidence level fitted to ``(n, 2)`` east/north points.
+
+    The ellipses share the sample mean and covariance of ``points``.
     """
-    raise NotImplementedError()
+
+    samples = np.asarray(points, dtype=float)
+    if samples.ndim != 2 or samples.shape[1] != 2:
+        raise ValueError("points must have shape (n, 2)")
+    if len(samples) < 3:
+        raise ValueError("at least three points are required")
+    levels = [confidence] if isinstance(confidence, (int, float)) else list(confidence)
+    center = samples.mean(axis=0)
+    covariance = np.cov(samples, rowvar=False)
+    return [ellipse_from_covariance(center, covariance, level) for level in levels]
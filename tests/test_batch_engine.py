@@ -0,0 +1,232 @@
+"""Tests for the batched structure-of-arrays trajectory engine."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from meteor_darkflight.physics_core import (
+    CdTable,
+    ExplicitEulerIntegrator,
+    Integrator,
+    RungeKutta4Integrator,
+    SimpleAblationParams,
+    State,
+)
+from meteor_darkflight.sim_kernel import (
+    AtmosphericProfile,
+    DarkflightEnvironment,
+    FragmentHypothesis,
+    LandingSurrogate,
+    TerminationReason,
+    TrajectoryCache,
+    altitude_event,
+    entry_velocity,
+    run_trajectory,
+    run_trajectory_batch,
+    sweep_strewn_field,
+)
+
+
+def layered_profile() -> AtmosphericProfile:
+    return AtmosphericProfile.from_raw_levels(
+        [
+            (0.0, 101325.0, 288.15, 2.0, -1.0),
+            (3000.0, 70100.0, 268.65, 8.0, 3.0),
+            (8000.0, 35600.0, 236.15, 15.0, 6.0),
+            (15000.0, 12100.0, 216.65, 25.0, -4.0),
+        ]
+    )
+
+
+def fragments() -> list[State]:
+    return [
+        State(t=0.0, x=0.0, y=0.0, z=12000.0, vx=900.0, vy=200.0, vz=-1500.0, mass=mass)
+        for mass in (0.05, 1.0, 20.0)
+    ]
+
+
+@pytest.mark.parametrize("integrator", [ExplicitEulerIntegrator(), RungeKutta4Integrator()])
+@pytest.mark.parametrize(
+    "env_overrides",
+    [
+        {"drag_model": "sphere"},
+        {"drag_model": "cube", "latitude_deg": 41.5},
+        {"drag_coefficient": 0.8, "ablation": SimpleAblationParams(k_ab=1e-12)},
+    ],
+)
+def test_batch_matches_scalar_run_trajectory(integrator: Integrator, env_overrides):
+    env = DarkflightEnvironment(profile=layered_profile(), fragment_density_kg_m3=3300.0, **env_overrides)
+    states = fragments()
+
+    batch = run_trajectory_batch(states, integrator, env, dt=0.1)
+
+    for index, state in enumerate(states):
+        expected = run_trajectory(state, integrator, env, dt=0.1)
+        actual = batch.result(index)
+        assert actual.termination_reason is expected.termination_reason
+        assert actual.impact_state is not None and expected.impact_state is not None
+        assert actual.impact_state.x == pytest.approx(expected.impact_state.x, rel=1e-9, abs=1e-6)
+        assert actual.impact_state.y == pytest.approx(expected.impact_state.y, rel=1e-9, abs=1e-6)
+        assert actual.flight_time_s == pytest.approx(expected.flight_time_s, rel=1e-9)
+        assert actual.max_speed_mps == pytest.approx(expected.max_speed_mps, rel=1e-9)
+        assert actual.terminal_kinetic_energy_j == pytest.approx(expected.terminal_kinetic_energy_j, rel=1e-9)
+        assert batch.steps[index] == len(expected.states) - 1
+
+
+def test_batch_per_fragment_parameters_match_individual_environments():
+    env = DarkflightEnvironment(profile=layered_profile(), drag_model="sphere")
+    states = fragments()
+    densities = [2500.0, 3300.0, 7800.0]
+    shape_factors = [1.0, 1.2, 0.9]
+
+    batch = run_trajectory_batch(
+        states,
+        ExplicitEulerIntegrator(),
+        env,
+        dt=0.1,
+        fragment_density_kg_m3=densities,
+        shape_factor=shape_factors,
+    )
+
+    for index, state in enumerate(states):
+        fragment_env = replace(env, fragment_density_kg_m3=densities[index], shape_factor=shape_factors[index])
+        expected = run_trajectory(state, ExplicitEulerIntegrator(), fragment_env, dt=0.1)
+        assert expected.impact_state is not None
+        assert batch.final_states[index, 1] == pytest.approx(expected.impact_state.x, rel=1e-9)
+        assert batch.flight_time_s[index] == pytest.approx(expected.flight_time_s, rel=1e-9)
+
+
+def test_batch_retires_fragments_individually():
+    env = DarkflightEnvironment(profile=layered_profile(), gravity_mps2=0.0, drag_coefficient=0.0)
+    states = [
+        State(t=0.0, x=0.0, y=0.0, z=10.0, vx=0.0, vy=0.0, vz=0.0, mass=1.0),
+        State(t=0.0, x=0.0, y=0.0, z=10.0, vx=0.0, vy=0.0, vz=-4.0, mass=1.0),
+        State(t=0.0, x=0.0, y=0.0, z=1e6, vx=0.0, vy=0.0, vz=-4.0, mass=1.0),
+    ]
+
+    batch = run_trajectory_batch(states, ExplicitEulerIntegrator(), env, dt=1.0, stall_speed_mps=0.1, max_steps=5)
+
+    assert batch.termination_reasons == (
+        TerminationReason.STALLED,
+        TerminationReason.GROUND,
+        TerminationReason.MAX_STEPS,
+    )
+    assert list(batch.steps) == [1, 3, 5]
+    assert batch.flight_time_s == pytest.approx([1.0, 2.5, 5.0])
+    assert batch.impacted.tolist() == [False, True, False]
+    assert np.isnan(batch.terminal_kinetic_energy_j[0])
+    assert batch.result(0).impact_state is None
+
+
+def test_batch_cd_table_tracks_analytic_drag_curve():
+    env = DarkflightEnvironment(profile=layered_profile(), drag_model="sphere")
+    states = fragments()
+
+    analytic = run_trajectory_batch(states, RungeKutta4Integrator(), env, dt=0.1)
+    tabulated = run_trajectory_batch(states, RungeKutta4Integrator(), env, dt=0.1, cd_table=CdTable.sphere())
+
+    np.testing.assert_allclose(tabulated.final_states[:, 1:3], analytic.final_states[:, 1:3], rtol=1e-5)
+    np.testing.assert_allclose(tabulated.flight_time_s, analytic.flight_time_s, rtol=1e-5)
+
+
+@pytest.mark.parametrize("integrator", [ExplicitEulerIntegrator(), RungeKutta4Integrator()])
+def test_batch_target_altitude_matches_scalar_altitude_event(integrator: Integrator):
+    env = DarkflightEnvironment(profile=layered_profile(), drag_model="sphere")
+    states = fragments()
+
+    batch = run_trajectory_batch(states, integrator, env, dt=0.1, target_altitude_m=4000.0)
+
+    assert batch.termination_reasons == (TerminationReason.EVENT,) * len(states)
+    for index, state in enumerate(states):
+        expected = run_trajectory(state, integrator, env, dt=0.1, events=[altitude_event(4000.0)])
+        assert batch.final_states[index, 3] == 4000.0
+        assert batch.flight_time_s[index] == pytest.approx(expected.flight_time_s, rel=1e-9)
+        assert batch.final_states[index, 1] == pytest.approx(expected.events[0].state.x, rel=1e-9)
+
+
+def test_strewn_field_sweep_is_ordered_and_reports_failures():
+    env = DarkflightEnvironment(profile=layered_profile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    terminus = State(t=0.0, x=0.0, y=0.0, z=12000.0, vx=900.0, vy=200.0, vz=-1500.0, mass=0.0)
+    masses = [0.01, 1.0, 50.0]
+    hypotheses = [FragmentHypothesis("stony"), FragmentHypothesis("iron", fragment_density_kg_m3=7800.0, drag_model="cube")]
+
+    serial = sweep_strewn_field(terminus, masses, env, hypotheses, max_steps=1000)
+    pooled = sweep_strewn_field(terminus, masses, env, hypotheses, max_steps=1000, workers=2, chunk_size=2)
+
+    assert pooled.outcomes == serial.outcomes
+    assert [task.index for task in pooled.tasks] == [0, 1, 2, 3]
+    assert [task.mass_count for task in pooled.tasks] == [2, 1, 2, 1]
+    assert all(task.elapsed_s >= 0.0 for task in pooled.tasks)
+    assert [(o.hypothesis, o.mass_kg) for o in serial.outcomes] == [
+        (name, mass) for name in ("stony", "iron") for mass in masses
+    ]
+    assert [(o.hypothesis, o.mass_kg, o.termination_reason) for o in serial.failures] == [
+        ("stony", 0.01, TerminationReason.MAX_STEPS),
+        ("iron", 0.01, TerminationReason.MAX_STEPS),
+        ("iron", 1.0, TerminationReason.MAX_STEPS),
+    ]
+    iron = run_trajectory(
+        terminus.with_updates(mass=50.0),
+        ExplicitEulerIntegrator(),
+        replace(env, fragment_density_kg_m3=7800.0, drag_model="cube"),
+        dt=0.1,
+    )
+    assert iron.impact_state is not None
+    assert serial.points("iron")[0][1] == pytest.approx(iron.impact_state.x, rel=1e-9)
+
+
+def test_strewn_field_sweep_consults_trajectory_cache():
+    env = DarkflightEnvironment(profile=layered_profile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    terminus = State(t=0.0, x=0.0, y=0.0, z=12000.0, vx=900.0, vy=200.0, vz=-1500.0, mass=0.0)
+    masses = [1.0, 50.0, 1.0]
+    cache = TrajectoryCache()
+
+    uncached = sweep_strewn_field(terminus, masses, env)
+    first = sweep_strewn_field(terminus, masses, env, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert [task.mass_count for task in first.tasks] == [2]
+
+    second = sweep_strewn_field(terminus, masses, env, cache=cache)
+    assert (cache.hits, cache.misses) == (4, 2)
+    assert second.tasks == ()
+    assert second.outcomes == first.outcomes == uncached.outcomes
+
+
+def test_landing_surrogate_interpolates_grid_and_reuses_saved_copy(tmp_path):
+    env = DarkflightEnvironment(profile=layered_profile(), drag_model="sphere")
+    grid = dict(
+        masses_kg=[0.5, 5.0, 50.0],
+        densities_kg_m3=[3300.0, 7800.0],
+        shape_factors=[1.0],
+        speeds_mps=[2500.0, 3500.0],
+        elevations_deg=[30.0, 50.0],
+        azimuths_deg=[200.0, 230.0],
+        dt=0.2,
+    )
+
+    surrogate = LandingSurrogate.build_or_load(tmp_path, env, 12000.0, **grid)
+
+    vx, vy, vz = entry_velocity(3500.0, 30.0, 230.0)
+    node = State(t=0.0, x=0.0, y=0.0, z=12000.0, vx=float(vx), vy=float(vy), vz=float(vz), mass=5.0)
+    expected = run_trajectory(node, ExplicitEulerIntegrator(), replace(env, fragment_density_kg_m3=7800.0), dt=0.2)
+    assert expected.impact_state is not None
+    x, y, flight_time = surrogate.predict(5.0, 7800.0, 1.3, 3500.0, 30.0, 230.0)
+    assert float(x) == pytest.approx(expected.impact_state.x, rel=1e-9)
+    assert float(y) == pytest.approx(expected.impact_state.y, rel=1e-9)
+    assert float(flight_time) == pytest.approx(expected.flight_time_s, rel=1e-9)
+    assert np.isnan(surrogate.predict(500.0, 3300.0, 1.0, 3000.0, 40.0, 215.0)[0])
+
+    report = surrogate.validate(env, 16, seed=3).as_dict()
+    assert report["failures"] == 0.0
+    assert 0.0 < report["mean_error_m"] <= report["max_error_m"]
+
+    saved = list(tmp_path.glob("*.npz"))
+    assert [path.stem for path in saved] == [surrogate.key]
+    assert surrogate.key.startswith(surrogate.profile_hash)
+    reloaded = LandingSurrogate.build_or_load(tmp_path, env, 12000.0, **grid)
+    np.testing.assert_array_equal(reloaded.impact_x_m, surrogate.impact_x_m)
+    with pytest.raises(ValueError, match="profile hash"):
+        surrogate.validate(replace(env, latitude_deg=60.0))
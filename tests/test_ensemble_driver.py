@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+import pickle
+
 import numpy as np
 import pytest
 
-from meteor_darkflight.ensemble_driver import run_ensemble
+from meteor_darkflight.ensemble_driver import (
+    ConvergenceCriteria,
+    DesignSampler,
+    EnsembleCheckpoint,
+    HaltonSampling,
+    LatinHypercubeSampling,
+    ParameterDistribution,
+    PerSampleGenerator,
+    PerSampleRunner,
+    RandomSampling,
+    SobolSampling,
+    load_spilled_runs,
+    resume_ensemble,
+    run_adaptive_ensemble,
+    run_batch_ensemble,
+    run_ensemble,
+    run_generator,
+    run_unscented_ensemble,
+)
 
 
 def sample_generator(rng: np.random.Generator, index: int) -> dict[str, float]:
@@ -39,3 +59,220 @@ def test_default_summary_computes_statistics():
     east_values = [run.result["east_m"] for run in ensemble["runs"]]
     assert summary.mean_east_m == pytest.approx(np.mean(east_values))
     assert summary.std_east_m == pytest.approx(np.std(east_values, ddof=0))
+
+
+def test_spawned_streams_are_independent_of_scheduling():
+    serial = run_ensemble(7, sample_generator, runner, seed=42, streams="spawned")
+    pooled = run_ensemble(7, sample_generator, runner, seed=42, streams="spawned", workers=2, chunk_size=3)
+
+    assert [run.result for run in pooled["runs"]] == [run.result for run in serial["runs"]]
+    assert pooled["manifest"] == serial["manifest"]
+    assert serial["manifest"]["spawn_keys"] == {"spawn_key": "(index,)", "count": 7}
+    assert pooled["summary"] == serial["summary"]
+
+    run = serial["runs"][4]
+    assert run.spawn_key == (4,)
+    assert sample_generator(run_generator(run.seed, run.spawn_key), 4) == run.sample
+    with pytest.raises(ValueError, match="spawned"):
+        run_ensemble(7, sample_generator, runner, workers=2)
+
+
+def test_streaming_ensemble_matches_retained_summary(tmp_path):
+    retained = run_ensemble(2000, sample_generator, runner, seed=5)
+    streamed = run_ensemble(2000, sample_generator, runner, seed=5, retain_runs=False, spill_path=tmp_path / "runs.pkl")
+
+    assert streamed["runs"] == []
+    expected = retained["summary"].as_dict()
+    for name, value in streamed["summary"].as_dict().items():
+        assert value == pytest.approx(expected[name], rel=1e-9)
+
+    statistics = streamed["statistics"]
+    east = np.array([run.result["east_m"] for run in retained["runs"]])
+    assert statistics.quantile("east_m", 0.5) == pytest.approx(np.median(east), abs=5.0)
+    assert statistics.quantile("east_m", 0.95) == pytest.approx(np.quantile(east, 0.95), abs=5.0)
+    assert statistics.as_dict()["east_m"]["max"] == east.max()
+    assert statistics.as_dict()["flight_time_s"] is None
+    assert list(load_spilled_runs(tmp_path / "runs.pkl")) == retained["runs"]
+
+
+def test_adaptive_ensemble_stops_once_landing_statistics_converge():
+    criteria = ConvergenceCriteria(mean_tolerance_m=2.0, axis_tolerance_m=5.0, batch_size=100, max_samples=5000)
+
+    adaptive = run_adaptive_ensemble(sample_generator, runner, criteria, seed=9)
+
+    convergence = adaptive["manifest"]["convergence"]
+    history = convergence["history"]
+    assert convergence["stopped"] == "converged"
+    # 50 m east spread: the standard error falls below 2 m after ~625 runs.
+    assert 600 <= adaptive["manifest"]["samples"] <= 800
+    assert [entry["samples"] for entry in history] == list(range(100, adaptive["manifest"]["samples"] + 1, 100))
+    assert history[-1]["mean_standard_error_m"] <= 2.0 < history[-2]["mean_standard_error_m"]
+    assert history[0]["axis_change_m"] is None
+
+    fixed = run_ensemble(adaptive["manifest"]["samples"], sample_generator, runner, seed=9, streams="spawned")
+    assert [run.result for run in adaptive["runs"]] == [run.result for run in fixed["runs"]]
+    assert adaptive["summary"] == fixed["summary"]
+
+    parallel = run_adaptive_ensemble(sample_generator, runner, criteria, seed=9, workers=2, chunk_size=50)
+    assert parallel["runs"] == adaptive["runs"]
+    assert parallel["manifest"]["convergence"]["history"][-1]["samples"] == adaptive["manifest"]["samples"]
+
+    capped = run_adaptive_ensemble(sample_generator, runner, ConvergenceCriteria(mean_tolerance_m=0.1, max_samples=250))
+    assert capped["manifest"]["convergence"]["stopped"] == "max_samples"
+    assert [entry["samples"] for entry in capped["manifest"]["convergence"]["history"]] == [100, 200, 250]
+
+
+def batch_generator(rng: np.random.Generator, indices: np.ndarray) -> dict[str, np.ndarray]:
+    return {
+        "east_m": rng.normal(loc=1000.0, scale=50.0, size=len(indices)),
+        "north_m": rng.normal(loc=-500.0, scale=25.0, size=len(indices)),
+    }
+
+
+def batch_runner(batch) -> dict[str, np.ndarray]:
+    return {"east_m": batch["east_m"], "north_m": batch["north_m"]}
+
+
+def test_batch_ensemble_wraps_per_sample_callables_exactly(tmp_path):
+    expected = run_ensemble(10, sample_generator, runner, seed=42)
+    wrapped = run_batch_ensemble(10, PerSampleGenerator(sample_generator), PerSampleRunner(runner), seed=42, batch_size=4)
+
+    assert wrapped["runs"] == expected["runs"]
+    assert wrapped["summary"] == expected["summary"]
+    assert wrapped["manifest"] == {**expected["manifest"], "batch_size": 4}
+
+    batched = run_batch_ensemble(1000, batch_generator, batch_runner, seed=3, batch_size=256)
+    assert [run.index for run in batched["runs"]] == list(range(1000))
+    assert batched["runs"][300].seed == batched["runs"][511].seed != batched["runs"][200].seed
+    assert batched["summary"].mean_east_m == pytest.approx(1000.0, abs=5.0)
+    assert batched["summary"].std_north_m == pytest.approx(25.0, rel=0.1)
+
+    checkpoint = tmp_path / "batch.ckpt"
+    calls = []
+
+    def interrupted_runner(batch):
+        calls.append(len(batch))
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return batch_runner(batch)
+
+    with pytest.raises(KeyboardInterrupt):
+        run_batch_ensemble(
+            1000, batch_generator, interrupted_runner, seed=3, batch_size=256, checkpoint_path=checkpoint, checkpoint_every=100
+        )
+    assert EnsembleCheckpoint.load(checkpoint).completed == 512
+    resumed = resume_ensemble(checkpoint, batch_generator, batch_runner)
+    assert resumed["runs"] == batched["runs"]
+    assert resumed["manifest"] == batched["manifest"]
+    with pytest.raises(ValueError, match="result column"):
+        run_batch_ensemble(4, batch_generator, lambda batch: {"east_m": batch["east_m"][:1]})
+
+
+def test_latin_hypercube_design_is_stratified():
+    distributions = {
+        "mass_kg": ParameterDistribution.log_uniform(0.1, 100.0),
+        "cd_scale": ParameterDistribution.uniform(0.8, 1.2),
+        "speed_mps": ParameterDistribution.normal(3000.0, 200.0),
+    }
+
+    design = LatinHypercubeSampling().design(50, distributions, seed=3)
+
+    strata = np.floor(np.log10(design["mass_kg"] / 0.1) / 3.0 * 50).astype(int)
+    assert sorted(strata) == list(range(50))
+    assert sorted(np.floor((design["cd_scale"] - 0.8) / 0.4 * 50).astype(int)) == list(range(50))
+    assert design["speed_mps"].mean() == pytest.approx(3000.0, abs=5.0)
+    assert design["speed_mps"].std() == pytest.approx(200.0, rel=0.05)
+
+
+@pytest.mark.parametrize("strategy", [LatinHypercubeSampling(), SobolSampling(), HaltonSampling()])
+def test_space_filling_designs_converge_faster_than_random(strategy):
+    distributions = {name: ParameterDistribution.uniform(0.0, 1.0) for name in ("a", "b", "c")}
+    exact = (np.e - 1.0) * 1.5 * (np.e - 1.0)
+
+    def mean_error(design: dict[str, np.ndarray]) -> float:
+        values = np.exp(design["a"]) * (1.0 + design["b"]) * np.exp(design["c"])
+        return abs(values.mean() - exact)
+
+    random_error = max(mean_error(RandomSampling().design(256, distributions, seed)) for seed in range(3))
+    design_error = max(mean_error(strategy.design(256, distributions, seed)) for seed in range(3))
+    assert design_error < random_error / 2.0
+
+
+def test_design_sampler_feeds_run_ensemble_and_manifest():
+    distributions = {
+        "east_m": ParameterDistribution.normal(1000.0, 50.0),
+        "north_m": ParameterDistribution.normal(-500.0, 25.0),
+    }
+    sampler = DesignSampler(SobolSampling(), 16, distributions, seed=2)
+
+    ensemble = run_ensemble(16, sampler, runner, streams="spawned")
+
+    assert ensemble["manifest"]["sampling"]["strategy"] == "sobol"
+    assert ensemble["manifest"]["sampling"]["parameters"]["east_m"] == {"kind": "normal", "a": 1000.0, "b": 50.0}
+    assert [run.sample["east_m"] for run in ensemble["runs"]] == sampler.design["east_m"].tolist()
+    with pytest.raises(ValueError, match="fewer samples"):
+        run_ensemble(17, sampler, runner)
+
+
+class InterruptedRunner:
+    def __init__(self, fail_at: int) -> None:
+        self.fail_at = fail_at
+
+    def __call__(self, sample: dict[str, float]) -> dict[str, float]:
+        if sample["index"] == self.fail_at:
+            raise KeyboardInterrupt
+        return runner(sample)
+
+
+@pytest.mark.parametrize("streams", ["shared", "spawned"])
+@pytest.mark.parametrize("retain_runs", [True, False])
+def test_resumed_ensemble_matches_uninterrupted_run(tmp_path, streams, retain_runs):
+    options = dict(seed=11, streams=streams, retain_runs=retain_runs)
+    expected = run_ensemble(20, sample_generator, runner, spill_path=tmp_path / "expected.pkl", **options)
+
+    checkpoint = tmp_path / "ensemble.ckpt"
+    with pytest.raises(KeyboardInterrupt):
+        run_ensemble(
+            20,
+            sample_generator,
+            InterruptedRunner(fail_at=13),
+            spill_path=tmp_path / "runs.pkl",
+            checkpoint_path=checkpoint,
+            checkpoint_every=4,
+            **options,
+        )
+    with checkpoint.open("rb") as handle:
+        assert pickle.load(handle).runs == []
+    interrupted = EnsembleCheckpoint.load(checkpoint)
+    assert interrupted.completed > 0
+    assert [run.index for run in interrupted.runs] == (list(range(interrupted.completed)) if retain_runs else [])
+    resumed = resume_ensemble(checkpoint, sample_generator, runner)
+
+    assert resumed["manifest"] == expected["manifest"]
+    assert resumed["summary"] == expected["summary"]
+    assert resumed["runs"] == expected["runs"]
+    assert list(load_spilled_runs(tmp_path / "runs.pkl")) == list(load_spilled_runs(tmp_path / "expected.pkl"))
+    if not retain_runs:
+        assert resumed["statistics"].as_dict() == expected["statistics"].as_dict()
+
+
+def quadratic_runner(sample: dict[str, float]) -> dict[str, float]:
+    return {"east_m": sample["speed"] ** 2, "north_m": 3.0 * sample["speed"] + sample["wind"]}
+
+
+def test_unscented_ensemble_recovers_moments_of_quadratic_response():
+    mean = [20.0, -4.0]
+    covariance = [[4.0, 1.0], [1.0, 9.0]]
+
+    ensemble = run_unscented_ensemble(mean, covariance, quadratic_runner, parameter_names=["speed", "wind"], kappa=1.0)
+    summary = ensemble["summary"]
+
+    # For a normal speed s: E[s^2] = mu^2 + var, Var[s^2] = 4 mu^2 var + 2 var^2;
+    # the transform is exact for the mean and to second order for the spread.
+    assert summary.count == 5
+    assert summary.mean_east_m == pytest.approx(20.0**2 + 4.0)
+    assert summary.std_east_m == pytest.approx(np.sqrt(4 * 20.0**2 * 4.0 + 2 * 4.0**2), rel=0.01)
+    assert summary.mean_north_m == pytest.approx(3.0 * 20.0 - 4.0)
+    assert summary.std_north_m == pytest.approx(np.sqrt(9.0 * 4.0 + 9.0 + 6.0 * 1.0))
+    assert ensemble["covariance"][0, 1] == pytest.approx(2 * 20.0 * (3.0 * 4.0 + 1.0))
+    assert ensemble["runs"][0].sample == {"speed": 20.0, "wind": -4.0}
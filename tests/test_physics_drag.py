@@ -4,15 +4,24 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
 from meteor_darkflight.physics_core import (
+    CdTable,
     DragParams,
+    calculate_cube_cd,
+    calculate_cube_cd_array,
+    calculate_sphere_cd,
+    calculate_sphere_cd_array,
     cross_section_from_mass_density,
+    cross_section_from_mass_density_array,
     drag_acceleration,
     drag_acceleration_vector,
+    drag_acceleration_vector_array,
     drag_force,
     dynamic_pressure,
+    dynamic_pressure_array,
     radius_from_mass_density,
     relative_velocity,
     speed_magnitude,
@@ -57,3 +66,34 @@ def test_geometry_helpers_match_known_values():
 def test_drag_acceleration_requires_positive_mass():
     with pytest.raises(ValueError):
         drag_acceleration(1.0, 0.0)
+
+
+def test_array_helpers_match_scalar_versions():
+    mach = np.array([0.0, 0.3, 0.722, 0.9, 1.15, 1.6, 4.0])
+    np.testing.assert_allclose(calculate_sphere_cd_array(mach), [calculate_sphere_cd(m) for m in mach], rtol=1e-14)
+    np.testing.assert_allclose(calculate_cube_cd_array(mach), [calculate_cube_cd(m) for m in mach], rtol=1e-14)
+
+    masses = np.array([0.001, 0.5, 20.0])
+    np.testing.assert_allclose(
+        cross_section_from_mass_density_array(masses, 3320.0),
+        [cross_section_from_mass_density(m, 3320.0) for m in masses],
+        rtol=1e-14,
+    )
+    np.testing.assert_allclose(dynamic_pressure_array([1.2, 0.4], [10.0, 300.0]), [60.0, 18000.0])
+
+    velocity = np.array([[50.0, -10.0, -5.0], [12.0, -8.0, 0.0], [3.0, 4.0, -12.0]])
+    wind = (12.0, -8.0, 0.0)
+    accel = drag_acceleration_vector_array(velocity, wind, 1.2, [2.0, 1.0, 0.5], 1.0, 0.01)
+    for row, mass, expected in zip(velocity, (2.0, 1.0, 0.5), accel):
+        scalar = drag_acceleration_vector(tuple(row), wind, 1.2, mass, DragParams(cd=1.0, area_m2=0.01))
+        np.testing.assert_allclose(expected, scalar, rtol=1e-12, atol=0.0)
+
+
+def test_cd_table_interpolates_curves_and_keeps_regime_breakpoints():
+    table = CdTable.sphere(mach_max=5.0, step=1e-3)
+    mach = np.linspace(0.0, 5.0, 997)
+    np.testing.assert_allclose(table(mach), calculate_sphere_cd_array(mach), atol=1e-6)
+    assert table(0.722) == pytest.approx(calculate_sphere_cd(0.722), abs=1e-15)
+    assert table(50.0) == pytest.approx(calculate_sphere_cd(5.0))
+    with pytest.raises(ValueError):
+        CdTable(mach=np.array([0.0, 0.0]), cd=np.array([1.0, 1.0]))
@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
+import json
+import math
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from meteor_darkflight.physics_core import (
+    DormandPrince54Integrator,
     ExplicitEulerIntegrator,
     RungeKutta4Integrator,
+    SimpleAblationParams,
     State,
 )
+from meteor_darkflight.sim_kernel.cache import (
+    TrajectoryCache,
+    ballistic_coefficient,
+    environment_fingerprint,
+)
 from meteor_darkflight.sim_kernel.environment import (
     AtmosphericLevel,
     AtmosphericProfile,
+    CompiledDarkflightEnvironment,
     DarkflightEnvironment,
 )
-from meteor_darkflight.sim_kernel.integrator import TerminationReason, run_trajectory
+from meteor_darkflight.sim_kernel.events import altitude_event, mach_event, speed_event
+from meteor_darkflight.sim_kernel.integrator import (
+    RecordingPolicy,
+    TerminationReason,
+    run_trajectory,
+)
+from meteor_darkflight.sim_kernel.jit import JitDerivatives
+from meteor_darkflight.sim_kernel.mass_finder import FlightTimeTable, find_mass_for_flight_time
+from meteor_darkflight.sim_kernel.reverse_integration import (
+    run_reverse_trajectory,
+    run_reverse_trajectory_batch,
+)
+from meteor_darkflight.sim_kernel.slices import SliceTable, run_slice_trajectory
+from meteor_darkflight.sim_kernel.storage import StateArray
+from meteor_darkflight.sim_kernel.terminal import TerminalDescentPolicy, compare_terminal_descent
 
 
 def constant_profile() -> AtmosphericProfile:
@@ -51,3 +78,483 @@ def test_run_trajectory_reports_stall_when_speed_small():
     assert result.termination_reason is TerminationReason.STALLED
     assert result.impact_state is None
     assert result.flight_time_s == pytest.approx(1.0)
+
+
+def sounding_profile() -> AtmosphericProfile:
+    raw = [
+        (float(z), 101325.0 * math.exp(-z / 8000.0), 288.15 - 0.0065 * min(z, 11000), 12.0 * math.sin(z / 3000.0), 4.0)
+        for z in range(0, 30000, 370)
+    ]
+    return AtmosphericProfile.from_raw_levels(raw)
+
+
+def test_compiled_profile_matches_scalar_lookups_exactly():
+    profile = sounding_profile()
+    compiled = profile.compile()
+    altitudes = [-50.0, 0.0, 370.0, 371.5, 12345.6, 29600.0, 29970.0, 40000.0]
+    altitudes += [level.altitude_m for level in profile.levels[::7]]
+
+    for altitude in altitudes:
+        assert compiled.density(altitude) == profile.density(altitude)
+        assert compiled.wind(altitude) == profile.wind(altitude)
+        assert compiled.temperature(altitude) == profile.temperature(altitude)
+        assert compiled.speed_of_sound(altitude) == profile.speed_of_sound(altitude)
+
+
+def test_compiled_profile_vectorised_queries_match_scalar():
+    profile = sounding_profile()
+    compiled = profile.compile(cells_per_level=2)
+    altitudes = np.linspace(-100.0, 31000.0, 257)
+
+    density = compiled.density_array(altitudes)
+    wind_u, wind_v = compiled.wind_array(altitudes)
+    sound = compiled.speed_of_sound_array(altitudes)
+
+    for index, altitude in enumerate(altitudes):
+        assert density[index] == pytest.approx(profile.density(altitude), rel=1e-12)
+        assert (wind_u[index], wind_v[index]) == pytest.approx(profile.wind(altitude)[:2], rel=1e-12, abs=1e-12)
+        assert sound[index] == pytest.approx(profile.speed_of_sound(altitude), rel=1e-12)
+
+
+def test_compiled_profile_is_drop_in_for_environment():
+    profile = sounding_profile()
+    state = State(t=0.0, x=0.0, y=0.0, z=15000.0, vx=800.0, vy=0.0, vz=-1200.0, mass=2.0)
+    results = [
+        run_trajectory(state, RungeKutta4Integrator(), DarkflightEnvironment(profile=p, drag_model="sphere"), dt=0.1)
+        for p in (profile, profile.compile())
+    ]
+
+    assert results[0].impact_state == results[1].impact_state
+
+
+def test_adaptive_integrator_matches_fine_rk4_with_far_fewer_steps():
+    env = DarkflightEnvironment(profile=sounding_profile().compile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=17000.0, vx=1000.0, vy=500.0, vz=-2500.0, mass=1.0)
+
+    reference = run_trajectory(state, RungeKutta4Integrator(), env, dt=0.02, max_steps=100_000)
+    adaptive = run_trajectory(state, DormandPrince54Integrator(), env, dt=0.1)
+
+    assert adaptive.termination_reason is TerminationReason.GROUND
+    assert len(adaptive.states) < len(reference.states) / 50
+    assert adaptive.flight_time_s == pytest.approx(reference.flight_time_s, abs=0.01)
+    assert adaptive.impact_state.x == pytest.approx(reference.impact_state.x, abs=1.0)
+    assert adaptive.impact_state.y == pytest.approx(reference.impact_state.y, abs=1.0)
+
+
+def test_dense_output_locates_ground_exactly_with_large_steps():
+    env = DarkflightEnvironment(profile=constant_profile(), gravity_mps2=9.81, drag_coefficient=0.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=100.0, vx=30.0, vy=0.0, vz=-20.0, mass=1.0)
+    expected_t = (-20.0 + math.sqrt(20.0**2 + 2 * 9.81 * 100.0)) / 9.81
+
+    result = run_trajectory(state, RungeKutta4Integrator(), env, dt=1.0)
+
+    assert result.impact_state is not None
+    assert result.flight_time_s == pytest.approx(expected_t, rel=1e-9)
+    assert result.impact_state.x == pytest.approx(30.0 * expected_t, rel=1e-9)
+    assert result.impact_state.z == 0.0
+
+
+class SingleStepRK4(RungeKutta4Integrator):
+    def step_dense(self, state, dt, env):
+        raise AssertionError("run_trajectory should not integrate a step twice")
+
+
+def test_fixed_step_dense_output_reuses_the_step_taken():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere")
+    state = State(t=0.0, x=0.0, y=0.0, z=6000.0, vx=200.0, vy=0.0, vz=-100.0, mass=1.0)
+    options = dict(
+        dt=0.5,
+        recording=RecordingPolicy.altitude_slices([4500.0, 1500.0]),
+        events=[altitude_event(3000.0, terminal=False)],
+    )
+
+    expected = run_trajectory(state, RungeKutta4Integrator(), env, **options)
+    reused = run_trajectory(state, SingleStepRK4(), env, **options)
+
+    assert reused.impact_state is not None and [record.state.z for record in reused.events] == pytest.approx([3000.0])
+    assert reused.states.data.tolist() == expected.states.data.tolist()
+    assert reused.impact_state == expected.impact_state
+    assert reused.events == expected.events
+
+
+def test_events_are_recorded_and_terminal_events_stop_integration():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=17000.0, vx=1000.0, vy=0.0, vz=-2500.0, mass=1.0)
+
+    result = run_trajectory(
+        state,
+        DormandPrince54Integrator(),
+        env,
+        dt=0.1,
+        events=[
+            mach_event(env.profile),
+            speed_event(200.0, terminal=False),
+            altitude_event(5000.0),
+        ],
+    )
+
+    assert result.termination_reason is TerminationReason.EVENT
+    assert [record.name for record in result.events] == ["mach_1", "speed_200mps", "altitude_5000m"]
+    mach_state = result.events[0].state
+    wind_u, wind_v, _ = env.profile.wind(mach_state.z)
+    rel_speed = math.hypot(mach_state.vx - wind_u, mach_state.vy - wind_v, mach_state.vz)
+    assert rel_speed / env.profile.speed_of_sound(mach_state.z) == pytest.approx(1.0, abs=1e-6)
+    assert result.events[1].state.speed() == pytest.approx(200.0, abs=1e-6)
+    assert result.states[-1].z == pytest.approx(5000.0, abs=1e-6)
+    assert result.flight_time_s == pytest.approx(result.events[-1].state.t)
+
+
+def test_negative_dt_with_rising_altitude_event_integrates_backwards():
+    env = DarkflightEnvironment(profile=constant_profile(), gravity_mps2=9.81, drag_coefficient=0.0)
+    state = State(t=10.0, x=0.0, y=0.0, z=0.0, vx=5.0, vy=0.0, vz=-40.0, mass=1.0)
+
+    result = run_trajectory(
+        state,
+        RungeKutta4Integrator(),
+        env,
+        dt=-0.5,
+        events=[altitude_event(50.0, direction=1)],
+    )
+
+    assert result.termination_reason is TerminationReason.EVENT
+    back = result.events[0].state
+    # z(10 - tau) = 40 tau - 4.905 tau^2 first reaches 50 m at the smaller root.
+    tau = (40.0 - math.sqrt(40.0**2 - 4 * 4.905 * 50.0)) / (2 * 4.905)
+    assert back.t == pytest.approx(10.0 - tau, rel=1e-9)
+    assert back.x == pytest.approx(-5.0 * tau, rel=1e-9)
+
+
+def test_recording_policies_thin_states_without_changing_metrics():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=12000.0, vx=600.0, vy=0.0, vz=-900.0, mass=2.0)
+
+    full = run_trajectory(state, RungeKutta4Integrator(), env, dt=0.1)
+    summary = run_trajectory(state, RungeKutta4Integrator(), env, dt=0.1, recording=RecordingPolicy.summary())
+    decimated = run_trajectory(state, RungeKutta4Integrator(), env, dt=0.1, recording=RecordingPolicy.every(100))
+    sliced = run_trajectory(
+        state,
+        RungeKutta4Integrator(),
+        env,
+        dt=0.1,
+        recording=RecordingPolicy.altitude_spacing(1000.0, top_m=12000.0),
+    )
+
+    for result in (summary, decimated, sliced):
+        assert result.as_dict() == full.as_dict()
+        assert result.impact_state == full.impact_state
+        assert result.states[0] == state
+        assert result.states[-1] == full.states[-1]
+    assert len(summary.states) == 2
+    assert list(decimated.states[1:-1]) == list(full.states[100:-1:100])
+    assert [s.z for s in sliced.states[1:-1]] == [float(z) for z in range(11000, 0, -1000)]
+    for slice_state in sliced.states[1:-1]:
+        assert full.states[0].t < slice_state.t < full.states[-1].t
+
+
+def test_trajectory_states_are_columnar_and_round_trip_through_npy(tmp_path):
+    env = DarkflightEnvironment(profile=constant_profile(), gravity_mps2=9.81, drag_coefficient=0.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=100.0, vx=30.0, vy=0.0, vz=-20.0, mass=1.0)
+
+    result = run_trajectory(state, RungeKutta4Integrator(), env, dt=0.05)
+
+    assert isinstance(result.states, StateArray)
+    assert result.states[0] == state
+    assert result.states[-1] == result.impact_state
+    assert np.shares_memory(result.z, result.states.data)
+    assert result.z.tolist() == [s.z for s in result.states]
+    assert result.vx[-1] == result.impact_state.vx
+    assert isinstance(result.states[1:3], StateArray) and len(result.states[1:3]) == 2
+    with pytest.raises(ValueError):
+        result.z[0] = 1.0
+
+    path = tmp_path / "trajectory.npy"
+    result.states.save(path)
+    reloaded = StateArray.load(path)
+    assert not reloaded.data.flags.writeable
+    assert reloaded == result.states
+    assert list(reloaded) == list(result.states)
+
+
+def test_environment_single_call_derivatives_match_per_state_hooks():
+    env = DarkflightEnvironment(
+        profile=sounding_profile(),
+        drag_model="sphere",
+        latitude_deg=41.5,
+        ablation=SimpleAblationParams(k_ab=1e-12),
+    )
+    state = State(t=0.0, x=0.0, y=0.0, z=9000.0, vx=400.0, vy=50.0, vz=-700.0, mass=3.0)
+
+    assert env.derivatives(state.as_tuple()) == (
+        state.vx,
+        state.vy,
+        state.vz,
+        *env.acceleration(state),
+        env.mass_derivative(state),
+    )
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"drag_model": "sphere", "latitude_deg": 41.5},
+        {"drag_model": "cube", "ablation": SimpleAblationParams(k_ab=1e-12)},
+        {"drag_coefficient": 0.8, "shape_factor": 1.2},
+    ],
+)
+def test_jit_kernel_matches_python_derivatives(overrides):
+    env = DarkflightEnvironment(profile=sounding_profile(), use_jit=False, **overrides)
+    kernel = JitDerivatives(env)
+    states = [
+        (0.0, 0.0, 0.0, 17000.0, 1000.0, 0.0, -2500.0, 1.0),
+        (0.0, 0.0, 0.0, 9000.0, 400.0, 50.0, -700.0, 3.0),
+        (0.0, 0.0, 0.0, 1500.0, 8.0, -1.0, -30.0, 0.2),
+        (0.0, 0.0, 0.0, -5.0, 0.0, 0.0, -40.0, 1e-4),
+        (0.0, 0.0, 0.0, 50000.0, 0.0, 0.0, 0.0, 1.0),
+    ]
+
+    for values in states:
+        expected = env.derivatives(values)
+        actual = kernel(values)
+        assert actual == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"drag_model": "sphere", "latitude_deg": 41.5},
+        {"drag_model": "cube", "ablation": SimpleAblationParams(k_ab=1e-12)},
+        {"drag_coefficient": 0.8, "shape_factor": 1.2, "wind_model": lambda z: (3.0, -1.0, 0.5)},
+    ],
+)
+def test_compiled_environment_is_bit_identical(overrides):
+    env = DarkflightEnvironment(profile=sounding_profile(), use_jit=False, **overrides)
+    compiled = env.compile()
+
+    assert isinstance(compiled, CompiledDarkflightEnvironment)
+    assert env.compile() is compiled
+    assert compiled.compile() is compiled
+    for z, vx, vz, mass in [(17000.0, 1000.0, -2500.0, 1.0), (1500.0, 8.0, -30.0, 0.2), (-5.0, 0.0, 0.0, 1e-4)]:
+        state = State(t=0.0, x=0.0, y=0.0, z=z, vx=vx, vy=1.0, vz=vz, mass=mass)
+        assert compiled.acceleration(state) == env.acceleration(state)
+        assert compiled.mass_derivative(state) == env.mass_derivative(state)
+        assert compiled.derivatives(state.as_tuple()) == env.derivatives(state.as_tuple())
+
+    env.shape_factor = 2.0
+    assert env.compile() is not compiled
+    assert env.compile().shape_factor == 2.0
+
+    recompiled = env.compile()
+    env.profile.levels[0] = AtmosphericLevel(
+        altitude_m=0.0, density_kg_m3=0.5, temperature_k=288.15, wind_u_mps=0.0, wind_v_mps=0.0
+    )
+    assert env.compile() is not recompiled
+    assert env.compile().profile.density(0.0) == 0.5
+    env.profile = sounding_profile()
+    assert env.compile().profile.density(0.0) == sounding_profile().density(0.0)
+
+
+def test_flight_time_table_inverts_to_bisection_mass():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3000.0)
+    terminus = State(t=0.0, x=0.0, y=0.0, z=17000.0, vx=1500.0, vy=0.0, vz=-1500.0, mass=1.0)
+    truth = run_trajectory(terminus.with_updates(mass=7.0), ExplicitEulerIntegrator(), env, dt=0.1, events=[altitude_event(6000.0)])
+    duration = truth.events[0].state.t
+
+    table = FlightTimeTable.build(terminus, 6000.0, env, mass_min_kg=0.1, mass_max_kg=100.0, samples=48)
+    bisection = find_mass_for_flight_time(terminus, 6000.0, duration, env, mass_min_kg=0.1, mass_max_kg=100.0)
+    refined = find_mass_for_flight_time(
+        terminus, 6000.0, duration, env, mass_min_kg=0.1, mass_max_kg=100.0, method="table", table_samples=48
+    )
+
+    assert np.all(np.diff(table.flight_times_s) < 0)
+    assert float(table.mass_for(duration)) == pytest.approx(7.0, rel=1e-2)
+    assert refined == pytest.approx(bisection, abs=2e-3)
+    assert table.flight_time(table.masses_kg) == pytest.approx(table.flight_times_s)
+    low, high = table.duration_range_s
+    masses = table.mass_for([low - 1.0, duration, high + 1.0])
+    assert np.isnan(masses[0]) and np.isnan(masses[2])
+    with pytest.raises(ValueError):
+        find_mass_for_flight_time(terminus, 6000.0, high + 1.0, env, mass_min_kg=0.1, mass_max_kg=100.0, method="table")
+
+
+def test_flight_time_table_runs_adaptive_integrators_one_mass_at_a_time():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3000.0)
+    terminus = State(t=0.0, x=0.0, y=0.0, z=17000.0, vx=1500.0, vy=0.0, vz=-1500.0, mass=1.0)
+    options = dict(mass_min_kg=0.1, mass_max_kg=100.0, samples=8)
+
+    adaptive = FlightTimeTable.build(terminus, 6000.0, env, integrator=DormandPrince54Integrator(), **options)
+    batched = FlightTimeTable.build(terminus, 6000.0, env, integrator=RungeKutta4Integrator(), dt=0.05, **options)
+    assert adaptive.flight_times_s == pytest.approx(batched.flight_times_s, abs=5e-3)
+
+    truth = run_trajectory(
+        terminus.with_updates(mass=7.0), DormandPrince54Integrator(), env, dt=0.1, events=[altitude_event(6000.0)]
+    )
+    mass = find_mass_for_flight_time(
+        terminus,
+        6000.0,
+        truth.events[0].state.t,
+        env,
+        mass_min_kg=0.1,
+        mass_max_kg=100.0,
+        integrator=DormandPrince54Integrator(),
+        method="table",
+        table_samples=8,
+    )
+    assert mass == pytest.approx(7.0, rel=1e-3)
+
+
+def test_batched_reverse_integration_matches_scalar_terminus():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3000.0)
+    radar_states = [
+        State(t=30.0, x=4000.0 + 50.0 * i, y=-20.0 * i, z=6000.0, vx=120.0, vy=5.0 * i, vz=-150.0 - 10.0 * i, mass=mass)
+        for i, mass in enumerate((0.5, 2.0, 8.0))
+    ]
+    radar_states.append(radar_states[0].with_updates(z=18000.0))
+
+    estimate = run_reverse_trajectory_batch(radar_states, 15000.0, env)
+
+    assert estimate.reached.tolist() == [True, True, True, True]
+    for index, state in enumerate(radar_states[:3]):
+        expected = run_reverse_trajectory(state, 15000.0, env)
+        actual = estimate.state(index)
+        assert actual.z == 15000.0
+        assert actual.t == pytest.approx(expected.t, rel=1e-9)
+        assert actual.x == pytest.approx(expected.x, rel=1e-9)
+        assert actual.y == pytest.approx(expected.y, rel=1e-9, abs=1e-6)
+    assert estimate.state(3) == radar_states[3]
+    assert estimate.centroid == pytest.approx(tuple(estimate.points.mean(axis=0)))
+    np.testing.assert_allclose(estimate.covariance, np.cov(estimate.points.T))
+    assert run_reverse_trajectory_batch([], 15000.0, env).centroid == (0.0, 0.0)
+
+
+def test_reverse_trajectory_keeps_original_euler_update():
+    env = DarkflightEnvironment(
+        profile=sounding_profile(), drag_model="sphere", ablation=SimpleAblationParams(k_ab=1e-8), use_jit=False
+    )
+    radar = State(t=30.0, x=4000.0, y=-20.0, z=6000.0, vx=120.0, vy=5.0, vz=-150.0, mass=2.0)
+
+    # The pre-refactor loop: start-of-step velocity for position, constant mass.
+    dt = -0.1
+    previous = state = radar
+    while state.z < 15000.0:
+        ax, ay, az = env.acceleration(state)
+        previous, state = state, State(
+            state.t + dt,
+            state.x + state.vx * dt,
+            state.y + state.vy * dt,
+            state.z + state.vz * dt,
+            state.vx + ax * dt,
+            state.vy + ay * dt,
+            state.vz + az * dt,
+            state.mass,
+        )
+    theta = (15000.0 - previous.z) / (state.z - previous.z)
+
+    terminus = run_reverse_trajectory(radar, 15000.0, env, dt=dt)
+
+    assert terminus.mass == radar.mass
+    for name in ("t", "x", "y", "vx", "vy", "vz"):
+        expected = getattr(previous, name) + theta * (getattr(state, name) - getattr(previous, name))
+        assert getattr(terminus, name) == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_terminal_descent_fast_path_tracks_full_integration():
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=17000.0, vx=1500.0, vy=0.0, vz=-1500.0, mass=0.01)
+
+    comparison = compare_terminal_descent(state, ExplicitEulerIntegrator(), env, dt=0.1)
+
+    assert comparison.fast.termination_reason is TerminationReason.GROUND
+    assert comparison.fast.terminal_descent is not None
+    assert comparison.steps_saved > (len(comparison.full.states) - 1) // 2
+    assert comparison.impact_offset_m < 5.0
+    assert abs(comparison.flight_time_error_s) < 0.25
+    assert abs(comparison.terminal_speed_error_mps) < 0.1
+
+    sliced = run_trajectory(
+        state,
+        ExplicitEulerIntegrator(),
+        env,
+        dt=0.1,
+        recording=RecordingPolicy.altitude_spacing(1000.0, 17000.0),
+        terminal_descent=TerminalDescentPolicy(),
+    )
+    assert sliced.impact_state == comparison.fast.impact_state
+    assert 1000.0 in sliced.z.tolist()
+    with pytest.raises(ValueError):
+        run_trajectory(state, ExplicitEulerIntegrator(), env, events=[altitude_event(10.0)], terminal_descent=TerminalDescentPolicy())
+
+
+def test_slice_integrator_steps_layer_by_layer_and_writes_vertical_grid(tmp_path):
+    env = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3300.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=17000.0, vx=1500.0, vy=0.0, vz=-1500.0, mass=1.0)
+
+    coarse = run_slice_trajectory(state, env)
+    assert coarse.trajectory.termination_reason is TerminationReason.GROUND
+    assert len(coarse.slices) == int(np.sum(coarse.table.bottoms_m < 17000.0))
+    for upper, lower in zip(coarse.slices, coarse.slices[1:]):
+        assert lower.top == upper.bottom
+        assert lower.index == upper.index - 1
+
+    table = SliceTable.from_profile(env.profile, max_slice_m=25.0)
+    fine = run_slice_trajectory(state, env, table)
+    reference = run_trajectory(state, RungeKutta4Integrator(), env, dt=0.01, recording=RecordingPolicy.summary())
+    assert fine.trajectory.impact_state is not None and reference.impact_state is not None
+    assert fine.trajectory.impact_state.x == pytest.approx(reference.impact_state.x, abs=2.0)
+    assert fine.trajectory.flight_time_s == pytest.approx(reference.flight_time_s, abs=0.05)
+
+    path = tmp_path / "vertical_grid.json"
+    coarse.write_vertical_grid(path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    schema_path = Path(__file__).resolve().parents[1] / "docs" / "schemas" / "vertical_grid.schema.json"
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    item = schema["properties"]["slices"]["items"]
+    assert set(payload) <= set(schema["properties"])
+    assert len(payload["slices"]) == len(coarse.table)
+    for row in payload["slices"]:
+        assert set(item["required"]) <= set(row) <= set(item["properties"])
+    in_range = [row for row in payload["slices"] if row["in_range"]]
+    assert sum(row["time_in_slice_s"] for row in in_range) == pytest.approx(coarse.trajectory.flight_time_s)
+
+
+def test_trajectory_cache_replays_equal_ballistic_coefficients(tmp_path):
+    stony = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3000.0)
+    # m / A is unchanged when density scales as mass^(-1/2).
+    porous = DarkflightEnvironment(profile=sounding_profile(), drag_model="sphere", fragment_density_kg_m3=3000.0 / 8**0.5)
+    first = State(t=0.0, x=0.0, y=0.0, z=8000.0, vx=300.0, vy=20.0, vz=-200.0, mass=1.0)
+    second = State(t=5.0, x=120.0, y=-40.0, z=8000.0, vx=300.0, vy=20.0, vz=-200.0, mass=8.0)
+    assert ballistic_coefficient(8.0, porous) == pytest.approx(ballistic_coefficient(1.0, stony), rel=1e-12)
+
+    cache = TrajectoryCache(maxsize=1, directory=tmp_path)
+    run_trajectory(first, RungeKutta4Integrator(), stony, dt=0.1, cache=cache)
+    replayed = run_trajectory(second, RungeKutta4Integrator(), porous, dt=0.1, cache=cache)
+    fresh = run_trajectory(second, RungeKutta4Integrator(), porous, dt=0.1)
+
+    assert cache.stats.as_dict()["hits"] == 1 and cache.misses == 1
+    assert replayed.impact_state is not None and fresh.impact_state is not None
+    assert replayed.states.data == pytest.approx(fresh.states.data, rel=1e-9, abs=1e-6)
+    assert replayed.terminal_kinetic_energy_j == pytest.approx(fresh.terminal_kinetic_energy_j, rel=1e-9)
+
+    run_trajectory(first, RungeKutta4Integrator(), stony, dt=0.2, cache=cache)
+    assert cache.evictions == 1 and len(cache) == 1
+
+    reloaded = TrajectoryCache(directory=tmp_path)
+    again = run_trajectory(second, RungeKutta4Integrator(), porous, dt=0.1, cache=reloaded)
+    assert reloaded.disk_hits == 1 and reloaded.hits == 1
+    assert again.states == replayed.states
+
+
+def test_trajectory_cache_fingerprints_track_profile_content():
+    cache = TrajectoryCache()
+    for index in range(50):
+        # Each profile is freed after its iteration, so ids get reused.
+        profile = AtmosphericProfile.from_raw_levels([(0.0, 101325.0 + index, 288.15, 0.0, 0.0)])
+        env = DarkflightEnvironment(profile=profile)
+        assert cache.fingerprint(env) == environment_fingerprint(env)
+    assert len(cache._fingerprints) <= 16
+
+    env = DarkflightEnvironment(profile=sounding_profile())
+    before = cache.fingerprint(env)
+    env.profile.levels[0] = AtmosphericLevel(
+        altitude_m=0.0, density_kg_m3=0.5, temperature_k=288.15, wind_u_mps=0.0, wind_v_mps=0.0
+    )
+    assert cache.fingerprint(env) != before
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 import pytest
 
-from meteor_darkflight.physics_core import ExplicitEulerIntegrator, RungeKutta4Integrator, State
+from meteor_darkflight.physics_core import (
+    DormandPrince54Integrator,
+    ExplicitEulerIntegrator,
+    RungeKutta4Integrator,
+    State,
+    derivative_function,
+)
 from meteor_darkflight.physics_core.trajectory import IntegrationEnvironment
 
 
@@ -54,3 +60,80 @@ def test_runge_kutta_matches_analytic_solution():
     assert current.z == pytest.approx(expected_z, rel=1e-5)
     assert current.vz == pytest.approx(expected_vz, rel=1e-5)
     assert current.x == pytest.approx(expected_x, rel=1e-5)
+
+
+def test_dormand_prince_grows_step_on_smooth_problem():
+    integrator = DormandPrince54Integrator(dt_max=4.0)
+    env = ConstantAccelerationEnv()
+    state = State(t=0.0, x=0.0, y=0.0, z=1000.0, vx=10.0, vy=0.0, vz=-20.0, mass=1.0)
+
+    current, dt = state, 0.1
+    for _ in range(6):
+        current, taken, dt = integrator.adaptive_step(current, dt, env)
+        assert taken > 0
+
+    assert dt == pytest.approx(4.0)
+    expected_z = state.z + state.vz * current.t + 0.5 * env._accel[2] * current.t**2
+    assert current.z == pytest.approx(expected_z, rel=1e-12)
+    assert current.x == pytest.approx(state.x + state.vx * current.t, rel=1e-12)
+
+
+def test_dormand_prince_integrates_backwards_with_negative_step():
+    integrator = DormandPrince54Integrator()
+    env = ConstantAccelerationEnv()
+    state = State(t=5.0, x=50.0, y=0.0, z=0.0, vx=10.0, vy=0.0, vz=-69.05, mass=1.0)
+
+    previous, taken, next_dt = integrator.adaptive_step(state, -1.0, env)
+
+    assert taken == pytest.approx(-1.0)
+    assert next_dt < 0
+    assert previous.t == pytest.approx(4.0)
+    assert previous.vz == pytest.approx(-69.05 + 9.81, rel=1e-12)
+
+
+def test_dormand_prince_rejects_invalid_tolerances():
+    with pytest.raises(ValueError):
+        DormandPrince54Integrator(rtol=0.0)
+    with pytest.raises(ValueError):
+        DormandPrince54Integrator(dt_min=1.0, dt_max=0.5)
+
+
+@pytest.mark.parametrize(
+    "integrator", [ExplicitEulerIntegrator(), RungeKutta4Integrator(), DormandPrince54Integrator()]
+)
+def test_flat_advance_matches_state_step(integrator):
+    env = ConstantAccelerationEnv(ax=0.3, ay=-0.1)
+    state = State(t=1.0, x=5.0, y=-2.0, z=100.0, vx=10.0, vy=1.0, vz=-20.0, mass=1.5)
+
+    values = integrator.advance(state.as_tuple(), 0.25, derivative_function(env))
+
+    assert isinstance(values, tuple)
+    assert State(*values) == integrator.step(state, 0.25, env)
+
+
+def test_derivative_function_prefers_single_call_hook():
+    class FlatEnv(ConstantAccelerationEnv):
+        def derivatives(self, values):
+            return (values[4], values[5], values[6], 0.0, 0.0, -1.0, 0.0)
+
+    state = State(t=0.0, x=0.0, y=0.0, z=10.0, vx=1.0, vy=2.0, vz=3.0, mass=1.0)
+
+    assert derivative_function(FlatEnv())(state.as_tuple()) == (1.0, 2.0, 3.0, 0.0, 0.0, -1.0, 0.0)
+    assert derivative_function(ConstantAccelerationEnv())(state.as_tuple()) == (1.0, 2.0, 3.0, 0.0, 0.0, -9.81, 0.0)
+
+
+def test_dormand_prince_does_not_carry_stages_across_environments():
+    integrator = DormandPrince54Integrator()
+    state = State(t=0.0, x=0.0, y=0.0, z=1000.0, vx=10.0, vy=0.0, vz=-20.0, mass=1.0)
+    candidate, _ = integrator.attempt(state, 1.0, ConstantAccelerationEnv())
+
+    sideways = ConstantAccelerationEnv(ax=3.0)
+    assert integrator.attempt(candidate, 1.0, sideways) == DormandPrince54Integrator().attempt(candidate, 1.0, sideways)
+
+    rates = derivative_function(ConstantAccelerationEnv())
+    first = integrator.adaptive_step_dense(state, 0.5, ConstantAccelerationEnv())
+    chained = integrator.adaptive_step_dense(
+        first[0], first[2], ConstantAccelerationEnv(), start_rate=first[3].end_rate
+    )
+    assert first[3].end_rate == rates(first[0].as_tuple())
+    assert chained[0] == integrator.adaptive_step_dense(first[0], first[2], ConstantAccelerationEnv())[0]
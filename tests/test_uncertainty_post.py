@@ -0,0 +1,88 @@
+"""Tests for landing-uncertainty ellipses and linearised propagation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from meteor_darkflight.physics_core import DormandPrince54Integrator, ExplicitEulerIntegrator, State
+from meteor_darkflight.sim_kernel import (
+    AtmosphericProfile,
+    DarkflightEnvironment,
+    run_trajectory_batch,
+)
+from meteor_darkflight.uncertainty_post import compute_ellipses, propagate_landing_covariance
+
+
+def test_compute_ellipses_recovers_axes_and_orientation():
+    rng = np.random.default_rng(7)
+    angle = np.radians(30.0)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    covariance = rotation @ np.diag([400.0**2, 100.0**2]) @ rotation.T
+    points = rng.multivariate_normal([1000.0, -500.0], covariance, 20000)
+
+    ellipse_50, ellipse_90 = compute_ellipses(points, confidence=[0.5, 0.9])
+
+    assert ellipse_90.center == pytest.approx((1000.0, -500.0), abs=10.0)
+    assert ellipse_90.major_axis_m == pytest.approx(400.0 * np.sqrt(-2.0 * np.log(0.1)), rel=0.02)
+    assert ellipse_90.minor_axis_m == pytest.approx(100.0 * np.sqrt(-2.0 * np.log(0.1)), rel=0.02)
+    assert ellipse_50.major_axis_m < ellipse_90.major_axis_m
+    # Major axis lies 30 degrees north of east, i.e. a bearing of 60 degrees.
+    assert ellipse_90.orientation_deg == pytest.approx(60.0, abs=1.0)
+    inside = np.sum(
+        np.einsum("ij,jk,ik->i", points - ellipse_90.center, np.linalg.inv(ellipse_90.covariance), points - ellipse_90.center)
+        <= ellipse_90.scale**2
+    )
+    assert inside / len(points) == pytest.approx(0.9, abs=0.01)
+    ring = ellipse_90.polygon(32)
+    assert ring.shape == (33, 2)
+    assert ring[0] == pytest.approx(ring[-1])
+
+
+def test_linearized_landing_covariance_matches_monte_carlo():
+    profile = AtmosphericProfile.from_raw_levels(
+        [
+            (0.0, 101325.0, 288.15, 2.0, -1.0),
+            (3000.0, 70100.0, 268.65, 8.0, 3.0),
+            (8000.0, 35600.0, 236.15, 15.0, 6.0),
+            (15000.0, 12100.0, 216.65, 25.0, -4.0),
+        ]
+    )
+    env = DarkflightEnvironment(profile=profile, drag_model="sphere", fragment_density_kg_m3=3300.0)
+    state = State(t=0.0, x=0.0, y=0.0, z=12000.0, vx=900.0, vy=200.0, vz=-1500.0, mass=5.0)
+    parameters = ["mass_kg", "drag_scale", "vx_mps", "vy_mps"]
+    covariance = np.diag([0.5, 0.05, 30.0, 30.0]) ** 2
+
+    sensitivity, ellipse = propagate_landing_covariance(state, env, parameters, covariance, dt=0.2)
+
+    assert sensitivity.runs == 2 * len(parameters) + 1
+    draws = np.random.default_rng(1).multivariate_normal(np.zeros(4), covariance, 400)
+    batch = run_trajectory_batch(
+        [state.with_updates(mass=5.0 + dm, vx=900.0 + dvx, vy=200.0 + dvy) for dm, _, dvx, dvy in draws],
+        ExplicitEulerIntegrator(),
+        env,
+        dt=0.2,
+        shape_factor=1.0 + draws[:, 1],
+    )
+    sampled = np.cov(batch.final_states[:, 1:3], rowvar=False)
+    np.testing.assert_allclose(ellipse.covariance, sampled, rtol=0.15, atol=0.05 * np.max(sampled))
+    assert ellipse.center == pytest.approx(tuple(batch.final_states[:, 1:3].mean(axis=0)), abs=20.0)
+
+
+def test_linearized_propagation_holds_zero_variance_inputs_fixed():
+    profile = AtmosphericProfile.from_raw_levels(
+        [(0.0, 101325.0, 288.15, 5.0, 0.0), (10000.0, 26500.0, 223.15, 20.0, 5.0)]
+    )
+    env = DarkflightEnvironment(profile=profile)
+    state = State(t=0.0, x=0.0, y=0.0, z=5000.0, vx=300.0, vy=0.0, vz=-200.0, mass=2.0)
+
+    covariance = np.diag([25.0, 0.0])
+    sensitivity, ellipse = propagate_landing_covariance(state, env, ["vx_mps", "mass_kg"], covariance, dt=0.2)
+    reduced, _ = propagate_landing_covariance(state, env, ["vx_mps"], [[25.0]], dt=0.2)
+
+    assert sensitivity.runs == 3
+    np.testing.assert_array_equal(sensitivity.jacobian[:, 1], 0.0)
+    np.testing.assert_allclose(sensitivity.jacobian[:, :1], reduced.jacobian)
+    np.testing.assert_allclose(ellipse.covariance, reduced.propagate([[25.0]]))
+    with pytest.raises(ValueError, match="DormandPrince54Integrator"):
+        propagate_landing_covariance(state, env, ["vx_mps"], [[25.0]], integrator=DormandPrince54Integrator())